@@ -0,0 +1,57 @@
+"""
+Request cancellation for Perseus Backend
+Stops abandoned work when the HTTP client disconnects
+"""
+
+import asyncio
+from typing import Awaitable, TypeVar
+from fastapi import Request
+from app.core.config import settings
+from app.core.exceptions import ClientDisconnectedException
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def run_until_disconnected(request: Request, work: Awaitable[T]) -> T:
+    """
+    Await request work, cancelling it if the client goes away first
+
+    The client connection is polled every DISCONNECT_POLL_INTERVAL_MS. On
+    disconnect the work task is cancelled; the cancellation propagates
+    through the orchestrator and processing pipeline, which drop queued
+    inference and stop pending LLM calls.
+
+    Args:
+        request: Incoming HTTP request
+        work: Coroutine doing the request's work
+
+    Returns:
+        Result of work
+
+    Raises:
+        ClientDisconnectedException: If the client disconnected before completion
+    """
+    task = asyncio.ensure_future(work)
+    interval = settings.DISCONNECT_POLL_INTERVAL_MS / 1000
+
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                return task.result()
+
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected from {request.url.path} - cancelling its work")
+                task.cancel()
+                # Let the pipeline unwind (and finish shielded cache writes)
+                await asyncio.gather(task, return_exceptions=True)
+                raise ClientDisconnectedException(
+                    "Client disconnected before the request completed",
+                    details={"path": request.url.path}
+                )
+    finally:
+        if not task.done():
+            task.cancel()
@@ -37,6 +37,118 @@ class Settings(BaseSettings):
         "MULTICLASS_MODEL_NAME",
         "SamuelSoto7/Perseus_Multiclase"
     )
+    # Hub branch, tag or commit to load (empty = default branch)
+    BINARY_MODEL_REVISION: Optional[str] = os.getenv("BINARY_MODEL_REVISION") or None
+    MULTICLASS_MODEL_REVISION: Optional[str] = os.getenv("MULTICLASS_MODEL_REVISION") or None
+    # Comma-separated models (Hub names or local paths) the admin API may swap
+    # to, besides the two configured above
+    MODEL_SWAP_ALLOWED_MODELS: str = os.getenv("MODEL_SWAP_ALLOWED_MODELS", "")
+
+    # Model Snapshot Configuration
+    # Local copies of both models (python -m app.services.model_snapshot);
+    # when present they are loaded offline instead of resolving the Hub names
+    MODEL_SNAPSHOT_ENABLED: bool = os.getenv("MODEL_SNAPSHOT_ENABLED", "True").lower() == "true"
+    MODEL_SNAPSHOT_DIR: str = os.getenv("MODEL_SNAPSHOT_DIR", "model_cache/snapshots")
+
+    # Inference Engine Configuration
+    # "torch" (transformers pipeline) or "onnx" (onnxruntime on CPU)
+    INFERENCE_ENGINE: str = os.getenv("INFERENCE_ENGINE", "torch")
+    ONNX_CACHE_DIR: str = os.getenv("ONNX_CACHE_DIR", "model_cache/onnx")
+    ONNX_INTRA_OP_THREADS: int = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))  # 0 = onnxruntime default
+
+    # Model Precision (torch engine)
+    # "fp32", "int8" (dynamic quantization of the Linear layers, CPU only) or
+    # "bf16" (autocast; only where the CPU has AVX512-BF16/AMX, otherwise fp32)
+    MODEL_PRECISION: str = os.getenv("MODEL_PRECISION", "fp32")
+    # Attention implementation: "eager" or "sdpa" (falls back to eager when
+    # the model architecture has no SDPA support in the installed transformers)
+    ATTENTION_IMPL: str = os.getenv("ATTENTION_IMPL", "eager")
+
+    # Batch Inference Configuration
+    # Inputs are sorted by token length and grouped so that
+    # (batch size x longest sequence) stays under the token budget
+    INFERENCE_TOKEN_BUDGET: int = int(os.getenv("INFERENCE_TOKEN_BUDGET", "8192"))
+    INFERENCE_MAX_BATCH_SIZE: int = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "64"))
+
+    # Shared tokenization cache (encodings reused across models and requests)
+    TOKENIZATION_CACHE_SIZE: int = int(os.getenv("TOKENIZATION_CACHE_SIZE", "20000"))
+
+    # Inference Executor Configuration
+    # lanes x threads per lane should match the CPU count (0 = CPUs / lanes)
+    INFERENCE_LANES: int = int(os.getenv("INFERENCE_LANES", "2"))
+    INFERENCE_THREADS_PER_LANE: int = int(os.getenv("INFERENCE_THREADS_PER_LANE", "0"))
+    TORCH_INTEROP_THREADS: int = int(os.getenv("TORCH_INTEROP_THREADS", "1"))
+
+    # Autotune Configuration
+    # Profile of max batch size / threads per lane tuned for this node
+    # (python -m app.services.autotune_service); reused while the node and
+    # models match, or tuned at startup when AUTOTUNE_ON_STARTUP is set
+    AUTOTUNE_ON_STARTUP: bool = os.getenv("AUTOTUNE_ON_STARTUP", "False").lower() == "true"
+    AUTOTUNE_PROFILE_PATH: str = os.getenv("AUTOTUNE_PROFILE_PATH", "model_cache/autotune_profile.json")
+    AUTOTUNE_LATENCY_CEILING_MS: float = float(os.getenv("AUTOTUNE_LATENCY_CEILING_MS", "500"))
+    AUTOTUNE_WORKLOAD_SIZE: int = int(os.getenv("AUTOTUNE_WORKLOAD_SIZE", "256"))
+
+    # Model Server Configuration
+    # When enabled, API workers send predictions to a single local model
+    # server process (python -m app.services.model_server) over a Unix socket.
+    # The socket must live in a directory only this user can write to, and
+    # MODEL_SERVER_AUTHKEY is required (no default: both sides refuse to start)
+    MODEL_SERVER_ENABLED: bool = os.getenv("MODEL_SERVER_ENABLED", "False").lower() == "true"
+    MODEL_SERVER_SOCKET: str = os.getenv("MODEL_SERVER_SOCKET", "model_cache/run/model_server.sock")
+    MODEL_SERVER_AUTHKEY: str = os.getenv("MODEL_SERVER_AUTHKEY", "")
+
+    # Streaming Configuration
+    # process_batch pipelines binary → multiclass → description over chunks of
+    # comments; each stage works on a different chunk at the same time
+    STREAM_CHUNK_SIZE: int = int(os.getenv("STREAM_CHUNK_SIZE", "64"))
+    # Max chunks waiting between two stages (bounds memory and in-flight LLM calls)
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+    # Classify/describe comments repeated up to casing, whitespace and
+    # trailing punctuation only once per batch
+    ENABLE_DEDUPLICATION: bool = os.getenv("ENABLE_DEDUPLICATION", "True").lower() == "true"
+    # Near-duplicate requirements (MinHash/LSH over character 3-grams, same
+    # subcharacteristic) share one LLM description. Opt-in: a grouped comment
+    # gets another comment's description. The default threshold only groups
+    # near-identical variants; lowering it saves more LLM calls on looser
+    # paraphrases at that cost. NEAR_DUPLICATE_BANDS must divide NUM_PERM
+    NEAR_DUPLICATE_ENABLED: bool = os.getenv("NEAR_DUPLICATE_ENABLED", "False").lower() == "true"
+    NEAR_DUPLICATE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.85"))
+    NEAR_DUPLICATE_NUM_PERM: int = int(os.getenv("NEAR_DUPLICATE_NUM_PERM", "96"))
+    NEAR_DUPLICATE_BANDS: int = int(os.getenv("NEAR_DUPLICATE_BANDS", "32"))
+
+    # Request Cancellation
+    # How often processing endpoints check whether the client is still connected
+    DISCONNECT_POLL_INTERVAL_MS: int = int(os.getenv("DISCONNECT_POLL_INTERVAL_MS", "250"))
+
+    # Admission Control
+    # Concurrent requests per endpoint kind (process and analyze share limits);
+    # excess requests wait in a bounded queue, beyond it they get 503 + Retry-After
+    ADMISSION_CONTROL_ENABLED: bool = os.getenv("ADMISSION_CONTROL_ENABLED", "True").lower() == "true"
+    ADMISSION_SINGLE_CONCURRENCY: int = int(os.getenv("ADMISSION_SINGLE_CONCURRENCY", "16"))
+    ADMISSION_SINGLE_QUEUE: int = int(os.getenv("ADMISSION_SINGLE_QUEUE", "32"))
+    ADMISSION_CSV_CONCURRENCY: int = int(os.getenv("ADMISSION_CSV_CONCURRENCY", "2"))
+    ADMISSION_CSV_QUEUE: int = int(os.getenv("ADMISSION_CSV_QUEUE", "4"))
+    ADMISSION_PLAYSTORE_CONCURRENCY: int = int(os.getenv("ADMISSION_PLAYSTORE_CONCURRENCY", "2"))
+    ADMISSION_PLAYSTORE_QUEUE: int = int(os.getenv("ADMISSION_PLAYSTORE_QUEUE", "4"))
+    # Longest a request may wait for a slot before it is shed
+    ADMISSION_QUEUE_TIMEOUT_MS: int = int(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "15000"))
+
+    # Micro-batching Configuration
+    # Concurrent small requests are coalesced into one batched forward pass
+    ENABLE_MICRO_BATCHING: bool = os.getenv("ENABLE_MICRO_BATCHING", "True").lower() == "true"
+    MICRO_BATCH_MAX_SIZE: int = int(os.getenv("MICRO_BATCH_MAX_SIZE", "32"))
+    MICRO_BATCH_WAIT_MS: int = int(os.getenv("MICRO_BATCH_WAIT_MS", "10"))
+
+    # Pre-filter Configuration
+    # Hashed n-gram linear model that rejects obvious non-requirements before BERT
+    # (fit with: python -m app.services.prefilter_service --csv <comentarios.csv>)
+    PREFILTER_ENABLED: bool = os.getenv("PREFILTER_ENABLED", "False").lower() == "true"
+    PREFILTER_MODEL_PATH: str = os.getenv("PREFILTER_MODEL_PATH", "model_cache/prefilter.npz")
+    # Overrides the threshold chosen at fit time (empty = use the fitted one)
+    PREFILTER_REJECT_THRESHOLD: Optional[float] = (
+        float(os.getenv("PREFILTER_REJECT_THRESHOLD"))
+        if os.getenv("PREFILTER_REJECT_THRESHOLD") else None
+    )
 
     # HuggingFace Configuration
     HUGGINGFACE_TOKEN: Optional[str] = os.getenv("HUGGINGFACE_TOKEN", None)
@@ -46,10 +158,50 @@ class Settings(BaseSettings):
 
     # OpenAI Configuration
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY", None)
+    # OpenAI-compatible endpoint override (e.g. benchmarks/fake_llm_server.py)
+    OPENAI_BASE_URL: Optional[str] = os.getenv("OPENAI_BASE_URL") or None
+    OPENAI_REQUESTS_PER_MINUTE: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    OPENAI_TOKENS_PER_MINUTE: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
 
     # Groq Configuration
     GROQ_API_KEY: Optional[str] = os.getenv("GROQ_API_KEY", None)
     GROQ_MODEL_NAME: str = os.getenv("GROQ_MODEL_NAME", "llama-3.1-8b-instant")
+    GROQ_BASE_URL: str = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+    GROQ_REQUESTS_PER_MINUTE: int = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+    GROQ_TOKENS_PER_MINUTE: int = int(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000"))
+
+    # LLM Dispatcher Configuration
+    # Description calls of all requests share one dispatcher per provider
+    # (quotas above, <= 0 = unlimited); 429s pause it for the Retry-After
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    # Requirements described per LLM prompt in batch processing (1 = one call each)
+    LLM_BATCH_SIZE: int = int(os.getenv("LLM_BATCH_SIZE", "8"))
+    # Single-flight: concurrent misses of the same description share one LLM call;
+    # with the Redis lock also across uvicorn workers and nodes (needs Redis)
+    LLM_SINGLE_FLIGHT_ENABLED: bool = os.getenv("LLM_SINGLE_FLIGHT_ENABLED", "True").lower() == "true"
+    LLM_SINGLE_FLIGHT_REDIS_LOCK: bool = os.getenv("LLM_SINGLE_FLIGHT_REDIS_LOCK", "False").lower() == "true"
+    LLM_SINGLE_FLIGHT_LOCK_TTL_MS: int = int(os.getenv("LLM_SINGLE_FLIGHT_LOCK_TTL_MS", "30000"))
+    LLM_SINGLE_FLIGHT_POLL_MS: int = int(os.getenv("LLM_SINGLE_FLIGHT_POLL_MS", "200"))
+    # Timeout of one provider call (the client default is 10 minutes)
+    LLM_REQUEST_TIMEOUT_S: float = float(os.getenv("LLM_REQUEST_TIMEOUT_S", "20"))
+
+    # LLM Circuit Breaker Configuration
+    # Per provider: opens when, over the last LLM_BREAKER_WINDOW calls (at least
+    # LLM_BREAKER_MIN_CALLS), the failure rate or the p95 latency crosses its
+    # threshold; while open, calls go to the alternate provider or the template.
+    # After LLM_BREAKER_OPEN_S, LLM_BREAKER_PROBES successful probe calls close it
+    LLM_BREAKER_ENABLED: bool = os.getenv("LLM_BREAKER_ENABLED", "True").lower() == "true"
+    LLM_BREAKER_WINDOW: int = int(os.getenv("LLM_BREAKER_WINDOW", "20"))
+    LLM_BREAKER_MIN_CALLS: int = int(os.getenv("LLM_BREAKER_MIN_CALLS", "5"))
+    LLM_BREAKER_FAILURE_RATE: float = float(os.getenv("LLM_BREAKER_FAILURE_RATE", "0.5"))
+    LLM_BREAKER_SLOW_CALL_MS: float = float(os.getenv("LLM_BREAKER_SLOW_CALL_MS", "10000"))
+    LLM_BREAKER_OPEN_S: float = float(os.getenv("LLM_BREAKER_OPEN_S", "30"))
+    LLM_BREAKER_PROBES: int = int(os.getenv("LLM_BREAKER_PROBES", "2"))
+
+    # Admin API Configuration
+    # Bearer token required by every /api/admin endpoint (empty = admin API disabled)
+    ADMIN_API_TOKEN: str = os.getenv("ADMIN_API_TOKEN", "")
 
     # Server Configuration
     HOST: str = os.getenv("HOST", "0.0.0.0")
@@ -68,6 +68,9 @@ PIPELINE_TASK = "text-classification"
 # Threshold para considerar una predicción como válida
 CONFIDENCE_THRESHOLD = 0.5
 
+# Longitud máxima de secuencia (tokens) de los modelos BERT
+MAX_SEQUENCE_LENGTH = 512
+
 # ========== Timeouts ==========
 # Timeout para carga de modelos (segundos)
 MODEL_LOAD_TIMEOUT = 300  # 5 minutos
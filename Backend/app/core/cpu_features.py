@@ -0,0 +1,49 @@
+"""
+CPU feature detection for Perseus Backend
+Decides which fast inference paths the current node supports
+"""
+
+from functools import lru_cache
+from typing import Dict, Set
+
+# /proc/cpuinfo flags relevant to transformer inference
+_TRACKED_FLAGS = ("avx2", "avx512f", "avx512_vnni", "avx512_bf16", "amx_bf16", "amx_tile")
+
+
+def _cpuinfo_flags() -> Set[str]:
+    """CPU flags from /proc/cpuinfo (empty outside Linux)"""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+@lru_cache()
+def detect_cpu_features() -> Dict[str, bool]:
+    """
+    Detect instruction sets and whether bf16 inference is worthwhile
+
+    bf16 is considered supported only with native bf16 instructions
+    (AVX512-BF16 or AMX); without them oneDNN emulates bf16 and it is
+    slower than fp32.
+
+    Returns:
+        Dictionary with one entry per tracked flag plus "bf16"
+    """
+    import torch
+
+    flags = _cpuinfo_flags()
+    features = {flag: flag in flags for flag in _TRACKED_FLAGS}
+
+    native_bf16 = features["avx512_bf16"] or features["amx_bf16"]
+    try:
+        onednn_bf16 = torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except (AttributeError, RuntimeError):
+        onednn_bf16 = False
+
+    features["bf16"] = bool(native_bf16 and onednn_bf16)
+    return features
@@ -46,6 +46,19 @@ class PDFGenerationException(PerseusException):
     pass
 
 
+class ClientDisconnectedException(PerseusException):
+    """Exception raised when the client disconnects before its request completes"""
+    pass
+
+
+class OverloadedException(PerseusException):
+    """Exception raised when a request is shed by admission control"""
+
+    def __init__(self, message: str, details: Optional[Any] = None, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message, details)
+
+
 # HTTP Exceptions for FastAPI
 class BadRequestException(HTTPException):
     """400 Bad Request"""
@@ -54,6 +67,24 @@ class BadRequestException(HTTPException):
         super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
 
 
+class UnauthorizedException(HTTPException):
+    """401 Unauthorized"""
+
+    def __init__(self, detail: str = "Not authenticated"):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+class ForbiddenException(HTTPException):
+    """403 Forbidden"""
+
+    def __init__(self, detail: str = "Forbidden"):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
 class NotFoundException(HTTPException):
     """404 Not Found"""
 
@@ -84,8 +115,9 @@ class InternalServerException(HTTPException):
 class ServiceUnavailableException(HTTPException):
     """503 Service Unavailable"""
 
-    def __init__(self, detail: str = "Service temporarily unavailable"):
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: Optional[int] = None):
         super().__init__(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=detail
+            detail=detail,
+            headers={"Retry-After": str(retry_after)} if retry_after is not None else None
         )
@@ -0,0 +1,30 @@
+"""
+Label helpers for Perseus Backend
+Interpretation of classifier labels shared by serving and offline tools
+"""
+
+from app.core.constants import BINARY_VALID_LABELS, BINARY_INVALID_LABELS
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_valid_requirement(label: str) -> bool:
+    """
+    Determine if a binary prediction label indicates a valid requirement
+
+    Args:
+        label: Prediction label from binary model
+
+    Returns:
+        True if it's a valid requirement, False otherwise
+    """
+    # Check if label indicates valid requirement
+    if label in BINARY_VALID_LABELS:
+        return True
+    elif label in BINARY_INVALID_LABELS:
+        return False
+    else:
+        # Unknown label - log warning and default to False
+        logger.warning(f"Unknown binary label: {label}. Defaulting to not a requirement.")
+        return False
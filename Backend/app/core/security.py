@@ -0,0 +1,33 @@
+"""
+Security helpers for Perseus Backend
+Authentication of the operational (admin) endpoints
+"""
+
+import secrets
+from typing import Optional
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from app.core.config import settings
+from app.core.exceptions import ForbiddenException, UnauthorizedException
+
+_bearer = HTTPBearer(auto_error=False, description="ADMIN_API_TOKEN")
+
+
+async def require_admin_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)
+) -> None:
+    """
+    FastAPI dependency: require "Authorization: Bearer <ADMIN_API_TOKEN>"
+
+    Raises:
+        ForbiddenException: If no admin token is configured (admin API disabled)
+        UnauthorizedException: If the token is missing or wrong
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise ForbiddenException("Admin API is disabled (ADMIN_API_TOKEN is not set)")
+
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(),
+        settings.ADMIN_API_TOKEN.encode()
+    ):
+        raise UnauthorizedException("Invalid or missing admin token")
@@ -0,0 +1,47 @@
+"""
+Text utilities for Perseus Backend
+Normalization helpers shared by caching and deduplication
+"""
+
+import re
+import unicodedata
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Conservative normalization that never changes model input semantics
+
+    Applies Unicode NFC composition, collapses runs of whitespace and strips
+    the ends, so that the same comment copied with different spacing or
+    composed/decomposed accents maps to the same key.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def normalize_for_dedup(text: str) -> str:
+    """
+    Aggressive normalization used to detect trivially repeated comments
+
+    On top of normalize_whitespace, case-folds the text and drops trailing
+    punctuation ("La app se cierra!!" and "la app se cierra" share a key).
+    Keys are only used for grouping; models always see an original text.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Deduplication key
+    """
+    key = normalize_whitespace(text).casefold()
+    end = len(key)
+    while end and (unicodedata.category(key[end - 1]).startswith("P") or key[end - 1].isspace()):
+        end -= 1
+    return key[:end] or key
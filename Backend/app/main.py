@@ -12,8 +12,9 @@ import uvicorn
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.core.exceptions import PerseusException
-from app.routers import requirements
+from app.routers import requirements, admin
 from app.services.huggingface_service import huggingface_service
+from app.services.autotune_service import autotune_service
 
 logger = get_logger(__name__)
 
@@ -32,14 +33,18 @@ async def lifespan(app: FastAPI):
     # Preload models
     try:
         logger.info("Preloading HuggingFace models...")
-        _ = huggingface_service.binary_pipeline
-        logger.info("✓ Binary model loaded")
-        _ = huggingface_service.multiclass_pipeline
-        logger.info("✓ Multiclass model loaded")
+        huggingface_service.preload()
         logger.info("All models loaded successfully")
     except Exception as e:
         logger.error(f"Failed to preload models: {str(e)}")
         logger.warning("Models will be loaded on first request")
+    else:
+        # Tuned batch size / threads (the model server applies its own)
+        if not settings.MODEL_SERVER_ENABLED:
+            try:
+                autotune_service.apply_startup_profile()
+            except Exception as e:
+                logger.warning(f"Inference autotune skipped: {str(e)}")
 
     logger.info(f"API listening on {settings.HOST}:{settings.PORT}")
     logger.info("=" * 60)
@@ -112,6 +117,14 @@ app.include_router(
 )
 
 
+# Include admin router (metrics and operations)
+app.include_router(
+    admin.router,
+    prefix="/api/admin",
+    tags=["Admin"]
+)
+
+
 # ========== Root Endpoint ==========
 
 @app.get("/", tags=["Root"])
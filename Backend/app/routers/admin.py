@@ -0,0 +1,151 @@
+"""
+Admin Router
+Operational endpoints: runtime metrics and model hot swap
+
+Every endpoint requires the ADMIN_API_TOKEN bearer token.
+"""
+
+import asyncio
+import os
+from typing import Literal, Optional, Set, Tuple
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.schemas.models import ModelSwapRequest
+from app.core.config import settings
+from app.core.cpu_features import detect_cpu_features
+from app.core.exceptions import BadRequestException, ServiceUnavailableException
+from app.core.security import require_admin_token
+from app.services.admission_service import admission_service
+from app.services.batching_service import batching_service
+from app.services.description_service import description_service
+from app.services.huggingface_service import huggingface_service
+from app.services.inference_executor import inference_executor
+from app.services.llm_dispatcher import get_dispatcher_stats
+from app.services.model_registry import hub_commit
+from app.services.prefilter_service import prefilter_service
+from app.services.tokenization_service import tokenization_service
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+def _allowed_models() -> Set[str]:
+    """Models a swap may load: the configured ones plus MODEL_SWAP_ALLOWED_MODELS"""
+    extra = {name.strip() for name in settings.MODEL_SWAP_ALLOWED_MODELS.split(",")}
+    return {settings.BINARY_MODEL_NAME, settings.MULTICLASS_MODEL_NAME} | (extra - {""})
+
+
+def _resolve_swap_target(
+    model_type: str,
+    model_name: Optional[str],
+    revision: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """
+    Check a swap request against the allowlist and pin it to a Hub commit
+
+    Returns:
+        Tuple of (model name, commit hash or None for local models)
+
+    Raises:
+        BadRequestException: If the model is not allowed or the revision does not exist
+        ServiceUnavailableException: If the Hub cannot be reached to verify it
+    """
+    from huggingface_hub.utils import RepositoryNotFoundError, RevisionNotFoundError
+
+    target = model_name or huggingface_service.get_registry_status()[model_type]["model_name"]
+    if target not in _allowed_models():
+        raise BadRequestException(f"Model '{target}' is not allowed (see MODEL_SWAP_ALLOWED_MODELS)")
+
+    if os.path.isdir(target):
+        if revision:
+            raise BadRequestException("Local models have no revisions")
+        return target, None
+
+    try:
+        return target, hub_commit(target, revision)
+    except RevisionNotFoundError:
+        raise BadRequestException(f"Revision '{revision}' not found for model '{target}'")
+    except RepositoryNotFoundError:
+        raise BadRequestException(f"Model '{target}' not found on the HuggingFace Hub")
+    except OSError as e:
+        raise ServiceUnavailableException(
+            f"Could not verify '{target}' @ {revision or 'default'} on the HuggingFace Hub: {e}",
+            retry_after=30
+        )
+
+
+@router.get(
+    "/metrics",
+    summary="Runtime metrics of the inference pipeline"
+)
+async def get_metrics():
+    """
+    Get admission, queue depth, wait times and batching/caching statistics
+    """
+    return {
+        "admission": admission_service.get_stats(),
+        "inference_executor": inference_executor.get_stats(),
+        "llm_descriptions": description_service.get_stats(),
+        "llm_dispatchers": get_dispatcher_stats(),
+        "micro_batching": batching_service.get_stats(),
+        "prefilter": prefilter_service.get_stats(),
+        "tokenization_cache": tokenization_service.get_stats(),
+        "model_startup": huggingface_service.get_startup_report()
+    }
+
+
+@router.get(
+    "/diagnostics",
+    summary="Inference profile and CPU capabilities of this node"
+)
+async def get_diagnostics():
+    """
+    Get the active inference parameters (tuned profile or defaults) and
+    the CPU features detected on this node
+    """
+    return {
+        "inference_profile": huggingface_service.get_autotune_status(),
+        "cpu_features": detect_cpu_features(),
+        "models": huggingface_service.get_model_info()
+    }
+
+
+@router.get(
+    "/models",
+    summary="Served models and hot-swap progress"
+)
+async def get_models():
+    """
+    Get the model and revision served for each classifier and the state
+    of the last swap (idle, loading, warming_up, completed or failed)
+    """
+    return huggingface_service.get_registry_status()
+
+
+@router.post(
+    "/models/{model_type}/swap",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Hot-swap a classifier to another model or revision"
+)
+async def swap_model(model_type: Literal["binary", "multiclass"], request: ModelSwapRequest):
+    """
+    Load the new model in the background, warm it up and swap it in
+
+    The current model keeps serving until the new one is ready; requests
+    already running finish on the old model. Only allowlisted models can be
+    loaded, and Hub revisions are resolved to a commit before loading. Poll
+    GET /models for progress.
+    """
+    logger.info(
+        f"Swap requested for {model_type} model: "
+        f"{request.model_name or 'current'} @ {request.revision or 'default'}"
+    )
+    # Hub lookup and model server IPC are blocking
+    model_name, commit = await asyncio.get_running_loop().run_in_executor(
+        None, _resolve_swap_target, model_type, request.model_name, request.revision
+    )
+    try:
+        return huggingface_service.swap_model(model_type, model_name, commit)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
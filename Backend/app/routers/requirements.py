@@ -3,8 +3,8 @@ Requirements Router
 Defines API endpoints for requirement extraction and processing
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, status
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi import APIRouter, File, UploadFile, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse, JSONResponse
 from app.schemas.models import (
     SingleCommentRequest,
     PlayStoreURLRequest,
@@ -12,9 +12,14 @@ from app.schemas.models import (
     HealthResponse
 )
 from app.services.orchestrator import orchestrator_service
+from app.services.admission_service import admission_service
 from app.services.huggingface_service import huggingface_service
 from app.core.logger import get_logger
+from app.core.cancellation import run_until_disconnected
 from app.core.exceptions import (
+    ClientDisconnectedException,
+    OverloadedException,
+    ServiceUnavailableException,
     PerseusException,
     ValidationException,
     FileProcessingException,
@@ -25,6 +30,9 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Non-standard status (nginx convention) logged for requests abandoned by the client
+CLIENT_CLOSED_REQUEST = 499
+
 
 # ========== Health Check ==========
 
@@ -60,7 +68,7 @@ async def health_check():
     summary="Process single comment and return PDF",
     response_class=StreamingResponse
 )
-async def process_single_comment(request: SingleCommentRequest):
+async def process_single_comment(request: SingleCommentRequest, http_request: Request):
     """
     Process a single comment and return PDF report
 
@@ -74,8 +82,13 @@ async def process_single_comment(request: SingleCommentRequest):
         logger.info(f"Processing single comment: {request.comment[:100]}...")
 
         # Process and get PDF
-        response, pdf_buffer = await orchestrator_service.process_single_comment(
-            request.comment
+        response, pdf_buffer = await run_until_disconnected(
+            http_request,
+            admission_service.run(
+                "single",
+                orchestrator_service.process_single_comment,
+                request.comment
+            )
         )
 
         # Return PDF as streaming response
@@ -87,6 +100,10 @@ async def process_single_comment(request: SingleCommentRequest):
             }
         )
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except PerseusException as e:
         logger.error(f"Processing error: {e.message}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
@@ -101,7 +118,7 @@ async def process_single_comment(request: SingleCommentRequest):
     summary="Process CSV file and return PDF",
     response_class=StreamingResponse
 )
-async def process_csv_file(file: UploadFile = File(...)):
+async def process_csv_file(http_request: Request, file: UploadFile = File(...)):
     """
     Process CSV file with multiple comments and return PDF report
 
@@ -119,7 +136,10 @@ async def process_csv_file(file: UploadFile = File(...)):
             raise ValidationException("File must be a CSV file")
 
         # Process and get PDF
-        response, pdf_buffer = await orchestrator_service.process_csv_file(file)
+        response, pdf_buffer = await run_until_disconnected(
+            http_request,
+            admission_service.run("csv", orchestrator_service.process_csv_file, file)
+        )
 
         # Return PDF as streaming response
         return StreamingResponse(
@@ -130,6 +150,10 @@ async def process_csv_file(file: UploadFile = File(...)):
             }
         )
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except FileProcessingException as e:
         logger.error(f"File processing error: {e.message}")
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message)
@@ -147,7 +171,7 @@ async def process_csv_file(file: UploadFile = File(...)):
     summary="Process Play Store URL with smart scraping and return PDF",
     response_class=StreamingResponse
 )
-async def process_playstore_url(request: PlayStoreURLRequest):
+async def process_playstore_url(request: PlayStoreURLRequest, http_request: Request):
     """
     Process Google Play Store URL with intelligent filtering and return PDF report
 
@@ -167,10 +191,15 @@ async def process_playstore_url(request: PlayStoreURLRequest):
         logger.info(f"Processing Play Store URL with smart scraping: {request.url}")
 
         # Process with smart scraping (30 requirements, max 500 reviews)
-        response, pdf_buffer = await orchestrator_service.process_playstore_url(
-            request.url,
-            target_requirements=30,
-            max_total_reviews=500
+        response, pdf_buffer = await run_until_disconnected(
+            http_request,
+            admission_service.run(
+                "playstore",
+                orchestrator_service.process_playstore_url,
+                request.url,
+                target_requirements=30,
+                max_total_reviews=500
+            )
         )
 
         # Return PDF as streaming response
@@ -182,6 +211,10 @@ async def process_playstore_url(request: PlayStoreURLRequest):
             }
         )
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except ScrapingException as e:
         logger.error(f"Scraping error: {e.message}")
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message)
@@ -201,7 +234,7 @@ async def process_playstore_url(request: PlayStoreURLRequest):
     tags=["Requirements Extraction"],
     summary="Analyze single comment and return JSON"
 )
-async def analyze_single_comment(request: SingleCommentRequest):
+async def analyze_single_comment(request: SingleCommentRequest, http_request: Request):
     """
     Analyze a single comment and return JSON results (no PDF)
 
@@ -215,10 +248,21 @@ async def analyze_single_comment(request: SingleCommentRequest):
         logger.info(f"Analyzing single comment: {request.comment[:100]}...")
 
         # Process and get response
-        response, _ = await orchestrator_service.process_single_comment(request.comment)
+        response, _ = await run_until_disconnected(
+            http_request,
+            admission_service.run(
+                "single",
+                orchestrator_service.process_single_comment,
+                request.comment
+            )
+        )
 
-        return response
+        return response.to_response()
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except PerseusException as e:
         logger.error(f"Processing error: {e.message}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
@@ -233,7 +277,7 @@ async def analyze_single_comment(request: SingleCommentRequest):
     tags=["Requirements Extraction"],
     summary="Analyze CSV file and return JSON"
 )
-async def analyze_csv_file(file: UploadFile = File(...)):
+async def analyze_csv_file(http_request: Request, file: UploadFile = File(...)):
     """
     Analyze CSV file and return JSON results (no PDF)
 
@@ -251,10 +295,17 @@ async def analyze_csv_file(file: UploadFile = File(...)):
             raise ValidationException("File must be a CSV file")
 
         # Process and get response
-        response, _ = await orchestrator_service.process_csv_file(file)
+        response, _ = await run_until_disconnected(
+            http_request,
+            admission_service.run("csv", orchestrator_service.process_csv_file, file)
+        )
 
-        return response
+        return response.to_response()
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except FileProcessingException as e:
         logger.error(f"File processing error: {e.message}")
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message)
@@ -272,7 +323,7 @@ async def analyze_csv_file(file: UploadFile = File(...)):
     tags=["Requirements Extraction"],
     summary="Analyze Play Store URL with smart scraping and return JSON"
 )
-async def analyze_playstore_url(request: PlayStoreURLRequest):
+async def analyze_playstore_url(request: PlayStoreURLRequest, http_request: Request):
     """
     Analyze Google Play Store URL with intelligent filtering and return JSON results
 
@@ -298,14 +349,23 @@ async def analyze_playstore_url(request: PlayStoreURLRequest):
         logger.info(f"Analyzing Play Store URL with smart scraping: {request.url}")
 
         # Process with smart scraping
-        response, _ = await orchestrator_service.process_playstore_url(
-            request.url,
-            target_requirements=30,
-            max_total_reviews=500
+        response, _ = await run_until_disconnected(
+            http_request,
+            admission_service.run(
+                "playstore",
+                orchestrator_service.process_playstore_url,
+                request.url,
+                target_requirements=30,
+                max_total_reviews=500
+            )
         )
 
-        return response
+        return response.to_response()
 
+    except ClientDisconnectedException:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except OverloadedException as e:
+        raise ServiceUnavailableException(e.message, retry_after=e.retry_after)
     except ScrapingException as e:
         logger.error(f"Scraping error: {e.message}")
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message)
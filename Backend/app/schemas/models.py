@@ -70,6 +70,26 @@ class PlayStoreURLRequest(BaseModel):
         return v
 
 
+class ModelSwapRequest(BaseModel):
+    """Request for hot-swapping a classifier to another model or revision"""
+    model_config = {"protected_namespaces": ()}
+
+    model_name: Optional[str] = Field(
+        None,
+        description=(
+            "Model identifier on HuggingFace Hub or local path (defaults to the current one); "
+            "must be a configured model or listed in MODEL_SWAP_ALLOWED_MODELS"
+        )
+    )
+    revision: Optional[str] = Field(
+        None,
+        description=(
+            "Hub branch, tag or commit (defaults to the default branch); "
+            "resolved to a commit on the Hub before loading"
+        )
+    )
+
+
 # ========== Response Models ==========
 
 class RequirementResult(BaseModel):
@@ -115,6 +135,13 @@ class ProcessingResponse(BaseModel):
         None,
         description="Scraping statistics (only for playstore source)"
     )
+    dedup_stats: Optional[dict] = Field(
+        None,
+        description=(
+            "Duplicate statistics: exact/normalized duplicates (total, unique, duplicates, "
+            "duplicate_ratio) and LLM description calls saved by near-duplicate grouping"
+        )
+    )
 
 
 class HealthResponse(BaseModel):
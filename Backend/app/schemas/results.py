@@ -0,0 +1,183 @@
+"""
+Internal result containers for Perseus Backend
+Array-backed results used across processing, caching and PDF generation
+
+Validating one RequirementResult per comment dominates CPU on large
+batches, so processing fills parallel columns instead and the Pydantic
+response models are built once, at the API boundary (to_response).
+"""
+
+from typing import Dict, Iterator, List, Optional
+from app.schemas.models import ProcessingResponse, RequirementResult
+
+
+class ResultRow:
+    """Read-only view of one row of a ResultSet (same fields as RequirementResult)"""
+
+    __slots__ = (
+        "comment", "is_requirement", "subcharacteristic",
+        "description", "binary_score", "multiclass_score"
+    )
+
+    def __init__(
+        self,
+        comment: str,
+        is_requirement: bool,
+        subcharacteristic: Optional[str],
+        description: Optional[str],
+        binary_score: float,
+        multiclass_score: Optional[float]
+    ):
+        self.comment = comment
+        self.is_requirement = is_requirement
+        self.subcharacteristic = subcharacteristic
+        self.description = description
+        self.binary_score = binary_score
+        self.multiclass_score = multiclass_score
+
+
+class ResultSet:
+    """
+    Columnar requirement results (one list per RequirementResult field)
+    """
+
+    COLUMNS = ResultRow.__slots__
+    __slots__ = COLUMNS
+
+    def __init__(self):
+        """Create an empty result set"""
+        for column in self.COLUMNS:
+            setattr(self, column, [])
+
+    def append(
+        self,
+        comment: str,
+        is_requirement: bool,
+        subcharacteristic: Optional[str],
+        description: Optional[str],
+        binary_score: float,
+        multiclass_score: Optional[float]
+    ) -> None:
+        """Append one row"""
+        self.comment.append(comment)
+        self.is_requirement.append(is_requirement)
+        self.subcharacteristic.append(subcharacteristic)
+        self.description.append(description)
+        self.binary_score.append(binary_score)
+        self.multiclass_score.append(multiclass_score)
+
+    def extend(self, other: "ResultSet") -> None:
+        """Append all rows of another result set"""
+        for column in self.COLUMNS:
+            getattr(self, column).extend(getattr(other, column))
+
+    def take(self, positions: List[int], comments: Optional[List[str]] = None) -> "ResultSet":
+        """
+        New result set with the rows at the given positions (repeats allowed)
+
+        Args:
+            positions: Row index for every output row
+            comments: Replacement comment texts (e.g. the original duplicates)
+
+        Returns:
+            ResultSet with len(positions) rows
+        """
+        taken = ResultSet()
+        for column in self.COLUMNS:
+            values = getattr(self, column)
+            setattr(taken, column, [values[position] for position in positions])
+        if comments is not None:
+            taken.comment = list(comments)
+        return taken
+
+    def __len__(self) -> int:
+        return len(self.comment)
+
+    def __iter__(self) -> Iterator[ResultRow]:
+        return map(ResultRow, *(getattr(self, column) for column in self.COLUMNS))
+
+    def requirements(self) -> List[ResultRow]:
+        """Rows classified as requirements"""
+        return [row for row in self if row.is_requirement]
+
+    @property
+    def valid_count(self) -> int:
+        """Number of rows classified as requirements"""
+        return sum(self.is_requirement)
+
+    def to_dict(self) -> Dict[str, list]:
+        """Columns as plain lists (compact JSON for caching)"""
+        return {column: getattr(self, column) for column in self.COLUMNS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, list]) -> "ResultSet":
+        """Rebuild a result set from to_dict() output"""
+        results = cls()
+        for column in cls.COLUMNS:
+            setattr(results, column, list(data[column]))
+        return results
+
+    def to_models(self) -> List[RequirementResult]:
+        """Validated RequirementResult models (API boundary only)"""
+        return [
+            RequirementResult(**dict(zip(self.COLUMNS, values)))
+            for values in zip(*(getattr(self, column) for column in self.COLUMNS))
+        ]
+
+
+class ProcessingReport:
+    """
+    Internal counterpart of ProcessingResponse backed by a ResultSet
+    """
+
+    __slots__ = (
+        "total_comments", "valid_requirements", "requirements",
+        "processing_time_ms", "source_type", "scraping_stats", "dedup_stats"
+    )
+
+    def __init__(
+        self,
+        total_comments: int,
+        requirements: ResultSet,
+        processing_time_ms: float,
+        source_type: str,
+        scraping_stats: Optional[dict] = None,
+        dedup_stats: Optional[dict] = None
+    ):
+        self.total_comments = total_comments
+        self.valid_requirements = requirements.valid_count
+        self.requirements = requirements
+        self.processing_time_ms = processing_time_ms
+        self.source_type = source_type
+        self.scraping_stats = scraping_stats
+        self.dedup_stats = dedup_stats
+
+    def to_response(self) -> ProcessingResponse:
+        """Build the validated API response"""
+        return ProcessingResponse(
+            total_comments=self.total_comments,
+            valid_requirements=self.valid_requirements,
+            requirements=self.requirements.to_models(),
+            processing_time_ms=self.processing_time_ms,
+            source_type=self.source_type,
+            scraping_stats=self.scraping_stats,
+            dedup_stats=self.dedup_stats
+        )
+
+    def to_dict(self) -> Dict:
+        """Plain dictionary with columnar requirements (for caching)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["requirements"] = self.requirements.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ProcessingReport":
+        """Rebuild a report from to_dict() output"""
+        return cls(
+            total_comments=data["total_comments"],
+            requirements=ResultSet.from_dict(data["requirements"]),
+            processing_time_ms=data["processing_time_ms"],
+            source_type=data["source_type"],
+            scraping_stats=data.get("scraping_stats"),
+            dedup_stats=data.get("dedup_stats")
+        )
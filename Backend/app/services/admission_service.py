@@ -0,0 +1,224 @@
+"""
+Admission Service
+Per-endpoint concurrency limits and load shedding for the processing endpoints
+
+Each endpoint kind (single comment, CSV, Play Store) runs at most
+max_concurrency requests at once; further requests wait in a bounded FIFO
+queue for at most the queue timeout. When the queue is full (or the wait
+times out) the request is rejected right away with a Retry-After estimate,
+so under overload some requests are served fast instead of all of them late.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict
+from app.core.config import settings
+from app.core.exceptions import OverloadedException
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded wait queue for one endpoint kind
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout_ms: float):
+        """
+        Args:
+            name: Endpoint kind (for logging and metrics)
+            max_concurrency: Requests processed at the same time
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout_ms: Longest wait for a slot before rejecting
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = max(0.0, queue_timeout_ms) / 1000.0
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Statistics
+        self.admitted = 0
+        self.completed = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_service = 0.0
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free (from the average service time)"""
+        avg_service = self._total_service / self.completed if self.completed else 1.0
+        backlog = (len(self._waiters) + 1) / self.max_concurrency
+        return max(1, math.ceil(avg_service * backlog))
+
+    def _reject(self, reason: str) -> OverloadedException:
+        """Build the rejection raised to the router"""
+        retry_after = self.retry_after()
+        logger.warning(
+            f"Admission ({self.name}): rejecting request - {reason} "
+            f"({self._active} active, {len(self._waiters)} queued, retry after {retry_after}s)"
+        )
+        return OverloadedException(
+            f"Server is busy processing {self.name} requests, please retry later",
+            details={"endpoint": self.name, "reason": reason},
+            retry_after=retry_after
+        )
+
+    async def _acquire(self) -> None:
+        """Take a slot, waiting in the queue if needed"""
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise self._reject("queue full")
+
+        # Slots are handed over directly by _release, so _active is unchanged here
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            if waiter.done():
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.cancel()
+            self.rejected_timeout += 1
+            raise self._reject("queue wait timeout")
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def run(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Run a request handler once admitted
+
+        Args:
+            fn: Async function doing the request's work
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+
+        Raises:
+            OverloadedException: If the request is shed
+        """
+        queued_at = time.perf_counter()
+        await self._acquire()
+
+        started = time.perf_counter()
+        wait = started - queued_at
+        self.admitted += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            self.completed += 1
+            self._total_service += time.perf_counter() - started
+            self._release()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get admission statistics
+
+        Returns:
+            Dictionary with limits, queue depth, wait times and rejection counters
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queue_depth": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_wait_ms": self._total_wait / self.admitted * 1000 if self.admitted else 0.0,
+            "max_wait_ms": self._max_wait * 1000,
+            "avg_service_ms": (
+                self._total_service / self.completed * 1000 if self.completed else 0.0
+            )
+        }
+
+
+class AdmissionService:
+    """
+    Service holding one admission controller per endpoint kind
+    """
+
+    def __init__(self):
+        """Initialize controllers from settings"""
+        timeout_ms = settings.ADMISSION_QUEUE_TIMEOUT_MS
+        self.controllers = {
+            "single": AdmissionController(
+                "single",
+                settings.ADMISSION_SINGLE_CONCURRENCY,
+                settings.ADMISSION_SINGLE_QUEUE,
+                timeout_ms
+            ),
+            "csv": AdmissionController(
+                "csv",
+                settings.ADMISSION_CSV_CONCURRENCY,
+                settings.ADMISSION_CSV_QUEUE,
+                timeout_ms
+            ),
+            "playstore": AdmissionController(
+                "playstore",
+                settings.ADMISSION_PLAYSTORE_CONCURRENCY,
+                settings.ADMISSION_PLAYSTORE_QUEUE,
+                timeout_ms
+            )
+        }
+        logger.info(
+            "Initializing Admission Service (enabled="
+            f"{settings.ADMISSION_CONTROL_ENABLED}): " + ", ".join(
+                f"{c.name}={c.max_concurrency}+{c.max_queue} queued"
+                for c in self.controllers.values()
+            )
+        )
+
+    async def run(self, endpoint: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Run a request handler under the admission control of an endpoint kind
+
+        Args:
+            endpoint: "single", "csv" or "playstore"
+            fn: Async function doing the request's work
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+
+        Raises:
+            OverloadedException: If the request is shed
+        """
+        if not settings.ADMISSION_CONTROL_ENABLED:
+            return await fn(*args, **kwargs)
+        return await self.controllers[endpoint].run(fn, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get statistics of every controller"""
+        return {name: c.get_stats() for name, c in self.controllers.items()}
+
+
+# Global service instance
+admission_service = AdmissionService()
@@ -0,0 +1,351 @@
+"""
+Autotune Service
+Picks the inference batch size and torch threads per lane for this node
+
+A synthetic workload runs through both models for every candidate
+(max batch size x token budget x threads per lane, with the configured
+number of lanes running concurrently). The fastest candidate whose p95 call
+latency stays under the ceiling is persisted to a JSON profile and reused on
+later boots of the same node/model configuration. Workers of the same node
+tune one at a time under a file lock, so only the first one tunes and the
+others reuse its profile.
+
+Run it explicitly (from Backend/), or set AUTOTUNE_ON_STARTUP=true:
+    python -m app.services.autotune_service
+    python -m app.services.autotune_service --latency-ceiling-ms 300
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import numpy as np
+import torch
+from app.core.config import settings
+from app.core.constants import MAX_SEQUENCE_LENGTH
+from app.core.logger import get_logger
+from app.services.huggingface_service import HuggingFaceService
+from app.services.inference_executor import inference_executor
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers are not coordinated
+    fcntl = None
+
+logger = get_logger(__name__)
+
+AUTOTUNE_BATCH_SIZES = (8, 16, 32, 64, 128)
+# Token budget candidates, as padded tokens per sequence (budget = batch size x this);
+# MAX_SEQUENCE_LENGTH means the budget never splits a batch
+AUTOTUNE_TOKENS_PER_SEQUENCE = (64, 128, MAX_SEQUENCE_LENGTH)
+
+# Vocabulary of the synthetic reviews (lengths vary like real Play Store reviews)
+_WORDS = (
+    "la aplicación se cierra cuando intento abrir menú botón pantalla texto "
+    "pequeño no entiendo cómo cambiar configuración ayuda error pago cuenta "
+    "actualización lenta muy buena excelente mala usuario opción buscar "
+    "historial perfil notificaciones idioma letra tutorial guía deshacer"
+).split()
+
+
+def _synthetic_texts(count: int, seed: int = 0) -> List[str]:
+    """Pseudo-reviews between 3 and 80 words long, unique across seeds"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(_WORDS) for _ in range(rng.choice((3, 6, 12, 20, 35, 50, 80))))
+        + f" #{seed}-{idx}"
+        for idx in range(count)
+    ]
+
+
+@contextmanager
+def _profile_lock(path: str):
+    """Exclusive lock on a profile, shared by every worker process of the node"""
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _cpu_model() -> str:
+    """CPU model name (empty outside Linux)"""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+
+class AutotuneService:
+    """
+    Service tuning and persisting the inference profile of this node
+    """
+
+    def __init__(self):
+        """Initialize autotune service"""
+        self.profile: Optional[Dict] = None
+        self.source = "defaults"
+
+    def _fingerprint(self, service: HuggingFaceService) -> Dict:
+        """Everything a tuned profile depends on"""
+        info = service.get_model_info()
+        return {
+            "cpu_model": _cpu_model(),
+            "cpu_count": os.cpu_count(),
+            "lanes": inference_executor.lanes,
+            "binary_model": info["binary_model"],
+            "binary_revision": service.get_model_revision("binary"),
+            "multiclass_model": info["multiclass_model"],
+            "multiclass_revision": service.get_model_revision("multiclass"),
+            "engine": settings.INFERENCE_ENGINE,
+            "precision": settings.MODEL_PRECISION,
+            "attention": settings.ATTENTION_IMPL
+        }
+
+    def _thread_candidates(self) -> List[int]:
+        """Threads per lane to try (lanes x threads never exceeds the CPU count)"""
+        max_threads = max(1, (os.cpu_count() or 1) // inference_executor.lanes)
+        candidates = {max_threads}
+        threads = 1
+        while threads < max_threads:
+            candidates.add(threads)
+            threads *= 2
+        return sorted(candidates)
+
+    def _measure(
+        self,
+        service: HuggingFaceService,
+        texts: List[str],
+        batch_size: int,
+        token_budget: int,
+        threads: int
+    ) -> Dict:
+        """
+        Run the workload with one candidate configuration
+
+        Each lane runs requests of batch_size texts through both models
+        concurrently with the others. The batch limits are passed explicitly,
+        so the serving settings are never touched.
+        """
+        lanes = inference_executor.lanes
+        requests = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        latencies: List[float] = []
+        lock = threading.Lock()
+
+        def lane_worker(lane: int):
+            torch.set_num_threads(threads)
+            for request in requests[lane::lanes]:
+                start = time.perf_counter()
+                service.batch_predict_arrays("binary", request, batch_size, token_budget)
+                service.batch_predict_arrays("multiclass", request, batch_size, token_budget)
+                with lock:
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+        def warm_up(lane: int):
+            torch.set_num_threads(threads)
+            service.batch_predict_arrays("binary", texts[lane:lane + 2], batch_size, token_budget)
+
+        with ThreadPoolExecutor(max_workers=lanes) as pool:
+            list(pool.map(warm_up, range(lanes)))
+            start = time.perf_counter()
+            list(pool.map(lane_worker, range(lanes)))
+            elapsed = time.perf_counter() - start
+
+        return {
+            "max_batch_size": batch_size,
+            "token_budget": token_budget,
+            "threads_per_lane": threads,
+            "throughput": round(len(texts) / elapsed, 1),
+            "p95_latency_ms": round(float(np.percentile(latencies, 95)), 1)
+        }
+
+    def tune(
+        self,
+        latency_ceiling_ms: Optional[float] = None,
+        workload_size: Optional[int] = None
+    ) -> Dict:
+        """
+        Sweep candidates and pick the best throughput within the latency ceiling
+
+        Args:
+            latency_ceiling_ms: Max p95 latency per request (defaults to settings)
+            workload_size: Synthetic texts per candidate (defaults to settings)
+
+        Returns:
+            Profile dictionary (not yet saved or applied)
+        """
+        latency_ceiling_ms = latency_ceiling_ms or settings.AUTOTUNE_LATENCY_CEILING_MS
+        workload_size = workload_size or settings.AUTOTUNE_WORKLOAD_SIZE
+
+        service = HuggingFaceService()
+        service.preload()
+
+        candidates = []
+        for threads in self._thread_candidates():
+            for batch_size in AUTOTUNE_BATCH_SIZES:
+                for tokens_per_sequence in AUTOTUNE_TOKENS_PER_SEQUENCE:
+                    # Fresh texts per candidate: cold tokenization, as in production traffic
+                    texts = _synthetic_texts(workload_size, seed=len(candidates))
+                    result = self._measure(
+                        service,
+                        texts,
+                        batch_size,
+                        batch_size * tokens_per_sequence,
+                        threads
+                    )
+                    logger.info(f"Autotune candidate: {result}")
+                    candidates.append(result)
+
+        eligible = [c for c in candidates if c["p95_latency_ms"] <= latency_ceiling_ms]
+        if not eligible:
+            logger.warning(
+                f"No candidate meets the {latency_ceiling_ms}ms ceiling - picking the lowest latency"
+            )
+            best = min(candidates, key=lambda c: c["p95_latency_ms"])
+        else:
+            best = max(eligible, key=lambda c: c["throughput"])
+
+        return {
+            **best,
+            "latency_ceiling_ms": latency_ceiling_ms,
+            "workload_size": workload_size,
+            "fingerprint": self._fingerprint(service),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "candidates": candidates
+        }
+
+    def save(self, profile: Dict, path: Optional[str] = None) -> None:
+        """Persist a profile as JSON (atomically)"""
+        path = path or settings.AUTOTUNE_PROFILE_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def apply(self, profile: Dict, source: str) -> None:
+        """Apply a profile to the inference executor (settings stay as configured)"""
+        token_budget = profile.get("token_budget", settings.INFERENCE_TOKEN_BUDGET)
+        inference_executor.set_batch_limits(profile["max_batch_size"], token_budget)
+        inference_executor.set_threads_per_lane(profile["threads_per_lane"])
+        self.profile = profile
+        self.source = source
+        logger.info(
+            f"✓ Inference profile applied ({source}): batch size {profile['max_batch_size']}, "
+            f"token budget {token_budget}, "
+            f"{profile['threads_per_lane']} threads per lane "
+            f"({profile['throughput']} texts/s, p95 {profile['p95_latency_ms']}ms)"
+        )
+
+    def _saved_profile(self, service: HuggingFaceService, path: str) -> Optional[Dict]:
+        """Saved profile at path if it was tuned for this node/model setup"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            profile = json.load(f)
+        return profile if profile.get("fingerprint") == self._fingerprint(service) else None
+
+    def apply_startup_profile(self) -> None:
+        """
+        Reuse a saved profile for this node, or tune now if AUTOTUNE_ON_STARTUP
+
+        With several workers, the first one to take the profile lock tunes
+        while the others wait for it, then they all apply the saved profile.
+        Must run after the models are loaded (the profile is keyed by their revisions).
+        """
+        service = HuggingFaceService()
+        path = settings.AUTOTUNE_PROFILE_PATH
+
+        profile = self._saved_profile(service, path)
+        if profile is not None:
+            self.apply(profile, source=path)
+            return
+        if os.path.exists(path):
+            logger.info("Saved inference profile was tuned for another node/model setup - ignoring it")
+
+        if not settings.AUTOTUNE_ON_STARTUP:
+            return
+
+        with _profile_lock(path):
+            # Another worker may have tuned while this one waited for the lock
+            profile = self._saved_profile(service, path)
+            if profile is not None:
+                self.apply(profile, source=path)
+                return
+
+            logger.info("Autotuning inference profile (AUTOTUNE_ON_STARTUP)...")
+            profile = self.tune()
+            self.save(profile)
+            self.apply(profile, source="startup autotune")
+
+    def get_status(self) -> Dict:
+        """
+        Get the active inference parameters and where they came from
+
+        Returns:
+            Dictionary with the active parameters and profile summary
+        """
+        limits = inference_executor.batch_limits
+        status = {
+            "source": self.source,
+            "max_batch_size": limits.max_batch_size,
+            "token_budget": limits.token_budget,
+            "lanes": inference_executor.lanes,
+            "threads_per_lane": inference_executor.threads_per_lane
+        }
+        if self.profile is not None:
+            status["profile"] = {
+                key: value for key, value in self.profile.items() if key != "candidates"
+            }
+        return status
+
+
+# Global service instance
+autotune_service = AutotuneService()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Tune, print the candidate table and save the profile"""
+    parser = argparse.ArgumentParser(description="Autotune inference batch size and threads")
+    parser.add_argument("--latency-ceiling-ms", type=float, default=None)
+    parser.add_argument("--workload-size", type=int, default=None)
+    parser.add_argument("--output", default=settings.AUTOTUNE_PROFILE_PATH)
+    args = parser.parse_args(argv)
+
+    profile = autotune_service.tune(args.latency_ceiling_ms, args.workload_size)
+
+    print(f"{'batch':>6}{'tokens':>8}{'threads':>9}{'texts/s':>10}{'p95 ms':>10}")
+    for c in profile["candidates"]:
+        chosen = " <-" if (
+            c["max_batch_size"] == profile["max_batch_size"]
+            and c["token_budget"] == profile["token_budget"]
+            and c["threads_per_lane"] == profile["threads_per_lane"]
+        ) else ""
+        print(
+            f"{c['max_batch_size']:>6}{c['token_budget']:>8}{c['threads_per_lane']:>9}"
+            f"{c['throughput']:>10.1f}{c['p95_latency_ms']:>10.1f}{chosen}"
+        )
+
+    with _profile_lock(args.output):
+        autotune_service.save(profile, args.output)
+    print(f"Profile saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
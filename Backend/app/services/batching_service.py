@@ -0,0 +1,220 @@
+"""
+Micro-Batching Service
+Coalesces concurrent small inference requests into shared batched forward passes
+"""
+
+import asyncio
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.services.huggingface_service import huggingface_service
+from app.services.inference_executor import inference_executor
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MicroBatcher:
+    """
+    Async micro-batching scheduler for a batch prediction function
+
+    Requests are held for at most ``max_wait_ms`` (or until ``max_batch_size``
+    items are pending), then a single batched call runs in the thread pool and
+    every caller receives its own slice of the results.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_wait_ms: float
+    ):
+        """
+        Initialize micro-batcher
+
+        Args:
+            name: Batcher name for logging
+            batch_fn: Synchronous function that predicts a list of items
+            max_batch_size: Maximum number of items per batched call
+            max_wait_ms: Maximum time to hold the first pending item
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self.batches_run = 0
+        self.items_processed = 0
+        self.items_cancelled = 0
+
+    async def submit(self, items: List[Any]) -> List[Any]:
+        """
+        Submit items and wait for their predictions
+
+        Args:
+            items: Items to predict
+
+        Returns:
+            Predictions in the same order as items
+        """
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+
+        for item in items:
+            future = loop.create_future()
+            self._pending.append((item, future))
+            futures.append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(loop)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush, loop)
+
+        try:
+            return list(await asyncio.gather(*futures))
+        except asyncio.CancelledError:
+            # Caller gone: drop its items that are still waiting for a batch
+            # (gather has cancelled their futures)
+            waiting = len(self._pending)
+            self._pending = [(item, f) for item, f in self._pending if not f.done()]
+            self.items_cancelled += waiting - len(self._pending)
+            raise
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        """Dispatch all pending items in chunks of at most max_batch_size"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one batched call and resolve the futures of its items"""
+        # Skip items whose callers were cancelled after the batch was formed
+        live = [(item, future) for item, future in batch if not future.done()]
+        self.items_cancelled += len(batch) - len(live)
+        if not live:
+            return
+        batch = live
+        items = [item for item, _ in batch]
+
+        try:
+            results = await inference_executor.run(self.batch_fn, items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_run += 1
+        self.items_processed += len(items)
+        logger.debug(f"{self.name} micro-batch of {len(items)} items executed")
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with batch count and average batch size
+        """
+        return {
+            "batches_run": self.batches_run,
+            "items_processed": self.items_processed,
+            "avg_batch_size": (
+                self.items_processed / self.batches_run if self.batches_run else 0.0
+            ),
+            "pending": len(self._pending),
+            "items_cancelled": self.items_cancelled
+        }
+
+
+class BatchingService:
+    """
+    Service exposing micro-batched binary and multiclass predictions
+    """
+
+    def __init__(self):
+        """Initialize batchers for both classifiers"""
+        logger.info(
+            f"Initializing Batching Service (enabled={settings.ENABLE_MICRO_BATCHING}, "
+            f"max_size={settings.MICRO_BATCH_MAX_SIZE}, wait={settings.MICRO_BATCH_WAIT_MS}ms)"
+        )
+        self.binary = MicroBatcher(
+            "binary",
+            partial(self._predict_identified, "binary"),
+            settings.MICRO_BATCH_MAX_SIZE,
+            settings.MICRO_BATCH_WAIT_MS
+        )
+        self.multiclass = MicroBatcher(
+            "multiclass",
+            partial(self._predict_identified, "multiclass"),
+            settings.MICRO_BATCH_MAX_SIZE,
+            settings.MICRO_BATCH_WAIT_MS
+        )
+
+    @staticmethod
+    def _predict_identified(model_type: str, texts: List[str]) -> List[Tuple[Dict, Dict[str, str]]]:
+        """Predict texts, pairing each prediction with the identity of the model that made it"""
+        predictions, identity = huggingface_service.batch_predict_identified(model_type, texts)
+        return [(prediction, identity) for prediction in predictions]
+
+    def _should_batch(self, texts: List[str]) -> bool:
+        """Only small requests benefit from being coalesced with others"""
+        return settings.ENABLE_MICRO_BATCHING and len(texts) < settings.MICRO_BATCH_MAX_SIZE
+
+    async def predict_binary(self, texts: List[str]) -> List[Tuple[Dict, Dict[str, str]]]:
+        """
+        Binary predictions, coalesced with concurrent callers when small
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            List of (prediction dictionary, identity of the model that made it);
+            a micro-batch split across a model swap may mix identities
+        """
+        if self._should_batch(texts):
+            return await self.binary.submit(texts)
+
+        return await inference_executor.run(self._predict_identified, "binary", texts)
+
+    async def predict_multiclass(self, texts: List[str]) -> List[Tuple[Dict, Dict[str, str]]]:
+        """
+        Multiclass predictions, coalesced with concurrent callers when small
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            List of (prediction dictionary, identity of the model that made it)
+        """
+        if self._should_batch(texts):
+            return await self.multiclass.submit(texts)
+
+        return await inference_executor.run(self._predict_identified, "multiclass", texts)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get statistics of both batchers"""
+        return {
+            "binary": self.binary.get_stats(),
+            "multiclass": self.multiclass.get_stats()
+        }
+
+
+# Global service instance
+batching_service = BatchingService()
@@ -0,0 +1,215 @@
+"""
+Circuit Breaker
+Fast failure for an LLM provider that is down or degraded
+
+Closed:    calls go through; the outcome and latency of the last `window`
+           calls are kept. Once there are at least `min_calls`, a failure
+           rate or a p95 latency over its threshold opens the breaker.
+Open:      calls are rejected right away (the caller falls back) until
+           `open_seconds` have passed.
+Half-open: up to `probes` calls go through as probes; if all of them
+           succeed (and are not slow) the breaker closes, any failure
+           reopens it.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the provider's breaker is open"""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker for {name} is open")
+        self.name = name
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 if empty)"""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(q * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+class CircuitBreaker:
+    """
+    Error-rate and latency circuit breaker for one provider
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call_ms: float,
+        open_seconds: float,
+        probes: int
+    ):
+        """
+        Args:
+            name: Provider name (for logging and metrics)
+            window: Calls kept to compute failure rate and latency percentiles
+            min_calls: Calls needed in the window before the breaker may open
+            failure_rate: Failure ratio (0-1) that opens the breaker
+            slow_call_ms: p95 latency that opens the breaker (<= 0 = ignore latency)
+            open_seconds: Time rejecting calls before probing the provider again
+            probes: Successful probe calls needed to close the breaker
+        """
+        self.name = name
+        self.min_calls = max(1, min_calls)
+        self.failure_rate = failure_rate
+        self.slow_call = slow_call_ms / 1000.0
+        self.open_seconds = max(0.0, open_seconds)
+        self.probes = max(1, probes)
+
+        self.state = CLOSED
+        self._calls: Deque[Tuple[bool, float]] = deque(maxlen=max(self.min_calls, window))
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        # Statistics
+        self.rejected = 0
+        self.times_opened = 0
+        self.transitions: Deque[Dict] = deque(maxlen=20)
+
+    def _transition(self, state: str, reason: str) -> None:
+        """Move to another state and record the transition"""
+        logger.warning(f"⚡ {self.name} circuit breaker: {self.state} → {state} ({reason})")
+        self.transitions.append({
+            "from": self.state,
+            "to": state,
+            "reason": reason,
+            "at": time.time()
+        })
+        self.state = state
+        if state == OPEN:
+            self.times_opened += 1
+            self._opened_at = time.monotonic()
+        elif state == HALF_OPEN:
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        else:
+            self._calls.clear()
+
+    def _window_stats(self) -> Tuple[float, float, float, float]:
+        """(failure rate, p50, p95, p99 latency in seconds) of the window"""
+        if not self._calls:
+            return 0.0, 0.0, 0.0, 0.0
+        failures = sum(1 for success, _ in self._calls if not success)
+        latencies = sorted(latency for _, latency in self._calls)
+        return (
+            failures / len(self._calls),
+            _percentile(latencies, 0.50),
+            _percentile(latencies, 0.95),
+            _percentile(latencies, 0.99)
+        )
+
+    def _rejecting(self) -> bool:
+        """Whether the breaker is open and not yet due for probing"""
+        return self.state == OPEN and time.monotonic() - self._opened_at < self.open_seconds
+
+    def reject_if_open(self) -> bool:
+        """
+        Cheap early check before queueing a call
+
+        Returns:
+            True (and counts a rejected call) if calls are being rejected
+        """
+        if self._rejecting():
+            self.rejected += 1
+            return True
+        return False
+
+    def acquire(self) -> Optional[str]:
+        """
+        Ask to make one call
+
+        Returns:
+            State the call was admitted in (pass it to record), or None if
+            the call must not be made
+        """
+        if self.state == OPEN:
+            if self.reject_if_open():
+                return None
+            self._transition(HALF_OPEN, f"probing after {self.open_seconds:.0f}s")
+
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight >= self.probes - self._probe_successes:
+                self.rejected += 1
+                return None
+            self._probes_in_flight += 1
+
+        return self.state
+
+    def record(self, admitted: str, success: Optional[bool], latency: float) -> None:
+        """
+        Report the outcome of a call allowed by acquire
+
+        Args:
+            admitted: State returned by acquire
+            success: True/False, or None if the outcome says nothing about the
+                provider's health (cancelled, rate limited, bad request)
+            latency: Seconds the call took
+        """
+        if admitted == HALF_OPEN:
+            self._probes_in_flight -= 1
+            if self.state != HALF_OPEN or success is None:
+                return
+            if not success or (self.slow_call > 0 and latency >= self.slow_call):
+                reason = "probe failed" if not success else f"slow probe ({latency * 1000:.0f}ms)"
+                self._transition(OPEN, reason)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probes:
+                self._transition(CLOSED, f"{self._probe_successes} probes succeeded")
+            return
+
+        # Outcomes of calls started before the breaker opened are stale
+        if self.state != CLOSED or success is None:
+            return
+
+        self._calls.append((success, latency))
+        if len(self._calls) < self.min_calls:
+            return
+        failure_rate, _, p95, _ = self._window_stats()
+        if failure_rate >= self.failure_rate:
+            self._transition(OPEN, f"failure rate {failure_rate:.0%} over {len(self._calls)} calls")
+        elif self.slow_call > 0 and p95 >= self.slow_call:
+            self._transition(OPEN, f"p95 latency {p95 * 1000:.0f}ms over {len(self._calls)} calls")
+
+    def get_stats(self) -> Dict:
+        """
+        Get breaker statistics
+
+        Returns:
+            Dictionary with the state, window failure rate and latency
+            percentiles, rejected calls and recent transitions
+        """
+        failure_rate, p50, p95, p99 = self._window_stats()
+        return {
+            "state": self.state,
+            "open_remaining_s": (
+                round(max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)), 1)
+                if self.state == OPEN else 0.0
+            ),
+            "window_calls": len(self._calls),
+            "failure_rate": round(failure_rate, 3),
+            "p50_latency_ms": p50 * 1000,
+            "p95_latency_ms": p95 * 1000,
+            "p99_latency_ms": p99 * 1000,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "transitions": list(self.transitions)
+        }
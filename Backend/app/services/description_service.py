@@ -3,15 +3,43 @@ Description Service
 Generates human-readable descriptions for security requirements using AI
 """
 
-from typing import Dict, Optional
+import asyncio
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import os
+import openai
 from openai import AsyncOpenAI
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.llm_dispatcher import estimate_tokens, get_dispatcher, is_provider_failure
 
 logger = get_logger(__name__)
 
 
+class _Flight:
+    """One in-flight description generation, shared by every caller of its cache key"""
+
+    __slots__ = ("key", "item", "owner", "future", "on_abandon", "waiters", "abandoned")
+
+    def __init__(
+        self,
+        key: str,
+        item: Tuple[str, str],
+        owner: Optional[str],
+        future: asyncio.Future,
+        on_abandon: Callable[[], None]
+    ):
+        self.key = key
+        self.item = item          # (comment, subcharacteristic), to start over if abandoned
+        self.owner = owner
+        self.future = future
+        self.on_abandon = on_abandon
+        self.waiters = 0
+        self.abandoned = False
+
+
 class DescriptionService:
     """
     Service for generating requirement descriptions using OpenAI/Groq
@@ -30,86 +58,136 @@ class DescriptionService:
         "Resistencia": "Mantener funcionalidad ante ataques o fallos"
     }
 
+    # Batched prompts: completion budget per item and re-asks for unparsed items
+    BATCH_MAX_TOKENS_PER_ITEM = 150
+    BATCH_PARSE_RETRIES = 1
+
     def __init__(self):
-        """Initialize description service with AI client"""
+        """Initialize description service with AI clients"""
         logger.info("Initializing AI-powered Description Service")
 
-        # Initialize OpenAI client (works with OpenAI and Groq)
+        # One OpenAI-compatible client per provider with an API key (Groq and
+        # OpenAI); retries are left to the LLM dispatcher, which honours
+        # Retry-After across requests. The preferred provider serves the
+        # descriptions, the other one takes over while it is unavailable.
+        self.clients: Dict[str, Tuple[AsyncOpenAI, str]] = {}
         self.openai_client = None
         self.use_ai = False
         self.provider = None
         self.model = None
-
-        # Prioritize based on PROVIDER setting
-        provider = settings.PROVIDER.lower()
-
-        if provider == "groq" and settings.GROQ_API_KEY:
-            # Try Groq first (prioritized)
+        self.alternate_provider = None
+
+        # Single-flight: cache key → in-flight generation
+        self._inflight: Dict[str, _Flight] = {}
+        self.coalesced = 0
+        self.coalesced_across_workers = 0
+
+        for provider, name, api_key, base_url, model in (
+            ("groq", "Groq", settings.GROQ_API_KEY, settings.GROQ_BASE_URL, settings.GROQ_MODEL_NAME),
+            ("openai", "OpenAI", settings.OPENAI_API_KEY, settings.OPENAI_BASE_URL, "gpt-4o-mini")
+        ):
+            if not api_key:
+                continue
             try:
-                self.openai_client = AsyncOpenAI(
-                    api_key=settings.GROQ_API_KEY,
-                    base_url="https://api.groq.com/openai/v1"
+                client = AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    max_retries=0,
+                    timeout=settings.LLM_REQUEST_TIMEOUT_S
                 )
-                self.use_ai = True
-                self.provider = "groq"
-                self.model = settings.GROQ_MODEL_NAME
-                logger.info(f"✓ Groq client initialized with model: {self.model}")
+                self.clients[provider] = (client, model)
+                logger.info(f"✓ {name} client initialized with model: {model}")
             except Exception as e:
-                logger.warning(f"Failed to initialize Groq client: {e}")
+                logger.warning(f"Failed to initialize {name} client: {e}")
+
+        # Prioritize based on PROVIDER setting, fallback to any available provider
+        preferred = settings.PROVIDER.lower()
+        providers = sorted(self.clients, key=lambda provider: provider != preferred)
+        if providers:
+            self.provider = providers[0]
+            self.openai_client, self.model = self.clients[self.provider]
+            self.use_ai = True
+            if len(providers) > 1:
+                self.alternate_provider = providers[1]
+            logger.info(
+                f"✓ Descriptions by {self.provider} ({self.model}), "
+                f"alternate provider: {self.alternate_provider or 'none (templates)'}"
+            )
+        else:
+            logger.warning("No AI client available - will use template-based descriptions")
+
+    async def _call_llm(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        owner: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """
+        Run one chat completion through the providers' LLM dispatchers
+
+        The preferred provider is tried first; while its circuit breaker is
+        open, or if the call fails with a provider error, the alternate
+        provider (if configured) serves the call instead.
+
+        Args:
+            messages: Chat messages
+            max_tokens: Completion budget
+            owner: Batch the call belongs to (for fair sharing between requests)
+
+        Returns:
+            (response, provider that answered)
+
+        Raises:
+            CircuitOpenError: If every provider's breaker is open
+            Exception: The last provider's error
+        """
+        estimated = estimate_tokens(sum(len(m["content"]) for m in messages), max_tokens)
+        error: Optional[Exception] = None
 
-        elif provider == "openai" and settings.OPENAI_API_KEY:
-            # Try OpenAI if specified
+        for provider in (self.provider, self.alternate_provider):
+            if provider is None:
+                continue
+            client, model = self.clients[provider]
             try:
-                self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-                self.use_ai = True
-                self.provider = "openai"
-                self.model = "gpt-4o-mini"
-                logger.info(f"✓ OpenAI client initialized with model: {self.model}")
+                response = await get_dispatcher(provider).call(
+                    lambda client=client, model=model: client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=max_tokens
+                    ),
+                    estimated,
+                    owner
+                )
+                return response, provider
             except Exception as e:
-                logger.warning(f"Failed to initialize OpenAI client: {e}")
+                failover = isinstance(e, (CircuitOpenError, openai.RateLimitError)) or is_provider_failure(e)
+                if not failover:
+                    raise
+                error = e
+                if provider == self.provider and self.alternate_provider and not isinstance(e, CircuitOpenError):
+                    logger.warning(f"⚠️  {provider} call failed ({e}), trying {self.alternate_provider}")
 
-        # Fallback to any available provider
-        if not self.use_ai:
-            if settings.GROQ_API_KEY:
-                try:
-                    self.openai_client = AsyncOpenAI(
-                        api_key=settings.GROQ_API_KEY,
-                        base_url="https://api.groq.com/openai/v1"
-                    )
-                    self.use_ai = True
-                    self.provider = "groq"
-                    self.model = settings.GROQ_MODEL_NAME
-                    logger.info(f"✓ Groq client initialized (fallback) with model: {self.model}")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize Groq client: {e}")
-
-            elif settings.OPENAI_API_KEY:
-                try:
-                    self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-                    self.use_ai = True
-                    self.provider = "openai"
-                    self.model = "gpt-4o-mini"
-                    logger.info(f"✓ OpenAI client initialized (fallback) with model: {self.model}")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize OpenAI client: {e}")
-
-        if not self.use_ai:
-            logger.warning("No AI client available - will use template-based descriptions")
+        raise error
 
     async def _generate_with_ai(
         self,
         comment: str,
-        subcharacteristic: str
-    ) -> Optional[str]:
+        subcharacteristic: str,
+        owner: Optional[str] = None
+    ) -> Optional[Tuple[str, str]]:
         """
         Generate description using AI (OpenAI/Groq) - ASYNC
 
+        The call goes through the provider's shared LLM dispatcher.
+
         Args:
             comment: Original user comment
             subcharacteristic: Detected security subcharacteristic
+            owner: Batch the call belongs to (for fair sharing between requests)
 
         Returns:
-            Generated description or None if failed
+            (generated description, provider that answered) or None if failed
         """
         try:
             subchar_definition = self.SUBCHARACTERISTIC_DEFINITIONS.get(
@@ -137,22 +215,22 @@ Requisitos:
 
 IMPORTANTE: Devuelve SOLO la descripción del requisito, sin explicaciones adicionales."""
 
-            # Call API with configured model (ASYNC)
-            response = await self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Eres un experto en ingeniería de requisitos de seguridad."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=200
-            )
+            messages = [
+                {"role": "system", "content": "Eres un experto en ingeniería de requisitos de seguridad."},
+                {"role": "user", "content": prompt}
+            ]
+
+            # Call API with configured model (ASYNC, rate limited, with failover)
+            response, provider = await self._call_llm(messages, 200, owner)
 
             description = response.choices[0].message.content.strip()
 
-            logger.info(f"✓ {self.provider.upper()} generated description for '{comment[:50]}...': {description[:100]}...")
-            return description
+            logger.info(f"✓ {provider.upper()} generated description for '{comment[:50]}...': {description[:100]}...")
+            return description, provider
 
+        except CircuitOpenError:
+            logger.debug(f"LLM circuit open, skipping AI description for '{comment[:50]}...'")
+            return None
         except Exception as e:
             logger.error(f"❌ AI description generation failed for '{comment[:50]}...': {e}")
             return None
@@ -186,26 +264,427 @@ IMPORTANTE: Devuelve SOLO la descripción del requisito, sin explicaciones adici
             "El sistema debe implementar medidas de seguridad apropiadas según las mejores prácticas de la industria."
         )
 
+    def _build_batch_prompt(self, items: List[Tuple[str, str]]) -> str:
+        """
+        Build one prompt describing several requirements
+
+        Instructions and subcharacteristic definitions appear once; each item
+        only adds its comment and subcharacteristic.
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+
+        Returns:
+            Prompt asking for a JSON array with one description per item
+        """
+        definitions = "\n".join(
+            f"- {subchar}: {self.SUBCHARACTERISTIC_DEFINITIONS.get(subchar, 'Requisito de seguridad')}"
+            for subchar in dict.fromkeys(subchar for _, subchar in items)
+        )
+        entries = "\n".join(
+            f"{idx}. Comentario: {json.dumps(comment, ensure_ascii=False)} | Subcaracterística: {subchar}"
+            for idx, (comment, subchar) in enumerate(items, 1)
+        )
+
+        return f"""Eres un experto en ingeniería de requisitos de software y seguridad ISO 25010.
+
+Subcaracterísticas de seguridad:
+{definitions}
+
+Comentarios de usuario:
+{entries}
+
+Tarea: Para CADA comentario genera UNA descripción formal de requisito de seguridad basada en el comentario y en su subcaracterística.
+
+Requisitos de cada descripción:
+- Escribe en tercera persona (El sistema debe...)
+- Sé específico sobre QUÉ debe hacer el sistema
+- Incluye elementos del comentario original
+- Máximo 2-3 oraciones
+- Enfócate en la subcaracterística indicada
+- Redacción profesional y técnica
+
+IMPORTANTE: Devuelve SOLO un array JSON con un objeto por comentario, sin explicaciones adicionales:
+[{{"id": 1, "descripcion": "El sistema debe..."}}, {{"id": 2, "descripcion": "..."}}]"""
+
+    def _parse_batch_response(self, content: str, count: int) -> List[Optional[str]]:
+        """
+        Split a batched reply into per-item descriptions
+
+        A reply that is not a valid array (e.g. truncated) is salvaged object
+        by object, so only the items that really failed are missing.
+
+        Args:
+            content: Model reply
+            count: Number of items in the prompt
+
+        Returns:
+            One description per item (None if missing or invalid)
+        """
+        descriptions: List[Optional[str]] = [None] * count
+
+        start, end = content.find("["), content.rfind("]")
+        try:
+            entries = json.loads(content[start:end + 1]) if 0 <= start < end else None
+        except ValueError:
+            entries = None
+        if not isinstance(entries, list):
+            entries = []
+            for match in re.finditer(r"\{[^{}]*\}", content):
+                try:
+                    entries.append(json.loads(match.group(0)))
+                except ValueError:
+                    continue
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            idx = entry.get("id")
+            description = entry.get("descripcion")
+            if isinstance(idx, str) and idx.strip().isdigit():
+                idx = int(idx)
+            if not isinstance(idx, int) or isinstance(idx, bool) or not 1 <= idx <= count:
+                continue
+            if not isinstance(description, str) or not description.strip():
+                continue
+            if descriptions[idx - 1] is None:
+                descriptions[idx - 1] = description.strip()
+
+        return descriptions
+
+    async def _generate_batch_with_ai(
+        self,
+        items: List[Tuple[str, str]],
+        owner: Optional[str] = None
+    ) -> Optional[Tuple[List[Optional[str]], str]]:
+        """
+        Generate descriptions of several requirements with one AI call - ASYNC
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+            owner: Batch the call belongs to (for fair sharing between requests)
+
+        Returns:
+            (one description per item (None where the reply could not be
+            parsed), provider that answered), or None if the call itself failed
+        """
+        try:
+            messages = [
+                {"role": "system", "content": "Eres un experto en ingeniería de requisitos de seguridad."},
+                {"role": "user", "content": self._build_batch_prompt(items)}
+            ]
+            max_tokens = self.BATCH_MAX_TOKENS_PER_ITEM * len(items)
+
+            response, provider = await self._call_llm(messages, max_tokens, owner)
+
+            descriptions = self._parse_batch_response(response.choices[0].message.content or "", len(items))
+            parsed = sum(1 for d in descriptions if d)
+            logger.info(f"✓ {provider.upper()} generated {parsed}/{len(items)} descriptions in one prompt")
+            return descriptions, provider
+
+        except CircuitOpenError:
+            logger.debug(f"LLM circuit open, skipping AI descriptions for {len(items)} items")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Batched AI description generation failed for {len(items)} items: {e}")
+            return None
+
+    async def _generate_batch(
+        self,
+        items: List[Tuple[str, str]],
+        owner: Optional[str] = None
+    ) -> List[Optional[Tuple[str, str]]]:
+        """
+        Generate descriptions of one prompt-sized batch, re-asking only for
+        the items whose part of the reply failed to parse
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+            owner: Batch the call belongs to (for fair sharing between requests)
+
+        Returns:
+            One (AI description, provider that answered) per item (None = use the template)
+        """
+        descriptions: List[Optional[Tuple[str, str]]] = [None] * len(items)
+        remaining = list(range(len(items)))
+
+        for attempt in range(self.BATCH_PARSE_RETRIES + 1):
+            if len(remaining) == 1:
+                # A lone item needs no JSON envelope
+                comment, subchar = items[remaining[0]]
+                descriptions[remaining[0]] = await self._generate_with_ai(comment, subchar, owner)
+                break
+
+            generated = await self._generate_batch_with_ai([items[i] for i in remaining], owner)
+            if generated is None:
+                # The call failed (not the parsing): don't hammer the provider
+                break
+
+            replies, provider = generated
+            for idx, description in zip(remaining, replies):
+                if description:
+                    descriptions[idx] = (description, provider)
+            remaining = [idx for idx in remaining if descriptions[idx] is None]
+            if not remaining:
+                break
+            if attempt < self.BATCH_PARSE_RETRIES:
+                logger.warning(f"⚠️  {len(remaining)} descriptions missing from batched reply, retrying them")
+
+        return descriptions
+
+    async def _describe_with_ai(
+        self,
+        items: List[Tuple[str, str]],
+        owner: Optional[str] = None
+    ) -> List[Optional[Tuple[str, str]]]:
+        """
+        Generate AI descriptions, LLM_BATCH_SIZE items per prompt - ASYNC
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+            owner: Batch the calls belong to (for fair sharing between requests)
+
+        Returns:
+            One (AI description, provider that answered) per item (None = use the template)
+        """
+        if not self.use_ai or not items:
+            return [None] * len(items)
+
+        size = max(1, settings.LLM_BATCH_SIZE)
+        batches = [items[i:i + size] for i in range(0, len(items), size)]
+        logger.info(
+            f"🤖 Generating {len(items)} AI descriptions ({self.provider}) "
+            f"in {len(batches)} prompts"
+        )
+        generated = await asyncio.gather(*[self._generate_batch(batch, owner) for batch in batches])
+        return [description for batch in generated for description in batch]
+
+    async def _wait_for_other_worker(self, cache_key: str) -> Optional[str]:
+        """
+        Wait for the description another worker holds the generation lock of
+
+        Args:
+            cache_key: llm_desc cache key being generated elsewhere
+
+        Returns:
+            The cached description, or None if the lock was released (or
+            expired) without one, so the caller generates it itself
+        """
+        from app.services.redis_service import redis_service
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.LLM_SINGLE_FLIGHT_LOCK_TTL_MS / 1000
+        while loop.time() < deadline:
+            await asyncio.sleep(settings.LLM_SINGLE_FLIGHT_POLL_MS / 1000)
+            cached = await redis_service.get(cache_key)
+            if cached is not None:
+                return cached
+            if not await redis_service.lock_exists(f"{cache_key}:lock"):
+                return None
+        return None
+
+    async def _generate_uncached(
+        self,
+        items: List[Tuple[str, str]],
+        keys: List[str],
+        owner: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate and cache descriptions that missed the cache
+
+        With LLM_SINGLE_FLIGHT_REDIS_LOCK, a Redis lock per key makes one
+        worker (process or node) generate each description while the others
+        wait for it to appear in the cache.
+
+        Keys name the preferred provider's model, so descriptions written by
+        the alternate provider during a failover are returned but not cached.
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+            keys: Their llm_desc cache keys
+            owner: Batch the calls belong to (for fair sharing between requests)
+
+        Returns:
+            One description per item (AI, another worker's, or template)
+        """
+        from app.services.redis_service import redis_service
+
+        descriptions: List[Optional[str]] = [None] * len(items)
+        answered_by: Dict[int, str] = {}
+        tokens: Dict[str, str] = {}
+        elsewhere: List[int] = []
+        if self.use_ai and settings.LLM_SINGLE_FLIGHT_REDIS_LOCK:
+            claims = await asyncio.gather(*[
+                redis_service.acquire_lock(f"{key}:lock", settings.LLM_SINGLE_FLIGHT_LOCK_TTL_MS)
+                for key in keys
+            ])
+            for idx, (key, token) in enumerate(zip(keys, claims)):
+                if token is None:
+                    elsewhere.append(idx)
+                elif token:
+                    tokens[key] = token
+
+        try:
+            skipped = set(elsewhere)
+            own = [idx for idx in range(len(items)) if idx not in skipped]
+            generated, *waited = await asyncio.gather(
+                self._describe_with_ai([items[idx] for idx in own], owner),
+                *[self._wait_for_other_worker(keys[idx]) for idx in elsewhere]
+            )
+            for idx, result in zip(own, generated):
+                if result is not None:
+                    descriptions[idx], answered_by[idx] = result
+            for idx, description in zip(elsewhere, waited):
+                descriptions[idx] = description
+            received = {idx for idx, description in zip(elsewhere, waited) if description is not None}
+            self.coalesced_across_workers += len(received)
+
+            # The other worker gave up: generate those here
+            leftovers = [idx for idx in elsewhere if idx not in received]
+            if leftovers:
+                retried = await self._describe_with_ai([items[idx] for idx in leftovers], owner)
+                for idx, result in zip(leftovers, retried):
+                    if result is not None:
+                        descriptions[idx], answered_by[idx] = result
+
+            # Cache the results (shielded: keep them even if the request is cancelled)
+            fresh = {
+                keys[idx]: descriptions[idx]
+                for idx, provider in answered_by.items()
+                if provider == self.provider
+            }
+            if len(fresh) < len(answered_by):
+                logger.info(
+                    f"Not caching {len(answered_by) - len(fresh)} descriptions "
+                    f"from the alternate provider ({self.alternate_provider})"
+                )
+            await asyncio.shield(redis_service.set_many(fresh, ttl=settings.CACHE_TTL_LLM))
+        finally:
+            if tokens:
+                await asyncio.shield(asyncio.gather(*[
+                    redis_service.release_lock(f"{key}:lock", token) for key, token in tokens.items()
+                ]))
+
+        # Fallback to template (not cached)
+        fallbacks = 0
+        for idx, description in enumerate(descriptions):
+            if description is None:
+                descriptions[idx] = self._generate_with_template(*items[idx])
+                fallbacks += 1
+        if fallbacks:
+            logger.warning(f"⚠️  Using template-based descriptions for {fallbacks}/{len(items)} requirements")
+
+        return descriptions
+
+    # ========== Single-flight ==========
+
+    def _start_flight(
+        self,
+        key: str,
+        item: Tuple[str, str],
+        owner: Optional[str],
+        future: asyncio.Future,
+        on_abandon: Callable[[], None]
+    ) -> _Flight:
+        """Register the in-flight generation of a cache key"""
+        flight = _Flight(key, item, owner, future, on_abandon)
+        self._inflight[key] = flight
+        future.add_done_callback(lambda _: self._end_flight(flight))
+        return flight
+
+    def _end_flight(self, flight: _Flight) -> None:
+        if self._inflight.get(flight.key) is flight:
+            del self._inflight[flight.key]
+
+    async def _join_flight(self, flight: _Flight) -> str:
+        """
+        Await an in-flight generation without letting one caller's
+        cancellation cancel it for the others
+
+        The generation is cancelled once every caller has been cancelled.
+        A caller still holding an abandoned flight (e.g. a repeated item
+        gathered after the others gave up) joins a fresh generation instead.
+        """
+        if flight.abandoned:
+            flight = self._inflight.get(flight.key) or self._start_batch_flights(
+                [flight.item], [flight.key], flight.owner
+            )[0]
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if not flight.future.done():
+                flight.waiters -= 1
+                if flight.waiters == 0 and not flight.abandoned:
+                    # Nobody wants it anymore: new callers start a fresh one
+                    flight.abandoned = True
+                    self._end_flight(flight)
+                    flight.on_abandon()
+            raise
+
+    def _start_batch_flights(
+        self,
+        items: List[Tuple[str, str]],
+        keys: List[str],
+        owner: Optional[str]
+    ) -> List[_Flight]:
+        """
+        Start one generation task for several keys, with one flight per key
+
+        The task is cancelled only once all of its flights are abandoned.
+        """
+        task = asyncio.ensure_future(self._generate_uncached(items, keys, owner))
+        futures = [asyncio.get_running_loop().create_future() for _ in keys]
+        live = len(futures)
+
+        def abandon() -> None:
+            nonlocal live
+            live -= 1
+            if live == 0:
+                task.cancel()
+
+        def resolve(done: asyncio.Future) -> None:
+            for idx, future in enumerate(futures):
+                if future.done():
+                    continue
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    future.set_exception(done.exception())
+                else:
+                    future.set_result(done.result()[idx])
+
+        task.add_done_callback(resolve)
+        return [
+            self._start_flight(key, item, owner, future, abandon)
+            for key, item, future in zip(keys, items, futures)
+        ]
+
+    # ========== Public API ==========
+
     async def generate_description(
         self,
         comment: str,
-        subcharacteristic: str
+        subcharacteristic: str,
+        owner: Optional[str] = None
     ) -> str:
         """
         Generate a formal description for a security requirement - ASYNC with CACHE
 
-        Uses AI if available, falls back to templates otherwise.
+        Uses AI if available, falls back to templates otherwise. Concurrent
+        calls for the same cache key share one generation (single-flight).
 
         Args:
             comment: Original user comment
             subcharacteristic: Detected security subcharacteristic
+            owner: Batch the call belongs to (for fair sharing between requests)
 
         Returns:
             Generated description in formal requirement language
         """
         # Import redis service here to avoid circular imports
         from app.services.redis_service import redis_service
-        from app.core.config import settings
 
         # Try cache first
         cache_key = redis_service._generate_key("llm_desc", comment, subcharacteristic, self.model)
@@ -214,20 +693,110 @@ IMPORTANTE: Devuelve SOLO la descripción del requisito, sin explicaciones adici
             logger.info(f"🎯 Cache HIT for LLM description: {subcharacteristic}")
             return cached
 
-        # Try AI generation
-        if self.use_ai:
-            logger.info(f"🤖 Generating AI description ({self.provider}) for: {subcharacteristic}")
-            ai_description = await self._generate_with_ai(comment, subcharacteristic)
-            if ai_description:
-                # Cache the result
-                await redis_service.set(cache_key, ai_description, ttl=settings.CACHE_TTL_LLM)
-                return ai_description
-
-        # Fallback to template
-        logger.warning(f"⚠️  Using template-based description for: {subcharacteristic}")
-        template_desc = self._generate_with_template(comment, subcharacteristic)
-        # Don't cache template descriptions
-        return template_desc
+        if not settings.LLM_SINGLE_FLIGHT_ENABLED:
+            return (await self._generate_uncached([(comment, subcharacteristic)], [cache_key], owner))[0]
+
+        flight = self._inflight.get(cache_key)
+        if flight is None:
+            flight = self._start_batch_flights([(comment, subcharacteristic)], [cache_key], owner)[0]
+        else:
+            self.coalesced += 1
+            logger.info(f"🔗 Joining in-flight LLM description: {subcharacteristic}")
+        return await self._join_flight(flight)
+
+    async def generate_descriptions(
+        self,
+        items: List[Tuple[str, str]],
+        owner: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate descriptions of many requirements - ASYNC with CACHE, BATCHED PROMPTS
+
+        Cache misses are packed LLM_BATCH_SIZE per prompt; cache entries are
+        still read and written per item (same keys as generate_description).
+        Items already being generated (by this or a concurrent request) join
+        that generation instead of starting another one.
+
+        Args:
+            items: (comment, subcharacteristic) pairs
+            owner: Batch the calls belong to (for fair sharing between requests)
+
+        Returns:
+            One description per item, in order
+        """
+        from app.services.redis_service import redis_service
+
+        if not items:
+            return []
+
+        keys = [
+            redis_service._generate_key("llm_desc", comment, subchar, self.model)
+            for comment, subchar in items
+        ]
+        descriptions: List[Optional[str]] = list(await redis_service.get_many(keys))
+        misses = [idx for idx, cached in enumerate(descriptions) if cached is None]
+        if len(misses) < len(items):
+            logger.info(f"🎯 Cache HIT for {len(items) - len(misses)}/{len(items)} LLM descriptions")
+        if not misses:
+            return descriptions
+
+        if not settings.LLM_SINGLE_FLIGHT_ENABLED:
+            generated = await self._generate_uncached(
+                [items[idx] for idx in misses],
+                [keys[idx] for idx in misses],
+                owner
+            )
+            for idx, description in zip(misses, generated):
+                descriptions[idx] = description
+            return descriptions
+
+        flights: Dict[str, _Flight] = {}
+        new_keys: Dict[str, int] = {}
+        for idx in misses:
+            key = keys[idx]
+            if key in flights or key in new_keys:
+                self.coalesced += 1
+            elif key in self._inflight:
+                flights[key] = self._inflight[key]
+                self.coalesced += 1
+            else:
+                new_keys[key] = idx
+        if len(new_keys) < len(misses):
+            logger.info(
+                f"🔗 {len(misses) - len(new_keys)} LLM descriptions joined in-flight generations"
+            )
+
+        if new_keys:
+            started = self._start_batch_flights(
+                [items[idx] for idx in new_keys.values()],
+                list(new_keys),
+                owner
+            )
+            flights.update(zip(new_keys, started))
+
+        generated = await asyncio.gather(*[self._join_flight(flights[keys[idx]]) for idx in misses])
+        for idx, description in zip(misses, generated):
+            descriptions[idx] = description
+        return descriptions
+
+    def get_stats(self) -> Dict:
+        """
+        Get description generation statistics
+
+        Returns:
+            Dictionary with the provider, in-flight generations and coalesced calls
+        """
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "alternate_provider": self.alternate_provider,
+            "batch_size": settings.LLM_BATCH_SIZE,
+            "single_flight": settings.LLM_SINGLE_FLIGHT_ENABLED,
+            "redis_lock": settings.LLM_SINGLE_FLIGHT_REDIS_LOCK,
+            "in_flight": len(self._inflight),
+            "coalesced": self.coalesced,
+            "coalesced_across_workers": self.coalesced_across_workers
+        }
 
 
 # Global service instance
@@ -3,16 +3,65 @@ HuggingFace Model Service
 Handles loading and inference of HuggingFace transformer models
 """
 
-from typing import Dict, List, Optional
-from transformers import pipeline, Pipeline
+import io
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from transformers import (
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    pipeline,
+    Pipeline
+)
+import numpy as np
 import torch
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.core.exceptions import ModelLoadException, PredictionException
-from app.core.constants import PIPELINE_TASK
+from app.core.constants import PIPELINE_TASK, MAX_SEQUENCE_LENGTH, BINARY_VALID_LABELS
+from app.core.cpu_features import detect_cpu_features
+from app.services.tokenization_service import tokenization_service
+from app.services.inference_executor import inference_executor
+from app.services.model_snapshot import resolve_snapshot
+from app.services.model_registry import ModelRegistry, local_revision
 
 logger = get_logger(__name__)
 
+# Short texts run through a freshly loaded model before it starts serving
+WARMUP_TEXTS = [
+    "La aplicación se cierra al abrir el menú de configuración",
+    "Excelente app",
+]
+
+
+class LabelTable(NamedTuple):
+    """Label lookup of a loaded model, computed once per pipeline"""
+    labels: Tuple[str, ...]       # label id → label
+    is_requirement: np.ndarray    # label id → label is in BINARY_VALID_LABELS
+    use_sigmoid: bool             # single-logit / multi-label heads
+
+
+class BatchPrediction(NamedTuple):
+    """
+    Compact classifier output for a batch, in input order
+
+    label_ids index into labels; is_requirement is only meaningful for the
+    binary model.
+    """
+    label_ids: np.ndarray         # int64
+    scores: np.ndarray            # float32, probability of the predicted label
+    is_requirement: np.ndarray    # bool
+    labels: Tuple[str, ...]
+
+    def to_dicts(self) -> List[Dict]:
+        """Convert to pipeline-style {"label", "score"} dictionaries"""
+        labels = self.labels
+        return [
+            {"label": labels[label_id], "score": score}
+            for label_id, score in zip(self.label_ids.tolist(), self.scores.tolist())
+        ]
+
 
 class HuggingFaceService:
     """
@@ -21,8 +70,6 @@ class HuggingFaceService:
     """
 
     _instance: Optional['HuggingFaceService'] = None
-    _binary_pipeline: Optional[Pipeline] = None
-    _multiclass_pipeline: Optional[Pipeline] = None
 
     def __new__(cls):
         """Implement singleton pattern"""
@@ -34,68 +81,349 @@ class HuggingFaceService:
         """Initialize service (only once due to singleton)"""
         if not hasattr(self, '_initialized'):
             self._initialized = True
+            self.startup_timings: List[Tuple[str, float]] = []
+            # Weak keys: a swapped-out pipeline must not be kept alive by its table
+            self._label_tables: "weakref.WeakKeyDictionary[Any, LabelTable]" = (
+                weakref.WeakKeyDictionary()
+            )
+
+            # Load-once, hot-swappable model slots
+            self.registry = ModelRegistry(
+                load_fn=self._load_model,
+                warmup_fn=self._warm_up,
+                revision_fn=self._resolve_revision
+            )
+            self.registry.register(
+                "binary",
+                settings.BINARY_MODEL_NAME,
+                settings.BINARY_MODEL_REVISION
+            )
+            self.registry.register(
+                "multiclass",
+                settings.MULTICLASS_MODEL_NAME,
+                settings.MULTICLASS_MODEL_REVISION
+            )
             logger.info("Initializing HuggingFace Service")
 
     @property
     def binary_pipeline(self) -> Pipeline:
         """Get or load binary classification pipeline"""
-        if self._binary_pipeline is None:
-            self._binary_pipeline = self._load_model(
-                settings.BINARY_MODEL_NAME,
-                "binary"
-            )
-        return self._binary_pipeline
+        return self.registry.get("binary")
 
     @property
     def multiclass_pipeline(self) -> Pipeline:
         """Get or load multiclass classification pipeline"""
-        if self._multiclass_pipeline is None:
-            self._multiclass_pipeline = self._load_model(
-                settings.MULTICLASS_MODEL_NAME,
-                "multiclass"
-            )
-        return self._multiclass_pipeline
+        return self.registry.get("multiclass")
 
-    def _load_model(self, model_name: str, model_type: str) -> Pipeline:
+    @contextmanager
+    def _timed(self, step: str):
+        """Record the duration of a load step for the startup report"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings.append((step, time.perf_counter() - start))
+
+    def _load_model(
+        self,
+        model_name: str,
+        model_type: str,
+        revision: Optional[str] = None,
+        use_snapshot: bool = True
+    ) -> Tuple[Pipeline, Dict[str, Any]]:
         """
-        Load a HuggingFace model pipeline
+        Load a model with the configured inference engine
 
         Args:
             model_name: Model identifier on HuggingFace Hub
             model_type: Type of model (binary/multiclass) for logging
+            revision: Hub branch, tag or commit (None = default branch)
+            use_snapshot: Whether a matching local snapshot may be used
 
         Returns:
-            Loaded pipeline
+            Tuple of (loaded pipeline or ONNX pipeline with the same interface,
+            load report with the effective engine, precision and attention)
 
         Raises:
             ModelLoadException: If model fails to load
         """
         try:
-            logger.info(f"Loading {model_type} model: {model_name}")
+            logger.info(f"Loading {model_type} model: {model_name} @ {revision or 'default'}")
+
+            engine = settings.INFERENCE_ENGINE.lower()
+            if engine == "onnx":
+                try:
+                    from app.services.onnx_engine import load_onnx_pipeline
+                    with self._timed(f"{model_type}: ONNX session"):
+                        pipe = load_onnx_pipeline(model_name, revision)
+                    # Exported graphs run in fp32 with their own attention kernels
+                    report = {"engine": "onnx", "precision": "fp32", "attention": None}
+                    logger.info(f"{model_type.capitalize()} model loaded successfully (ONNX Runtime)")
+                    self._log_tokenizer_sharing(model_type, pipe)
+                    return pipe, report
+                except ImportError:
+                    logger.warning("onnxruntime not installed - falling back to PyTorch engine")
+
+            pipe, report = self._load_torch_pipeline(
+                model_name,
+                model_type,
+                revision=revision,
+                use_snapshot=use_snapshot
+            )
 
-            # Determine device
-            device = 0 if torch.cuda.is_available() else -1
-            device_name = "CUDA" if device == 0 else "CPU"
+            logger.info(f"{model_type.capitalize()} model loaded successfully")
+            self._log_tokenizer_sharing(model_type, pipe)
+            return pipe, report
 
-            logger.info(f"Using device: {device_name}")
+        except Exception as e:
+            error_msg = f"Failed to load {model_type} model '{model_name}': {str(e)}"
+            logger.error(error_msg)
+            raise ModelLoadException(error_msg, details={"model": model_name, "error": str(e)})
+
+    def _load_torch_pipeline(
+        self,
+        model_name: str,
+        model_type: str = "model",
+        precision: Optional[str] = None,
+        revision: Optional[str] = None,
+        use_snapshot: bool = True,
+        attention: Optional[str] = None
+    ) -> Tuple[Pipeline, Dict[str, Any]]:
+        """
+        Load a PyTorch transformers pipeline
 
-            # Load pipeline with truncation to handle long sequences
+        Args:
+            model_name: Model identifier on HuggingFace Hub
+            model_type: Type of model (binary/multiclass) for logging
+            precision: "fp32", "int8" or "bf16" (defaults to settings.MODEL_PRECISION)
+            revision: Hub branch, tag or commit (None = default branch)
+            use_snapshot: Whether a matching local snapshot may be used
+            attention: "eager" or "sdpa" (defaults to settings.ATTENTION_IMPL)
+
+        Returns:
+            Tuple of (loaded pipeline, load report with the effective engine,
+            precision and attention, plus the int8 size/speedup measurements)
+        """
+        precision = (precision or settings.MODEL_PRECISION).lower()
+        attention = (attention or settings.ATTENTION_IMPL).lower()
+
+        # Determine device
+        device = 0 if torch.cuda.is_available() else -1
+        device_name = "CUDA" if device == 0 else "CPU"
+
+        logger.info(f"Using device: {device_name}")
+
+        snapshot = resolve_snapshot(model_type, model_name, revision) if use_snapshot else None
+        if snapshot is not None:
+            # Local snapshot: no Hub resolution, safetensors weights are memory-mapped
+            logger.info(f"Using local snapshot: {snapshot['path']}")
+            origin = "snapshot"
+            load_kwargs = {"local_files_only": True}
+            model_source = snapshot["path"]
+        else:
+            origin = "Hub"
+            load_kwargs = {"revision": revision, "token": settings.HUGGINGFACE_TOKEN}
+            model_source = model_name
+
+        with self._timed(f"{model_type}: tokenizer ({origin})"):
+            tokenizer = AutoTokenizer.from_pretrained(model_source, **load_kwargs)
+        with self._timed(f"{model_type}: weights ({origin})"):
+            model = self._load_weights(model_source, model_type, attention, load_kwargs)
+
+        if snapshot is not None:
+            # Keep the Hub revision so revision-keyed caches stay valid
+            model.config._commit_hash = snapshot["revision"]
+
+        # Load pipeline with truncation to handle long sequences
+        with self._timed(f"{model_type}: pipeline"):
             pipe = pipeline(
                 PIPELINE_TASK,
-                model=model_name,
+                model=model,
+                tokenizer=tokenizer,
                 device=device,
-                token=settings.HUGGINGFACE_TOKEN,
                 truncation=True,
-                max_length=512
+                max_length=MAX_SEQUENCE_LENGTH
             )
 
-            logger.info(f"{model_type.capitalize()} model loaded successfully")
-            return pipe
+        report: Dict[str, Any] = {}
+        if precision == "int8":
+            if device_name == "CPU":
+                with self._timed(f"{model_type}: int8 quantization"):
+                    report = self._quantize_dynamic_int8(pipe, model_type)
+            else:
+                logger.warning("Dynamic int8 quantization is CPU-only - keeping fp32 on CUDA")
+                precision = "fp32"
+        elif precision == "bf16":
+            with self._timed(f"{model_type}: bf16 check"):
+                precision = self._enable_bf16(pipe, model_type)
+
+        report.update({
+            "engine": "torch",
+            "precision": precision,
+            "attention": getattr(model.config, "_attn_implementation", "eager")
+        })
+        return pipe, report
+
+    def _load_weights(
+        self,
+        model_source: str,
+        model_type: str,
+        attention: str,
+        load_kwargs: Dict[str, Any]
+    ) -> torch.nn.Module:
+        """
+        Load model weights with the requested attention implementation
+
+        Falls back to eager attention when the architecture (or the installed
+        transformers version) has no SDPA implementation.
+        """
+        if attention != "eager":
+            try:
+                return AutoModelForSequenceClassification.from_pretrained(
+                    model_source,
+                    attn_implementation=attention,
+                    **load_kwargs
+                )
+            except (ValueError, ImportError) as e:
+                logger.warning(
+                    f"{attention} attention unavailable for {model_type} model - using eager ({e})"
+                )
+
+        return AutoModelForSequenceClassification.from_pretrained(model_source, **load_kwargs)
+
+    def _enable_bf16(self, pipe: Pipeline, model_type: str) -> str:
+        """
+        Run a pipeline's forward passes under bf16 autocast if the hardware allows
 
+        Weights stay in fp32 (autocast casts per op), so falling back is free.
+
+        Args:
+            pipe: Loaded fp32 pipeline (modified in place)
+            model_type: Type of model (binary/multiclass) for logging
+
+        Returns:
+            Effective precision: "bf16" or "fp32"
+        """
+        if pipe.device.type == "cuda":
+            supported = torch.cuda.is_bf16_supported()
+        else:
+            supported = detect_cpu_features()["bf16"]
+
+        if not supported:
+            logger.warning(
+                f"bf16 not natively supported on this {pipe.device.type.upper()} "
+                f"- keeping {model_type} model in fp32"
+            )
+            return "fp32"
+
+        pipe.autocast_dtype = torch.bfloat16
+        try:
+            self._predict_bucketed(pipe, WARMUP_TEXTS)
         except Exception as e:
-            error_msg = f"Failed to load {model_type} model '{model_name}': {str(e)}"
-            logger.error(error_msg)
-            raise ModelLoadException(error_msg, details={"model": model_name, "error": str(e)})
+            del pipe.autocast_dtype
+            logger.warning(f"bf16 forward pass failed for {model_type} model - using fp32 ({e})")
+            return "fp32"
+
+        logger.info(f"✓ {model_type.capitalize()} model runs under bf16 autocast")
+        return "bf16"
+
+    def _log_tokenizer_sharing(self, model_type: str, pipe: Any) -> None:
+        """Log whether a newly loaded model can share encodings with the other one"""
+        other = "binary" if model_type == "multiclass" else "multiclass"
+        if not self.registry.is_loaded(other):
+            return
+
+        shared = tokenization_service.tokenizers_match(
+            pipe.tokenizer,
+            self.registry.get(other).tokenizer
+        )
+        logger.info(
+            "Binary and multiclass tokenizers match - encodings are shared"
+            if shared else
+            "Binary and multiclass tokenizers differ - each model tokenizes separately"
+        )
+
+    def _warm_up(self, pipe: Any) -> None:
+        """Run a small batch through a freshly loaded model (same path as serving)"""
+        self._predict_bucketed(pipe, WARMUP_TEXTS)
+
+    @staticmethod
+    def _resolve_revision(pipe: Any, model_name: str) -> str:
+        """
+        Revision identifier of a loaded pipeline
+
+        Returns:
+            Hub commit hash, a content-derived id for local directories,
+            or "local" if neither is available
+        """
+        if isinstance(pipe, Pipeline):
+            revision = getattr(pipe.model.config, "_commit_hash", None)
+        else:
+            revision = getattr(pipe, "revision", None)
+        return revision or local_revision(model_name) or "local"
+
+    @staticmethod
+    def _model_size_mb(model: torch.nn.Module) -> float:
+        """Serialized state_dict size in MB (counts packed int8 weights too)"""
+        buffer = io.BytesIO()
+        torch.save(model.state_dict(), buffer)
+        return buffer.getbuffer().nbytes / (1024 * 1024)
+
+    def _time_forward(self, pipe: Pipeline, repeats: int = 3) -> float:
+        """
+        Average latency in ms of a small fixed batch (after one warm-up call)
+
+        Timed through _predict_bucketed, the path serving uses, not the
+        transformers pipeline call.
+        """
+        sample = ["La aplicación se cierra al abrir el menú de configuración"] * 8
+        self._predict_bucketed(pipe, sample)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            self._predict_bucketed(pipe, sample)
+        return (time.perf_counter() - start) * 1000 / repeats
+
+    def _quantize_dynamic_int8(self, pipe: Pipeline, model_type: str) -> Dict[str, Any]:
+        """
+        Apply dynamic int8 quantization to the Linear layers of a pipeline model
+
+        Logs the memory saved and the speedup measured on a small warm-up
+        batch run through the serving path.
+
+        Args:
+            pipe: Loaded fp32 pipeline (modified in place)
+            model_type: Type of model (binary/multiclass) for logging
+
+        Returns:
+            Load report with the sizes, latencies and speedup
+        """
+        size_before = self._model_size_mb(pipe.model)
+        latency_before = self._time_forward(pipe)
+
+        pipe.model = torch.quantization.quantize_dynamic(
+            pipe.model,
+            {torch.nn.Linear},
+            dtype=torch.qint8
+        )
+
+        size_after = self._model_size_mb(pipe.model)
+        latency_after = self._time_forward(pipe)
+
+        report = {
+            "precision": "int8",
+            "size_fp32_mb": round(size_before, 1),
+            "size_int8_mb": round(size_after, 1),
+            "memory_saved_mb": round(size_before - size_after, 1),
+            "latency_fp32_ms": round(latency_before, 1),
+            "latency_int8_ms": round(latency_after, 1),
+            "speedup": round(latency_before / latency_after, 2) if latency_after else None
+        }
+        logger.info(
+            f"✓ {model_type.capitalize()} model quantized to int8: "
+            f"{report['size_fp32_mb']}MB → {report['size_int8_mb']}MB "
+            f"(saved {report['memory_saved_mb']}MB), speedup {report['speedup']}x"
+        )
+        return report
 
     def predict_binary(self, text: str) -> Dict:
         """
@@ -111,7 +439,7 @@ class HuggingFaceService:
             PredictionException: If prediction fails
         """
         try:
-            result = self.binary_pipeline(text)[0]
+            result = self._predict_bucketed(self.binary_pipeline, [text]).to_dicts()[0]
             logger.debug(f"Binary prediction for '{text[:50]}...': {result}")
             return result
 
@@ -134,7 +462,7 @@ class HuggingFaceService:
             PredictionException: If prediction fails
         """
         try:
-            result = self.multiclass_pipeline(text)[0]
+            result = self._predict_bucketed(self.multiclass_pipeline, [text]).to_dicts()[0]
             logger.debug(f"Multiclass prediction for '{text[:50]}...': {result}")
             return result
 
@@ -143,50 +471,305 @@ class HuggingFaceService:
             logger.error(error_msg)
             raise PredictionException(error_msg, details={"text": text[:100]})
 
-    def batch_predict_binary(self, texts: List[str]) -> List[Dict]:
+    @staticmethod
+    def _build_buckets(
+        order: List[int],
+        lengths: List[int],
+        max_batch_size: Optional[int] = None,
+        token_budget: Optional[int] = None
+    ) -> List[List[int]]:
         """
-        Batch predict for multiple texts (binary)
+        Group indices (sorted by ascending token length) into batches
+
+        A batch is closed when adding the next input would push
+        (batch size x longest sequence) over the token budget or the
+        batch would exceed the max batch size.
+
+        Args:
+            order: Input indices sorted by ascending token length
+            lengths: Token length of each input
+            max_batch_size: Max inputs per batch (defaults to the active inference profile)
+            token_budget: Max padded tokens per batch (defaults to the active inference profile)
+
+        Returns:
+            List of buckets, each a list of input indices
+        """
+        limits = inference_executor.batch_limits
+        max_batch_size = max_batch_size or limits.max_batch_size
+        token_budget = token_budget or limits.token_budget
+        buckets: List[List[int]] = []
+        current: List[int] = []
+
+        for idx in order:
+            # Sorted ascending, so the incoming input is the longest one
+            padded_tokens = (len(current) + 1) * lengths[idx]
+            if current and (
+                padded_tokens > token_budget
+                or len(current) >= max_batch_size
+            ):
+                buckets.append(current)
+                current = []
+            current.append(idx)
+
+        if current:
+            buckets.append(current)
+
+        return buckets
+
+    def _label_table(self, pipe: Pipeline) -> LabelTable:
+        """Get (building on first use) the label lookup of a pipeline"""
+        table = self._label_tables.get(pipe)
+        if table is not None:
+            return table
+
+        if isinstance(pipe, Pipeline):
+            config = pipe.model.config
+            id2label = {int(k): v for k, v in config.id2label.items()}
+            use_sigmoid = (
+                config.num_labels == 1
+                or config.problem_type == "multi_label_classification"
+            )
+        else:
+            id2label = pipe.id2label
+            use_sigmoid = pipe.use_sigmoid
+
+        labels = tuple(id2label[label_id] for label_id in range(len(id2label)))
+        table = LabelTable(
+            labels=labels,
+            is_requirement=np.array([label in BINARY_VALID_LABELS for label in labels]),
+            use_sigmoid=use_sigmoid
+        )
+        self._label_tables[pipe] = table
+        return table
+
+    def _predict_bucketed(
+        self,
+        pipe: Pipeline,
+        texts: List[str],
+        max_batch_size: Optional[int] = None,
+        token_budget: Optional[int] = None
+    ) -> BatchPrediction:
+        """
+        Run a model over length-sorted, token-budgeted batches
+
+        Texts are tokenized once through the shared tokenization layer (so
+        the multiclass stage reuses the binary stage's encodings when both
+        tokenizers match) and the padded batches are fed straight to the
+        model, bypassing the transformers pipeline. Short reviews are
+        batched together so they are not padded to the length of the
+        longest text in the whole input.
 
         Args:
+            pipe: Classification pipeline
+            texts: Texts to classify
+            max_batch_size: Max inputs per batch (defaults to the active inference profile)
+            token_budget: Max padded tokens per batch (defaults to the active inference profile)
+
+        Returns:
+            BatchPrediction arrays in the original input order
+        """
+        table = self._label_table(pipe)
+        label_ids = np.zeros(len(texts), dtype=np.int64)
+        scores = np.zeros(len(texts), dtype=np.float32)
+
+        if texts:
+            encodings = tokenization_service.encode(pipe.tokenizer, texts)
+            lengths = [len(ids) for ids in encodings]
+            order = sorted(range(len(texts)), key=lengths.__getitem__)
+            buckets = self._build_buckets(order, lengths, max_batch_size, token_budget)
+
+            logger.debug(f"Running {len(texts)} texts in {len(buckets)} length buckets")
+
+            for bucket in buckets:
+                batch = tokenization_service.collate(
+                    pipe.tokenizer,
+                    [encodings[idx] for idx in bucket]
+                )
+                bucket_ids, bucket_scores = self._classify(
+                    self._logits(pipe, batch),
+                    table.use_sigmoid
+                )
+                label_ids[bucket] = bucket_ids
+                scores[bucket] = bucket_scores
+
+        return BatchPrediction(
+            label_ids=label_ids,
+            scores=scores,
+            is_requirement=table.is_requirement[label_ids],
+            labels=table.labels
+        )
+
+    @staticmethod
+    def _logits(pipe: Pipeline, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Run one padded batch through the model
+
+        Args:
+            pipe: Classification pipeline (torch or ONNX)
+            batch: Collated input arrays
+
+        Returns:
+            float32 logits of shape (batch, num_labels)
+        """
+        if not isinstance(pipe, Pipeline):
+            # ONNX engine: already has its own session
+            return pipe.logits(batch).astype(np.float32, copy=False)
+
+        inputs = {
+            name: torch.from_numpy(array).to(pipe.device)
+            for name, array in batch.items()
+        }
+        autocast_dtype = getattr(pipe, "autocast_dtype", None)
+        with torch.inference_mode(), torch.autocast(
+            pipe.device.type,
+            dtype=autocast_dtype,
+            enabled=autocast_dtype is not None
+        ):
+            return pipe.model(**inputs).logits.float().cpu().numpy()
+
+    @staticmethod
+    def _classify(logits: np.ndarray, use_sigmoid: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized softmax (or sigmoid) + argmax over a whole batch
+
+        Returns:
+            Tuple of (label ids, probability of each predicted label)
+        """
+        if use_sigmoid:
+            probs = 1.0 / (1.0 + np.exp(-logits))
+        else:
+            shifted = logits - logits.max(axis=-1, keepdims=True)
+            probs = np.exp(shifted)
+            probs /= probs.sum(axis=-1, keepdims=True)
+
+        label_ids = probs.argmax(axis=-1)
+        return label_ids, np.take_along_axis(probs, label_ids[:, None], axis=-1)[:, 0]
+
+    def batch_predict_arrays(
+        self,
+        model_type: str,
+        texts: List[str],
+        max_batch_size: Optional[int] = None,
+        token_budget: Optional[int] = None
+    ) -> BatchPrediction:
+        """
+        Batch predict returning compact arrays instead of dictionaries
+
+        Args:
+            model_type: "binary" or "multiclass"
             texts: List of texts to classify
+            max_batch_size: Max inputs per batch (defaults to the active inference profile)
+            token_budget: Max padded tokens per batch (defaults to the active inference profile)
 
         Returns:
-            List of prediction dictionaries
+            BatchPrediction in input order
+
+        Raises:
+            PredictionException: If prediction fails
         """
         try:
-            results = self.binary_pipeline(texts)
-            # Handle both single result and batch results
-            if isinstance(results[0], list):
-                return [r[0] for r in results]
-            return results
+            return self._predict_bucketed(
+                self.registry.get(model_type),
+                texts,
+                max_batch_size,
+                token_budget
+            )
 
         except Exception as e:
-            error_msg = f"Batch binary prediction failed: {str(e)}"
+            error_msg = f"Batch {model_type} prediction failed: {str(e)}"
             logger.error(error_msg)
             raise PredictionException(error_msg)
 
-    def batch_predict_multiclass(self, texts: List[str]) -> List[Dict]:
+    def batch_predict_identified(
+        self,
+        model_type: str,
+        texts: List[str]
+    ) -> Tuple[List[Dict], Dict[str, str]]:
         """
-        Batch predict for multiple texts (multiclass)
+        Batch predict, also returning the identity of the model that ran
+
+        The identity comes from the same loaded-model record as the pipeline,
+        so predictions can be cached under the right key even if a swap lands
+        while they are being computed.
 
         Args:
+            model_type: "binary" or "multiclass"
             texts: List of texts to classify
 
         Returns:
-            List of prediction dictionaries
+            Tuple of (prediction dictionaries in input order, model identity
+            as returned by get_model_identity)
+
+        Raises:
+            PredictionException: If prediction fails
         """
         try:
-            results = self.multiclass_pipeline(texts)
-            # Handle both single result and batch results
-            if isinstance(results[0], list):
-                return [r[0] for r in results]
-            return results
+            record = self.registry.get_loaded(model_type)
+            predictions = self._predict_bucketed(record.pipeline, texts).to_dicts()
+            return predictions, record.identity
 
         except Exception as e:
-            error_msg = f"Batch multiclass prediction failed: {str(e)}"
+            error_msg = f"Batch {model_type} prediction failed: {str(e)}"
             logger.error(error_msg)
             raise PredictionException(error_msg)
 
+    def batch_predict_binary(self, texts: List[str]) -> List[Dict]:
+        """
+        Batch predict for multiple texts (binary)
+
+        Args:
+            texts: List of texts to classify
+
+        Returns:
+            List of prediction dictionaries
+        """
+        return self.batch_predict_arrays("binary", texts).to_dicts()
+
+    def batch_predict_multiclass(self, texts: List[str]) -> List[Dict]:
+        """
+        Batch predict for multiple texts (multiclass)
+
+        Args:
+            texts: List of texts to classify
+
+        Returns:
+            List of prediction dictionaries
+        """
+        return self.batch_predict_arrays("multiclass", texts).to_dicts()
+
+    def preload(self) -> None:
+        """
+        Load both models now instead of on first request
+
+        Raises:
+            ModelLoadException: If a model fails to load
+        """
+        start = time.perf_counter()
+        _ = self.binary_pipeline
+        logger.info("✓ Binary model loaded")
+        _ = self.multiclass_pipeline
+        logger.info("✓ Multiclass model loaded")
+        self._log_startup_report(time.perf_counter() - start)
+
+    def _log_startup_report(self, total: float) -> None:
+        """Log how long each model load step took"""
+        if not self.startup_timings:
+            return
+
+        logger.info("Model startup report:")
+        for step, seconds in self.startup_timings:
+            logger.info(f"  {step:<45} {seconds:>7.2f}s")
+        logger.info(f"  {'total':<45} {total:>7.2f}s")
+
+    def get_startup_report(self) -> Dict[str, float]:
+        """
+        Get the duration of each model load step
+
+        Returns:
+            Dictionary mapping step name to seconds
+        """
+        return {step: round(seconds, 3) for step, seconds in self.startup_timings}
+
     def is_loaded(self) -> Dict[str, bool]:
         """
         Check if models are loaded
@@ -195,22 +778,122 @@ class HuggingFaceService:
             Dictionary with load status of each model
         """
         return {
-            "binary": self._binary_pipeline is not None,
-            "multiclass": self._multiclass_pipeline is not None
+            "binary": self.registry.is_loaded("binary"),
+            "multiclass": self.registry.is_loaded("multiclass")
         }
 
-    def get_model_info(self) -> Dict[str, str]:
+    def get_model_revision(self, model_type: str) -> Optional[str]:
+        """
+        Get the resolved revision of an already loaded model
+
+        Does not trigger loading: returns None while the model is not loaded.
+
+        Args:
+            model_type: "binary" or "multiclass"
+
+        Returns:
+            Hub commit hash, a local id for models without one, or None if not loaded
+        """
+        return self.registry.get_revision(model_type)
+
+    def get_model_identity(self, model_type: str) -> Optional[Dict[str, str]]:
+        """
+        Get everything the predictions of a loaded model depend on
+
+        Does not trigger loading: returns None while the model is not loaded.
+
+        Args:
+            model_type: "binary" or "multiclass"
+
+        Returns:
+            Dictionary with the served model name, resolved revision and the
+            effective engine and precision, or None if not loaded
+        """
+        record = self.registry.current(model_type)
+        return record.identity if record is not None else None
+
+    def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about loaded models
 
+        Engine, precision and attention are the effective ones of each loaded
+        model (a requested bf16, int8 or sdpa may have fallen back), or None
+        while it is not loaded.
+
         Returns:
-            Dictionary with model names
+            Dictionary with model names, the configured settings and the
+            effective settings per model
         """
+        effective = {}
+        for model_type in ("binary", "multiclass"):
+            record = self.registry.current(model_type)
+            report = record.load_report if record is not None else {}
+            effective[model_type] = {
+                "engine": report.get("engine"),
+                "precision": report.get("precision"),
+                "attention": report.get("attention")
+            }
+
         return {
-            "binary_model": settings.BINARY_MODEL_NAME,
-            "multiclass_model": settings.MULTICLASS_MODEL_NAME
+            "binary_model": self.registry.get_model_name("binary"),
+            "multiclass_model": self.registry.get_model_name("multiclass"),
+            "configured": {
+                "engine": settings.INFERENCE_ENGINE,
+                "precision": settings.MODEL_PRECISION,
+                "attention": settings.ATTENTION_IMPL
+            },
+            "effective": effective
         }
 
+    def swap_model(
+        self,
+        model_type: str,
+        model_name: Optional[str] = None,
+        revision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a new model/revision in the background and swap it in when warm
+
+        Args:
+            model_type: "binary" or "multiclass"
+            model_name: New model (defaults to the current one)
+            revision: Hub branch, tag or commit (None = default branch)
+
+        Returns:
+            Swap status
+
+        Raises:
+            ValueError: If the model type is unknown
+            RuntimeError: If a swap of this model is already in progress
+        """
+        return self.registry.swap(model_type, model_name, revision)
+
+    def get_autotune_status(self) -> Dict[str, Any]:
+        """
+        Get the active inference profile (batch size, threads per lane)
+
+        Returns:
+            Autotune status dictionary
+        """
+        # Imported here: the autotune service depends on this module
+        from app.services.autotune_service import autotune_service
+        return autotune_service.get_status()
+
+    def get_registry_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get served models and swap progress
+
+        Returns:
+            Model type → status dictionary
+        """
+        return self.registry.get_status()
+
 
 # Global service instance
-huggingface_service = HuggingFaceService()
+# With MODEL_SERVER_ENABLED, API workers use the shared model server process
+# instead of each loading its own copy of the models
+if settings.MODEL_SERVER_ENABLED:
+    from app.services.model_server import ModelServerClient
+    huggingface_service = ModelServerClient(settings.MODEL_SERVER_SOCKET)
+else:
+    huggingface_service = HuggingFaceService()
@@ -0,0 +1,211 @@
+"""
+Inference Executor
+Dedicated, bounded thread pool for CPU-heavy model inference
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple
+import torch
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchLimits(NamedTuple):
+    """Length-bucketing limits of one forward pass, replaced as a pair"""
+    max_batch_size: int
+    token_budget: int
+
+
+class InferenceExecutor:
+    """
+    Runs model inference on a fixed number of worker lanes
+
+    asyncio's default pool lets every concurrent request run a forward pass
+    in its own thread, each using torch's full intra-op thread count, which
+    oversubscribes the cores. Here each lane is one thread whose torch
+    intra-op pool is sized so that lanes x threads matches the CPU count;
+    extra work waits in the executor queue instead.
+    """
+
+    def __init__(
+        self,
+        lanes: int,
+        threads_per_lane: int,
+        interop_threads: int,
+        max_batch_size: int,
+        token_budget: int
+    ):
+        """
+        Initialize inference executor
+
+        Args:
+            lanes: Number of concurrent inference lanes
+            threads_per_lane: torch intra-op threads per lane (0 = CPUs / lanes)
+            interop_threads: torch inter-op threads (0 = torch default)
+            max_batch_size: Max inputs per forward pass
+            token_budget: Max padded tokens per forward pass
+        """
+        self.lanes = max(1, lanes)
+        cpu_count = os.cpu_count() or 1
+        self.threads_per_lane = threads_per_lane or max(1, cpu_count // self.lanes)
+        # Active batch limits: the configured ones until an autotune profile is applied
+        self.batch_limits = BatchLimits(max_batch_size, token_budget)
+
+        if interop_threads > 0:
+            try:
+                torch.set_num_interop_threads(interop_threads)
+            except RuntimeError as e:
+                # Can only be set once, before any inter-op parallel work
+                logger.warning(f"Could not set torch inter-op threads: {e}")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.lanes,
+            thread_name_prefix="inference",
+            initializer=self._init_lane
+        )
+
+        # Statistics
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._started = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        logger.info(
+            f"Initializing Inference Executor: {self.lanes} lanes x "
+            f"{self.threads_per_lane} torch threads ({cpu_count} CPUs)"
+        )
+
+    def _init_lane(self):
+        """Size the torch intra-op pool of the calling lane thread"""
+        torch.set_num_threads(self.threads_per_lane)
+
+    def _wrap(self, fn: Callable[..., Any], args: tuple) -> Callable[[], Any]:
+        """Wrap a call so queue depth and wait time are tracked"""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def task():
+            # Picks up set_threads_per_lane() changes on already running lanes
+            if torch.get_num_threads() != self.threads_per_lane:
+                torch.set_num_threads(self.threads_per_lane)
+
+            wait = time.perf_counter() - submitted
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._started += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        return task
+
+    def set_threads_per_lane(self, threads_per_lane: int) -> None:
+        """
+        Change the torch intra-op thread count of every lane
+
+        Applied by each lane before its next task.
+
+        Args:
+            threads_per_lane: New thread count (>= 1)
+        """
+        self.threads_per_lane = max(1, threads_per_lane)
+        logger.info(f"Inference lanes now use {self.threads_per_lane} torch threads each")
+
+    def set_batch_limits(self, max_batch_size: int, token_budget: int) -> None:
+        """
+        Change the batch limits used by the next forward passes
+
+        Args:
+            max_batch_size: Max inputs per forward pass (>= 1)
+            token_budget: Max padded tokens per forward pass (>= 1)
+        """
+        # One assignment: a forward pass never sees a half-applied pair
+        self.batch_limits = BatchLimits(max(1, max_batch_size), max(1, token_budget))
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking inference function on an inference lane
+
+        If the caller is cancelled while the call is still queued, the call
+        is dropped; a call already running on a lane runs to completion.
+
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        future = self._executor.submit(self._wrap(fn, args))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+                    self._cancelled += 1
+            raise
+
+    def run_sync(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        Run an inference function on an inference lane and wait for it
+        (for callers outside the event loop, e.g. model server threads)
+
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        return self._executor.submit(self._wrap(fn, args)).result()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with lane configuration, queue depth and wait times
+        """
+        with self._lock:
+            return {
+                "lanes": self.lanes,
+                "threads_per_lane": self.threads_per_lane,
+                "max_batch_size": self.batch_limits.max_batch_size,
+                "token_budget": self.batch_limits.token_budget,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "avg_wait_ms": (
+                    self._total_wait / self._started * 1000 if self._started else 0.0
+                ),
+                "max_wait_ms": self._max_wait * 1000
+            }
+
+
+# Global service instance
+inference_executor = InferenceExecutor(
+    settings.INFERENCE_LANES,
+    settings.INFERENCE_THREADS_PER_LANE,
+    settings.TORCH_INTEROP_THREADS,
+    settings.INFERENCE_MAX_BATCH_SIZE,
+    settings.INFERENCE_TOKEN_BUDGET
+)
@@ -0,0 +1,352 @@
+"""
+LLM Dispatcher
+Shared, rate-limited access to the LLM providers for every request
+
+All description calls of all requests go through one dispatcher per
+provider, which enforces:
+- a concurrency cap on in-flight calls,
+- token buckets for requests/min and tokens/min (provider quotas),
+- 429 handling: the whole dispatcher pauses for the provider's Retry-After
+  and the call is retried,
+- fair sharing: waiting calls are granted round-robin across owners
+  (one owner per processed batch), so one large CSV cannot starve others,
+- a circuit breaker: while the provider is down or degraded, calls fail
+  fast with CircuitOpenError instead of waiting for timeouts.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+import openai
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+logger = get_logger(__name__)
+
+# Rough characters per token of Spanish prompts (used before usage is known)
+CHARS_PER_TOKEN = 3
+
+_anonymous_owners = itertools.count()
+
+
+def estimate_tokens(prompt_chars: int, max_tokens: int) -> int:
+    """Tokens a call may consume: prompt estimate plus the completion budget"""
+    return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """Whether an error says the provider is unhealthy (timeouts, connection errors, 5xx)"""
+    if isinstance(error, openai.APIConnectionError):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+
+class TokenBucket:
+    """
+    Continuously refilled budget of units per minute
+
+    Reservations may overdraw the bucket; the caller then waits until the
+    debt is repaid, so reservations made in order are also served in order.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: Budget per minute (<= 0 = unlimited)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take units from the bucket
+
+        Args:
+            amount: Units to take (capped at the capacity)
+
+        Returns:
+            Seconds to wait before using them
+        """
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def adjust(self, amount: float) -> None:
+        """Charge (or refund, if negative) units after the fact"""
+        if not self.unlimited:
+            self._refill()
+            self.level = min(self.capacity, self.level - amount)
+
+
+class LLMDispatcher:
+    """
+    Rate-limited, fair, bounded-concurrency executor of LLM calls for one provider
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_concurrency: int,
+        max_retries: int,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Args:
+            provider: Provider name (for logging and metrics)
+            requests_per_minute: RPM quota (<= 0 = unlimited)
+            tokens_per_minute: TPM quota (<= 0 = unlimited)
+            max_concurrency: Max in-flight calls
+            max_retries: Retries of a call rejected with 429
+            breaker: Circuit breaker of the provider (None = disabled)
+        """
+        self.provider = provider
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.breaker = breaker
+
+        self._active = 0
+        self._queues: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+        self._paused_until = 0.0
+
+        # Statistics
+        self.calls = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.tokens_used = 0
+        self._total_queue_wait = 0.0
+        self._total_rate_wait = 0.0
+
+    # ========== Fair slot scheduling ==========
+
+    def _grant(self) -> None:
+        """Hand free slots to waiting calls, round-robin across owners"""
+        while self._active < self.max_concurrency and self._queues:
+            owner, queue = self._queues.popitem(last=False)
+            waiter = queue.popleft()
+            if queue:
+                self._queues[owner] = queue
+            if waiter.done():
+                # Caller was cancelled while waiting
+                continue
+            self._active += 1
+            waiter.set_result(None)
+
+    async def _acquire(self, owner: Hashable) -> None:
+        """Wait for a concurrency slot in the owner's turn"""
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(owner, deque()).append(waiter)
+        self._grant()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._grant()
+
+    # ========== Rate limiting ==========
+
+    async def _wait_for_budget(self, estimated_tokens: int, reserve: bool = True) -> None:
+        """
+        Sleep until the provider pause is over and both buckets allow the call
+
+        Args:
+            estimated_tokens: Tokens to reserve from the TPM bucket
+            reserve: Take a request and the tokens from the buckets; False for
+                a retry after a 429, which reuses the rejected attempt's reservation
+        """
+        wait = self._paused_until - time.monotonic()
+        if reserve:
+            wait = max(wait, self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            self._total_rate_wait += wait
+            await asyncio.sleep(wait)
+
+    def _backoff(self, error: openai.RateLimitError, attempt: int) -> float:
+        """Seconds to pause after a 429 (Retry-After if given, else exponential)"""
+        headers = error.response.headers if error.response is not None else {}
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
+        return min(60.0, 2 ** attempt) * (0.5 + random.random() / 2)
+
+    # ========== Public API ==========
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        estimated_tokens: int,
+        owner: Optional[Hashable] = None
+    ) -> Any:
+        """
+        Run one LLM call under the concurrency cap, quotas and fair sharing
+
+        Args:
+            fn: Zero-argument coroutine function doing the API call
+            estimated_tokens: Tokens the call may consume (prompt + max completion)
+            owner: Caller identity for fair sharing (e.g. one per batch);
+                None = an owner of its own
+
+        Returns:
+            Result of fn (its .usage, if present, corrects the token estimate)
+
+        Raises:
+            CircuitOpenError: If the provider's circuit breaker rejects the call
+            openai.RateLimitError: If still rate limited after max_retries
+            Exception: Any other error of fn
+        """
+        if owner is None:
+            owner = f"anonymous-{next(_anonymous_owners)}"
+
+        # Fail fast without queueing while the breaker is open
+        if self.breaker is not None and self.breaker.reject_if_open():
+            raise CircuitOpenError(self.provider)
+
+        queued_at = time.monotonic()
+        await self._acquire(owner)
+        self._total_queue_wait += time.monotonic() - queued_at
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                admitted = self.breaker.acquire() if self.breaker is not None else None
+                if self.breaker is not None and admitted is None:
+                    raise CircuitOpenError(self.provider)
+
+                healthy = None
+                started = time.monotonic()
+                try:
+                    # A rejected attempt consumed nothing: its retry keeps the same reservation
+                    await self._wait_for_budget(estimated_tokens, reserve=attempt == 0)
+                    started = time.monotonic()
+                    result = await fn()
+                    healthy = True
+                except openai.RateLimitError as e:
+                    self.rate_limited += 1
+                    if attempt == self.max_retries:
+                        self.failures += 1
+                        raise
+                    pause = self._backoff(e, attempt)
+                    self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                    logger.warning(
+                        f"⏳ {self.provider} rate limit (429), pausing {pause:.1f}s "
+                        f"(retry {attempt + 1}/{self.max_retries})"
+                    )
+                    continue
+                except Exception as e:
+                    self.failures += 1
+                    healthy = False if is_provider_failure(e) else None
+                    raise
+                finally:
+                    if admitted is not None:
+                        self.breaker.record(admitted, healthy, time.monotonic() - started)
+
+                self.calls += 1
+                usage = getattr(result, "usage", None)
+                used = getattr(usage, "total_tokens", None) or estimated_tokens
+                self.tokens.adjust(used - estimated_tokens)
+                self.tokens_used += used
+                return result
+        finally:
+            self._release()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get dispatcher statistics
+
+        Returns:
+            Dictionary with limits, in-flight/queued calls, 429s and waits
+        """
+        started = self.calls + self.failures
+        return {
+            "provider": self.provider,
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests.capacity,
+            "tokens_per_minute": self.tokens.capacity,
+            "active": self._active,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "waiting_owners": len(self._queues),
+            "calls": self.calls,
+            "failures": self.failures,
+            "rate_limited": self.rate_limited,
+            "tokens_used": self.tokens_used,
+            "avg_queue_wait_ms": self._total_queue_wait / started * 1000 if started else 0.0,
+            "total_rate_wait_s": round(self._total_rate_wait, 2),
+            "circuit_breaker": self.breaker.get_stats() if self.breaker is not None else None
+        }
+
+
+_dispatchers: Dict[str, LLMDispatcher] = {}
+
+
+def get_dispatcher(provider: str) -> LLMDispatcher:
+    """
+    Get the shared dispatcher of a provider, creating it on first use
+
+    Args:
+        provider: "groq" or "openai"
+
+    Returns:
+        LLMDispatcher configured with the provider's quotas
+    """
+    if provider not in _dispatchers:
+        rpm, tpm = {
+            "groq": (settings.GROQ_REQUESTS_PER_MINUTE, settings.GROQ_TOKENS_PER_MINUTE),
+            "openai": (settings.OPENAI_REQUESTS_PER_MINUTE, settings.OPENAI_TOKENS_PER_MINUTE)
+        }[provider]
+        breaker = None
+        if settings.LLM_BREAKER_ENABLED:
+            breaker = CircuitBreaker(
+                provider,
+                settings.LLM_BREAKER_WINDOW,
+                settings.LLM_BREAKER_MIN_CALLS,
+                settings.LLM_BREAKER_FAILURE_RATE,
+                settings.LLM_BREAKER_SLOW_CALL_MS,
+                settings.LLM_BREAKER_OPEN_S,
+                settings.LLM_BREAKER_PROBES
+            )
+        _dispatchers[provider] = LLMDispatcher(
+            provider,
+            rpm,
+            tpm,
+            settings.LLM_MAX_CONCURRENCY,
+            settings.LLM_MAX_RETRIES,
+            breaker
+        )
+        logger.info(
+            f"Initializing LLM dispatcher for {provider}: {rpm} req/min, {tpm} tokens/min, "
+            f"{settings.LLM_MAX_CONCURRENCY} concurrent"
+        )
+    return _dispatchers[provider]
+
+
+def get_dispatcher_stats() -> Dict[str, Dict]:
+    """Get statistics of every dispatcher created so far"""
+    return {provider: d.get_stats() for provider, d in _dispatchers.items()}
@@ -0,0 +1,336 @@
+"""
+Model Registry
+Load-once model slots with background reload and atomic hot swap
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Swap states reported by get_status()
+SWAP_IDLE = "idle"
+SWAP_LOADING = "loading"
+SWAP_WARMING = "warming_up"
+SWAP_COMPLETED = "completed"
+SWAP_FAILED = "failed"
+
+
+def local_revision(model_name: str) -> Optional[str]:
+    """
+    Revision identifier for a model stored in a local directory
+
+    Local checkpoints have no Hub commit hash; the path plus the size and
+    modification time of its files changes whenever the checkpoint is
+    replaced, so revision-keyed caches are not shared across checkpoints.
+
+    Args:
+        model_name: Model path
+
+    Returns:
+        "local-<hash>", or None if model_name is not a local directory
+    """
+    if not os.path.isdir(model_name):
+        return None
+
+    digest = hashlib.sha1(os.path.abspath(model_name).encode())
+    for name in sorted(os.listdir(model_name)):
+        stat = os.stat(os.path.join(model_name, name))
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return f"local-{digest.hexdigest()[:12]}"
+
+
+def hub_commit(model_name: str, revision: Optional[str] = None) -> str:
+    """
+    Commit hash a Hub model name + revision currently points to
+
+    Args:
+        model_name: Model identifier on HuggingFace Hub
+        revision: Hub branch, tag or commit (None = default branch)
+
+    Returns:
+        Full commit hash
+
+    Raises:
+        RepositoryNotFoundError: If the model does not exist (or is not accessible)
+        RevisionNotFoundError: If the revision does not exist
+        OSError: If the Hub cannot be reached
+    """
+    from huggingface_hub import HfApi
+    return HfApi().model_info(
+        model_name,
+        revision=revision,
+        token=settings.HUGGINGFACE_TOKEN
+    ).sha
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """
+    Everything about one loaded model, replaced as a whole on a swap
+
+    Readers take slot.current once and use that record, so a pipeline is
+    never paired with the revision or load report of another model.
+    """
+    pipeline: Any
+    model_name: str
+    revision: Optional[str]           # Requested branch, tag or commit
+    resolved_revision: str            # Commit (or local id) actually loaded
+    loaded_at: str
+    load_report: Dict[str, Any]       # Effective engine, precision, attention...
+
+    @property
+    def identity(self) -> Dict[str, str]:
+        """Everything the predictions of this model depend on"""
+        return {
+            "model_name": self.model_name,
+            "revision": self.resolved_revision,
+            "engine": self.load_report.get("engine", settings.INFERENCE_ENGINE.lower()),
+            "precision": self.load_report.get("precision", settings.MODEL_PRECISION.lower())
+        }
+
+
+class ModelSlot:
+    """
+    One served model: the current loaded model plus the swap in progress
+    """
+
+    def __init__(self, model_type: str, model_name: str, revision: Optional[str]):
+        self.model_type = model_type
+        # Model loaded on first use (a swap installs its own record)
+        self.model_name = model_name
+        self.revision = revision
+
+        self.current: Optional[LoadedModel] = None
+
+        # Serializes first load and swaps of this slot
+        self.load_lock = threading.Lock()
+        self.swap: Dict[str, Any] = {"state": SWAP_IDLE}
+
+
+class ModelRegistry:
+    """
+    Owns the binary and multiclass pipelines
+
+    Each model is loaded exactly once even under concurrent first requests
+    (double-checked per-model lock). A swap loads and warms a new model or
+    revision in a background thread while the current one keeps serving,
+    then replaces the slot's LoadedModel record in one assignment: callers
+    that already took the old record finish on it, new calls get the new one.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[str, str, Optional[str], bool], Tuple[Any, Dict[str, Any]]],
+        warmup_fn: Callable[[Any], None],
+        revision_fn: Callable[[Any, str], Optional[str]]
+    ):
+        """
+        Initialize registry
+
+        Args:
+            load_fn: (model_name, model_type, revision, use_snapshot) -> (pipeline, load report)
+            warmup_fn: Runs a small prediction on a freshly loaded pipeline
+            revision_fn: (pipeline, model_name) -> resolved revision
+        """
+        self._load_fn = load_fn
+        self._warmup_fn = warmup_fn
+        self._revision_fn = revision_fn
+        self._slots: Dict[str, ModelSlot] = {}
+        self._swap_lock = threading.Lock()
+
+    def register(self, model_type: str, model_name: str, revision: Optional[str] = None):
+        """
+        Declare a model (it is loaded on first get())
+
+        Args:
+            model_type: "binary" or "multiclass"
+            model_name: Model identifier on HuggingFace Hub (or local path)
+            revision: Hub branch, tag or commit (None = default branch)
+        """
+        self._slots[model_type] = ModelSlot(model_type, model_name, revision)
+
+    def _build_record(
+        self,
+        pipe: Any,
+        load_report: Dict[str, Any],
+        model_name: str,
+        revision: Optional[str]
+    ) -> LoadedModel:
+        """Describe a loaded pipeline before it is installed"""
+        return LoadedModel(
+            pipeline=pipe,
+            model_name=model_name,
+            revision=revision,
+            resolved_revision=self._revision_fn(pipe, model_name),
+            loaded_at=datetime.now(timezone.utc).isoformat(),
+            load_report=load_report
+        )
+
+    def get_loaded(self, model_type: str) -> LoadedModel:
+        """
+        Get the loaded model record, loading it on first use
+
+        Args:
+            model_type: "binary" or "multiclass"
+
+        Returns:
+            Current LoadedModel
+
+        Raises:
+            ModelLoadException: If the model fails to load
+        """
+        slot = self._slots[model_type]
+        record = slot.current
+        if record is not None:
+            return record
+
+        with slot.load_lock:
+            # Another thread may have loaded it while we waited
+            if slot.current is None:
+                pipe, report = self._load_fn(slot.model_name, model_type, slot.revision, True)
+                slot.current = self._build_record(pipe, report, slot.model_name, slot.revision)
+            return slot.current
+
+    def get(self, model_type: str) -> Any:
+        """
+        Get the pipeline of a model, loading it on first use
+
+        Args:
+            model_type: "binary" or "multiclass"
+
+        Returns:
+            Current pipeline
+
+        Raises:
+            ModelLoadException: If the model fails to load
+        """
+        return self.get_loaded(model_type).pipeline
+
+    def current(self, model_type: str) -> Optional[LoadedModel]:
+        """Loaded model record, or None if not loaded (does not load it)"""
+        return self._slots[model_type].current
+
+    def is_loaded(self, model_type: str) -> bool:
+        """Check if a model is loaded (without loading it)"""
+        return self._slots[model_type].current is not None
+
+    def get_revision(self, model_type: str) -> Optional[str]:
+        """Resolved revision of the loaded model, or None if not loaded"""
+        record = self._slots[model_type].current
+        return record.resolved_revision if record is not None else None
+
+    def get_model_name(self, model_type: str) -> str:
+        """Name of the model currently served (or to be loaded)"""
+        slot = self._slots[model_type]
+        record = slot.current
+        return record.model_name if record is not None else slot.model_name
+
+    def swap(
+        self,
+        model_type: str,
+        model_name: Optional[str] = None,
+        revision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Start loading a new model/revision in the background and swap it in
+
+        Args:
+            model_type: "binary" or "multiclass"
+            model_name: New model (defaults to the current one)
+            revision: New revision (None = default branch)
+
+        Returns:
+            Swap status
+
+        Raises:
+            ValueError: If the model type is unknown
+            RuntimeError: If a swap of this model is already in progress
+        """
+        if model_type not in self._slots:
+            raise ValueError(f"Unknown model type: {model_type}")
+
+        slot = self._slots[model_type]
+        target = model_name or self.get_model_name(model_type)
+
+        with self._swap_lock:
+            if slot.swap["state"] in (SWAP_LOADING, SWAP_WARMING):
+                raise RuntimeError(f"A swap of the {model_type} model is already in progress")
+
+            slot.swap = {
+                "state": SWAP_LOADING,
+                "model_name": target,
+                "revision": revision,
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "finished_at": None,
+                "error": None
+            }
+
+        threading.Thread(
+            target=self._run_swap,
+            args=(slot, target, revision),
+            name=f"model-swap-{model_type}",
+            daemon=True
+        ).start()
+
+        return dict(slot.swap)
+
+    def _run_swap(self, slot: ModelSlot, model_name: str, revision: Optional[str]):
+        """Background part of a swap: load, warm up, install"""
+        start = time.perf_counter()
+        try:
+            logger.info(f"Swap: loading {slot.model_type} model '{model_name}' @ {revision or 'default'}")
+            # Always resolve a swap against the source, never the local snapshot
+            pipe, report = self._load_fn(model_name, slot.model_type, revision, False)
+
+            slot.swap["state"] = SWAP_WARMING
+            self._warmup_fn(pipe)
+            record = self._build_record(pipe, report, model_name, revision)
+
+            with slot.load_lock:
+                previous = slot.current.resolved_revision if slot.current is not None else None
+                # Pipeline, revision and load report change in one assignment
+                slot.current = record
+
+            slot.swap.update({
+                "state": SWAP_COMPLETED,
+                "previous_revision": previous,
+                "resolved_revision": record.resolved_revision,
+                "duration_s": round(time.perf_counter() - start, 2)
+            })
+            logger.info(
+                f"✓ {slot.model_type.capitalize()} model swapped: "
+                f"{previous} → {record.resolved_revision} ({slot.swap['duration_s']}s)"
+            )
+        except Exception as e:
+            slot.swap.update({"state": SWAP_FAILED, "error": str(e)})
+            logger.error(f"Swap of {slot.model_type} model failed, keeping current model: {e}")
+        finally:
+            slot.swap["finished_at"] = datetime.now(timezone.utc).isoformat()
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the served model and swap progress of every slot
+
+        Returns:
+            Model type → status dictionary
+        """
+        status = {}
+        for model_type, slot in self._slots.items():
+            record = slot.current
+            status[model_type] = {
+                "model_name": record.model_name if record is not None else slot.model_name,
+                "revision": record.revision if record is not None else slot.revision,
+                "resolved_revision": record.resolved_revision if record is not None else None,
+                "loaded": record is not None,
+                "loaded_at": record.loaded_at if record is not None else None,
+                "swap": dict(slot.swap)
+            }
+        return status
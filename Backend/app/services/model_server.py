@@ -0,0 +1,331 @@
+"""
+Model Server
+Out-of-process owner of the classifier pipelines, shared by all uvicorn workers
+
+With WORKERS>1 every worker would otherwise load its own copy of both BERT
+models. The model server loads them once and serves predictions over a Unix
+socket; each API worker uses ModelServerClient, which keeps the
+HuggingFaceService prediction interface.
+
+Run it before starting the API (from Backend/), with the same
+MODEL_SERVER_AUTHKEY in both environments:
+    MODEL_SERVER_ENABLED=true python -m app.services.model_server
+"""
+
+import os
+import queue
+import stat
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.exceptions import ModelLoadException, PredictionException
+from app.services.inference_executor import inference_executor
+
+logger = get_logger(__name__)
+
+# Methods of HuggingFaceService that run on the inference executor lanes
+INFERENCE_METHODS = {
+    "predict_binary",
+    "predict_multiclass",
+    "batch_predict_binary",
+    "batch_predict_multiclass",
+    "batch_predict_arrays",
+    "batch_predict_identified",
+}
+
+# Methods of HuggingFaceService that clients are allowed to call
+EXPOSED_METHODS = INFERENCE_METHODS | {
+    "preload",
+    "is_loaded",
+    "get_model_info",
+    "get_model_revision",
+    "get_model_identity",
+    "get_startup_report",
+    "swap_model",
+    "get_registry_status",
+    "get_autotune_status",
+}
+
+
+def _authkey() -> bytes:
+    """
+    Shared secret of the model server connection
+
+    Connections exchange pickles, so an unauthenticated peer could run code
+    in the model server: there is no default key.
+
+    Raises:
+        RuntimeError: If MODEL_SERVER_AUTHKEY is not set
+    """
+    if not settings.MODEL_SERVER_AUTHKEY:
+        raise RuntimeError(
+            "MODEL_SERVER_AUTHKEY is not set - refusing to start the model server connection"
+        )
+    return settings.MODEL_SERVER_AUTHKEY.encode()
+
+
+def _prepare_socket_dir(address: str) -> None:
+    """
+    Create the socket directory (0700) and check no other user can write to it
+
+    Raises:
+        RuntimeError: If the directory is writable by other users or owned by
+            someone else (they could replace the socket)
+    """
+    directory = os.path.dirname(os.path.abspath(address))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    info = os.stat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise RuntimeError(
+            f"Model server socket directory {directory} must be owned and writable "
+            f"only by the current user (e.g. chmod 700 {directory})"
+        )
+
+
+def _handle_connection(conn: Connection, service) -> None:
+    """Serve calls from one client connection until it closes"""
+    try:
+        while True:
+            try:
+                method, args = conn.recv()
+            except EOFError:
+                break
+
+            if method not in EXPOSED_METHODS:
+                conn.send(("error", f"Method not allowed: {method}"))
+                continue
+
+            try:
+                fn = getattr(service, method)
+                if method in INFERENCE_METHODS:
+                    result = inference_executor.run_sync(fn, *args)
+                else:
+                    result = fn(*args)
+                conn.send(("ok", result))
+            except Exception as e:
+                conn.send(("error", str(e)))
+    finally:
+        conn.close()
+
+
+def serve(address: str = None) -> None:
+    """
+    Load the models and serve predictions until interrupted
+
+    Args:
+        address: Unix socket path (defaults to settings.MODEL_SERVER_SOCKET)
+    """
+    # Imported here: huggingface_service imports this module for the client
+    from app.services.huggingface_service import HuggingFaceService
+    from app.services.autotune_service import autotune_service
+
+    address = address or settings.MODEL_SERVER_SOCKET
+    authkey = _authkey()
+    _prepare_socket_dir(address)
+
+    service = HuggingFaceService()
+    service.preload()
+    autotune_service.apply_startup_profile()
+
+    # Remove a stale socket left by a previous run
+    if os.path.exists(address):
+        os.unlink(address)
+
+    # Owner-only socket; umask closes the window between bind and chmod
+    previous_umask = os.umask(0o177)
+    try:
+        listener = Listener(address, family="AF_UNIX", authkey=authkey)
+    finally:
+        os.umask(previous_umask)
+    os.chmod(address, 0o600)
+    logger.info(f"✓ Model server listening on {address}")
+
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                logger.warning(f"Rejected model server connection: {e}")
+                continue
+            threading.Thread(
+                target=_handle_connection,
+                args=(conn, service),
+                daemon=True
+            ).start()
+    except KeyboardInterrupt:
+        logger.info("Shutting down model server")
+    finally:
+        listener.close()
+
+
+class ModelServerClient:
+    """
+    Thin client with the same prediction interface as HuggingFaceService
+
+    Keeps a small pool of connections so concurrent executor threads do
+    not serialize on a single socket.
+    """
+
+    def __init__(self, address: str):
+        """
+        Initialize client (connections are opened lazily)
+
+        Args:
+            address: Unix socket path of the model server
+
+        Raises:
+            RuntimeError: If MODEL_SERVER_AUTHKEY is not set
+        """
+        logger.info(f"Initializing Model Server Client ({address})")
+        self.address = address
+        self._authkey = _authkey()
+        self._pool: "queue.LifoQueue[Connection]" = queue.LifoQueue()
+
+    def _connect(self) -> Connection:
+        """Open a new authenticated connection"""
+        return Client(self.address, family="AF_UNIX", authkey=self._authkey)
+
+    def _call(self, method: str, *args) -> Any:
+        """
+        Call a service method on the model server
+
+        Raises:
+            PredictionException: If the server is unreachable or the call fails
+        """
+        for attempt in range(2):
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                try:
+                    conn = self._connect()
+                except (OSError, EOFError) as e:
+                    raise PredictionException(
+                        f"Model server unavailable at {self.address}: {e}",
+                        details={"method": method}
+                    )
+
+            try:
+                conn.send((method, args))
+                status, payload = conn.recv()
+            except (OSError, EOFError):
+                # Server restarted: drop the stale connection and retry once
+                conn.close()
+                if attempt == 0:
+                    continue
+                raise PredictionException(
+                    f"Model server connection lost during '{method}'",
+                    details={"method": method}
+                )
+
+            self._pool.put(conn)
+            if status == "error":
+                raise PredictionException(payload, details={"method": method})
+            return payload
+
+    def predict_binary(self, text: str) -> Dict:
+        """Predict if text is a valid requirement (binary classification)"""
+        return self._call("predict_binary", text)
+
+    def predict_multiclass(self, text: str) -> Dict:
+        """Predict usability subcharacteristic (multiclass classification)"""
+        return self._call("predict_multiclass", text)
+
+    def batch_predict_binary(self, texts: List[str]) -> List[Dict]:
+        """Batch predict for multiple texts (binary)"""
+        return self._call("batch_predict_binary", texts)
+
+    def batch_predict_multiclass(self, texts: List[str]) -> List[Dict]:
+        """Batch predict for multiple texts (multiclass)"""
+        return self._call("batch_predict_multiclass", texts)
+
+    def batch_predict_arrays(self, model_type: str, texts: List[str]):
+        """Batch predict returning compact arrays (BatchPrediction)"""
+        return self._call("batch_predict_arrays", model_type, texts)
+
+    def batch_predict_identified(self, model_type: str, texts: List[str]) -> Tuple[List[Dict], Dict[str, str]]:
+        """Batch predict, also returning the identity of the model that ran"""
+        return self._call("batch_predict_identified", model_type, texts)
+
+    def preload(self) -> None:
+        """Make sure the model server has both models loaded"""
+        try:
+            self._call("preload")
+        except PredictionException as e:
+            raise ModelLoadException(e.message, details=e.details)
+
+    def is_loaded(self) -> Dict[str, bool]:
+        """Check if models are loaded on the model server"""
+        try:
+            return self._call("is_loaded")
+        except PredictionException:
+            return {"binary": False, "multiclass": False}
+
+    def get_model_info(self) -> Dict[str, str]:
+        """Get information about the models served"""
+        try:
+            info = self._call("get_model_info")
+        except PredictionException:
+            info = {
+                "binary_model": settings.BINARY_MODEL_NAME,
+                "multiclass_model": settings.MULTICLASS_MODEL_NAME
+            }
+        info["model_server"] = self.address
+        return info
+
+    def get_startup_report(self) -> Dict[str, float]:
+        """Get the model load timings of the model server"""
+        try:
+            return self._call("get_startup_report")
+        except PredictionException:
+            return {}
+
+    def swap_model(
+        self,
+        model_type: str,
+        model_name: Optional[str] = None,
+        revision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Hot-swap a model on the model server
+
+        Raises:
+            RuntimeError: If the swap cannot be started
+        """
+        try:
+            status = self._call("swap_model", model_type, model_name, revision)
+        except PredictionException as e:
+            raise RuntimeError(e.message)
+        return status
+
+    def get_autotune_status(self) -> Dict[str, Any]:
+        """Get the inference profile active on the model server"""
+        return self._call("get_autotune_status")
+
+    def get_registry_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get served models and swap progress of the model server"""
+        return self._call("get_registry_status")
+
+    def get_model_identity(self, model_type: str) -> Optional[Dict[str, str]]:
+        """
+        Get the served name, revision, engine and precision of a model
+
+        Not cached: a swap triggered through another worker must change the
+        cache keys of this one right away. Predictions carry their own
+        identity (batch_predict_identified), so this is only used for lookups.
+        """
+        try:
+            return self._call("get_model_identity", model_type)
+        except PredictionException:
+            return None
+
+    def get_model_revision(self, model_type: str) -> Optional[str]:
+        """Get the resolved revision of a loaded model"""
+        identity = self.get_model_identity(model_type)
+        return identity["revision"] if identity is not None else None
+
+
+if __name__ == "__main__":
+    serve()
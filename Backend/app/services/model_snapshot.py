@@ -0,0 +1,230 @@
+"""
+Model Snapshot Store
+One-time materialization of both classifiers into a local directory
+
+Loading from Hub names resolves every file against the Hub (or its cache)
+on each start. A snapshot stores each model as safetensors (memory-mapped
+on load) plus its tokenizer, and a manifest with the resolved revisions and
+file hashes, so restarts load fully offline.
+
+Materialize once (from Backend/), e.g. at image build time:
+    python -m app.services.model_snapshot
+    python -m app.services.model_snapshot --verify
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MANIFEST_FILE = "manifest.json"
+
+
+def _manifest_path() -> str:
+    """Path of the snapshot manifest"""
+    return os.path.join(settings.MODEL_SNAPSHOT_DIR, SNAPSHOT_MANIFEST_FILE)
+
+
+def _configured_models() -> Dict[str, Tuple[str, Optional[str]]]:
+    """Model type → configured (model name, revision)"""
+    return {
+        "binary": (settings.BINARY_MODEL_NAME, settings.BINARY_MODEL_REVISION),
+        "multiclass": (settings.MULTICLASS_MODEL_NAME, settings.MULTICLASS_MODEL_REVISION)
+    }
+
+
+def _sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest() -> Dict:
+    """
+    Read the snapshot manifest
+
+    Returns:
+        Manifest dictionary (empty if no snapshot has been materialized)
+    """
+    path = _manifest_path()
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_snapshot(
+    model_type: str,
+    model_name: str,
+    revision: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Find the snapshot of a model, if one matches the configured name
+
+    Args:
+        model_type: "binary" or "multiclass"
+        model_name: Configured model identifier
+        revision: Requested revision (None = whatever was materialized)
+
+    Returns:
+        Manifest entry with an added "path" key, or None if there is no
+        usable snapshot (disabled, not materialized, or a different model)
+    """
+    if not settings.MODEL_SNAPSHOT_ENABLED:
+        return None
+
+    entry = read_manifest().get("models", {}).get(model_type)
+    if entry is None:
+        return None
+
+    if entry["model_name"] != model_name:
+        logger.warning(
+            f"Snapshot of {model_type} model is '{entry['model_name']}' but "
+            f"'{model_name}' is configured - ignoring snapshot"
+        )
+        return None
+
+    if revision is not None and revision not in (entry.get("requested_revision"), entry["revision"]):
+        logger.warning(
+            f"Snapshot of {model_type} model is at revision {entry['revision']} but "
+            f"'{revision}' is requested - ignoring snapshot"
+        )
+        return None
+
+    path = os.path.join(settings.MODEL_SNAPSHOT_DIR, model_type)
+    if not all(os.path.exists(os.path.join(path, name)) for name in entry["files"]):
+        logger.warning(f"Snapshot of {model_type} model is incomplete - ignoring snapshot")
+        return None
+
+    return {**entry, "path": path}
+
+
+def materialize(model_types: Optional[List[str]] = None) -> Dict:
+    """
+    Download the configured models and store them as a local snapshot
+
+    Args:
+        model_types: Models to materialize (defaults to both)
+
+    Returns:
+        Updated manifest
+    """
+    import transformers
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    manifest = read_manifest()
+    manifest.setdefault("models", {})
+
+    for model_type, (model_name, revision) in _configured_models().items():
+        if model_types and model_type not in model_types:
+            continue
+
+        start = time.perf_counter()
+        path = os.path.join(settings.MODEL_SNAPSHOT_DIR, model_type)
+        logger.info(f"Materializing {model_type} model '{model_name}' into {path}")
+
+        tokenizer = AutoTokenizer.from_pretrained(
+            model_name,
+            revision=revision,
+            token=settings.HUGGINGFACE_TOKEN
+        )
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name,
+            revision=revision,
+            token=settings.HUGGINGFACE_TOKEN
+        )
+
+        os.makedirs(path, exist_ok=True)
+        model.save_pretrained(path, safe_serialization=True)
+        tokenizer.save_pretrained(path)
+
+        files = sorted(
+            name for name in os.listdir(path)
+            if os.path.isfile(os.path.join(path, name))
+        )
+        manifest["models"][model_type] = {
+            "model_name": model_name,
+            "requested_revision": revision,
+            "revision": getattr(model.config, "_commit_hash", None),
+            "files": {name: _sha256(os.path.join(path, name)) for name in files},
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "transformers_version": transformers.__version__
+        }
+        logger.info(
+            f"✓ {model_type.capitalize()} snapshot ready "
+            f"({len(files)} files, {time.perf_counter() - start:.1f}s)"
+        )
+
+    # Write the manifest last and atomically: it is what marks a snapshot usable
+    os.makedirs(settings.MODEL_SNAPSHOT_DIR, exist_ok=True)
+    tmp_path = _manifest_path() + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, _manifest_path())
+
+    return manifest
+
+
+def verify() -> Dict[str, List[str]]:
+    """
+    Check snapshot files against the manifest hashes
+
+    Returns:
+        Model type → list of missing or modified files (empty when intact)
+    """
+    problems: Dict[str, List[str]] = {}
+    for model_type, entry in read_manifest().get("models", {}).items():
+        path = os.path.join(settings.MODEL_SNAPSHOT_DIR, model_type)
+        problems[model_type] = [
+            name for name, expected in entry["files"].items()
+            if not os.path.exists(os.path.join(path, name))
+            or _sha256(os.path.join(path, name)) != expected
+        ]
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Materialize or verify the model snapshots"""
+    parser = argparse.ArgumentParser(description="Local model snapshot store")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="check the existing snapshot against the manifest instead of materializing"
+    )
+    parser.add_argument(
+        "--model",
+        choices=["binary", "multiclass"],
+        action="append",
+        help="only materialize this model (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        problems = verify()
+        if not problems:
+            raise SystemExit(f"No snapshot found in {settings.MODEL_SNAPSHOT_DIR}")
+        for model_type, files in problems.items():
+            status = "OK" if not files else f"CORRUPT ({', '.join(files)})"
+            print(f"{model_type:>10}: {status}")
+        if any(problems.values()):
+            raise SystemExit(1)
+        return
+
+    manifest = materialize(args.model)
+    for model_type, entry in manifest["models"].items():
+        print(f"{model_type:>10}: {entry['model_name']} @ {entry['revision'] or 'local'}")
+    print(f"Manifest written to {_manifest_path()}")
+
+
+if __name__ == "__main__":
+    main()
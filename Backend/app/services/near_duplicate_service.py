@@ -0,0 +1,145 @@
+"""
+Near-Duplicate Service
+MinHash/LSH grouping of paraphrased requirements so each group needs one LLM description
+
+Reviews of the same app often repeat one requirement in different words
+("la app se cierra al abrir el chat" / "se cierra cuando abro el chat").
+Requirements are grouped by the estimated Jaccard similarity of their
+character 3-gram shingles, only within the same subcharacteristic; each
+group's description is generated once, for its first member, and shared.
+"""
+
+import zlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.text_utils import normalize_for_dedup
+
+logger = get_logger(__name__)
+
+SHINGLE_SIZE = 3
+
+
+class MinHasher:
+    """
+    Vectorized MinHash signatures
+
+    Shingles are hashed with CRC32 and permuted with multiply-shift hashing
+    ((a*x + b) mod 2^64) >> 32 for num_perm random odd multipliers; the
+    signature of a text is the column-wise minimum over its shingles.
+    """
+
+    def __init__(self, num_perm: int = 96, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length (number of hash permutations)
+            seed: Seed of the permutation parameters
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def _shingles(text: str) -> np.ndarray:
+        """Unique hashed character shingles of one text (at least one)"""
+        padded = f" {normalize_for_dedup(text)} "
+        grams = {padded[i:i + SHINGLE_SIZE] for i in range(max(1, len(padded) - SHINGLE_SIZE + 1))}
+        return np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in grams),
+            dtype=np.uint64,
+            count=len(grams)
+        )
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        MinHash signatures of several texts in one pass
+
+        Args:
+            texts: Texts to sign
+
+        Returns:
+            uint32 array of shape (len(texts), num_perm)
+        """
+        if not texts:
+            return np.empty((0, self.num_perm), dtype=np.uint32)
+
+        shingles = [self._shingles(text) for text in texts]
+        offsets = np.cumsum([0] + [len(s) for s in shingles[:-1]])
+        hashes = np.concatenate(shingles)[:, None]
+
+        permuted = ((hashes * self._a + self._b) >> np.uint64(32)).astype(np.uint32)
+        return np.minimum.reduceat(permuted, offsets, axis=0)
+
+
+class NearDuplicateIndex:
+    """
+    Incremental LSH index assigning texts to near-duplicate groups
+
+    A signature is split into bands; texts sharing any band (and label) are
+    candidates, and a candidate group is joined only if the estimated
+    similarity to the group's representative reaches the threshold.
+    Comparing against representatives only keeps groups from drifting
+    through chains of pairwise-similar texts.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None
+    ):
+        """
+        Args:
+            threshold: Minimum estimated Jaccard similarity (defaults to settings)
+            num_perm: Signature length (defaults to settings)
+            bands: LSH bands; must divide num_perm (defaults to settings)
+        """
+        self.threshold = threshold if threshold is not None else settings.NEAR_DUPLICATE_THRESHOLD
+        num_perm = num_perm or settings.NEAR_DUPLICATE_NUM_PERM
+        self.bands = bands or settings.NEAR_DUPLICATE_BANDS
+        if num_perm % self.bands:
+            raise ValueError(f"NEAR_DUPLICATE_BANDS ({self.bands}) must divide NUM_PERM ({num_perm})")
+        self.rows = num_perm // self.bands
+
+        self.minhasher = MinHasher(num_perm)
+        self._buckets: Dict[Tuple[str, int, bytes], List[int]] = {}
+        self._signatures: List[np.ndarray] = []
+
+    def assign(self, texts: List[str], labels: List[str]) -> List[Tuple[int, bool]]:
+        """
+        Assign each text to an existing group or open a new one
+
+        Args:
+            texts: Texts to group
+            labels: Label of each text; texts are only grouped with equal labels
+
+        Returns:
+            (group id, is new group) for each text, in order
+        """
+        assignments = []
+        for label, signature in zip(labels, self.minhasher.signatures(texts)):
+            band_keys = [
+                (label, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                for band in range(self.bands)
+            ]
+
+            candidates = {group for key in band_keys for group in self._buckets.get(key, ())}
+            best_group, best_similarity = None, self.threshold
+            for group in sorted(candidates):
+                similarity = float(np.mean(self._signatures[group] == signature))
+                if similarity >= best_similarity:
+                    best_group, best_similarity = group, similarity
+
+            if best_group is not None:
+                assignments.append((best_group, False))
+                continue
+
+            group = len(self._signatures)
+            self._signatures.append(signature)
+            for key in band_keys:
+                self._buckets.setdefault(key, []).append(group)
+            assignments.append((group, True))
+
+        return assignments
@@ -0,0 +1,293 @@
+"""
+ONNX Runtime Engine
+Exports the classifiers to ONNX once and serves them through onnxruntime on CPU
+"""
+
+import inspect
+import json
+import os
+import re
+from typing import Dict, Optional
+import numpy as np
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.model_registry import hub_commit, local_revision
+
+logger = get_logger(__name__)
+
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_EXPORT_INFO_FILE = "export_info.json"
+ONNX_OPSET = 14
+
+_COMMIT_HASH = re.compile(r"^[0-9a-f]{40}$")
+
+
+def _safe_name(model_name: str) -> str:
+    """Filesystem-safe form of a model identifier"""
+    return model_name.strip("/").replace("/", "__")
+
+
+def _export_info(export_dir: str) -> Dict:
+    """Contents of an export's export_info.json ({} if missing or unreadable)"""
+    try:
+        with open(os.path.join(export_dir, ONNX_EXPORT_INFO_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _latest_export(model_name: str, revision: Optional[str] = None) -> Optional[str]:
+    """
+    Most recently written export of a model made for a given revision
+
+    Exports record both the revision they were requested for (branch, tag or
+    None for the default branch) and the commit it resolved to; either may
+    match. With no pin, exports of any revision are accepted, preferring
+    default-branch ones.
+
+    Args:
+        model_name: Model identifier on HuggingFace Hub
+        revision: Hub branch, tag or commit (None = default branch)
+
+    Returns:
+        Export directory, or None if no cached export matches
+    """
+    if not os.path.isdir(settings.ONNX_CACHE_DIR):
+        return None
+
+    prefix = _safe_name(model_name) + "@"
+    candidates = [
+        os.path.join(settings.ONNX_CACHE_DIR, name)
+        for name in os.listdir(settings.ONNX_CACHE_DIR)
+        if name.startswith(prefix)
+        and os.path.exists(os.path.join(settings.ONNX_CACHE_DIR, name, ONNX_MODEL_FILE))
+    ]
+
+    def made_for(path: str, pin: Optional[str]) -> bool:
+        info = _export_info(path)
+        return info.get("requested_revision") == pin or (pin is not None and info.get("revision") == pin)
+
+    matching = [path for path in candidates if made_for(path, revision)]
+    if not matching and revision is None:
+        matching = candidates
+    if not matching:
+        return None
+    return max(matching, key=lambda path: os.path.getmtime(os.path.join(path, ONNX_MODEL_FILE)))
+
+
+def resolve_commit(model_name: str, revision: Optional[str] = None) -> Optional[str]:
+    """
+    Commit a model name + revision currently points to
+
+    Branches and tags (and the default branch when revision is None) move,
+    so exports are keyed by the commit they were made from.
+
+    Args:
+        model_name: Model identifier on HuggingFace Hub (or local path)
+        revision: Hub branch, tag or commit (None = default branch)
+
+    Returns:
+        Commit hash, a content-derived id for local directories, or None if
+        the Hub cannot be reached
+    """
+    local = local_revision(model_name)
+    if local is not None:
+        return local
+    if revision and _COMMIT_HASH.match(revision):
+        return revision
+
+    try:
+        return hub_commit(model_name, revision)
+    except Exception as e:
+        logger.warning(f"Could not resolve the Hub commit of '{model_name}' @ {revision or 'default'}: {e}")
+        return None
+
+
+def _export_dir(model_name: str, commit: str) -> str:
+    """Directory of the cached export of a model at a given commit"""
+    return os.path.join(settings.ONNX_CACHE_DIR, f"{_safe_name(model_name)}@{commit}")
+
+
+def export_to_onnx(
+    model_name: str,
+    export_dir: str,
+    revision: Optional[str] = None,
+    requested_revision: Optional[str] = None
+) -> None:
+    """
+    Export a sequence classification model to ONNX
+
+    The tokenizer and config are saved next to the graph so later loads
+    do not need the Hub.
+
+    Args:
+        model_name: Model identifier on HuggingFace Hub (or local path)
+        export_dir: Target directory
+        revision: Hub branch, tag or commit to export (None = default branch)
+        requested_revision: Revision the caller pinned (None = default
+            branch), recorded so offline loads can find the export again
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    logger.info(f"Exporting '{model_name}' to ONNX (one-time): {export_dir}")
+    os.makedirs(export_dir, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(
+        model_name,
+        revision=revision,
+        token=settings.HUGGINGFACE_TOKEN
+    )
+    model = AutoModelForSequenceClassification.from_pretrained(
+        model_name,
+        revision=revision,
+        token=settings.HUGGINGFACE_TOKEN
+    )
+    model.eval()
+
+    dummy = tokenizer(["texto de ejemplo"], return_tensors="pt")
+    # Graph inputs follow the forward() signature order, not the tokenizer's
+    input_names = [
+        name for name in inspect.signature(model.forward).parameters
+        if name in dummy
+    ]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    # Write to a temporary file first so a crash never leaves a partial graph
+    tmp_path = os.path.join(export_dir, ONNX_MODEL_FILE + ".tmp")
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            args=(dict(dummy),),
+            f=tmp_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET
+        )
+
+    tokenizer.save_pretrained(export_dir)
+    model.config.save_pretrained(export_dir)
+
+    with open(os.path.join(export_dir, ONNX_EXPORT_INFO_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "model_name": model_name,
+            "revision": getattr(model.config, "_commit_hash", None),
+            "requested_revision": requested_revision,
+            "opset": ONNX_OPSET,
+            "torch_version": torch.__version__
+        }, f, indent=2)
+
+    os.replace(tmp_path, os.path.join(export_dir, ONNX_MODEL_FILE))
+    logger.info(f"✓ ONNX export completed: {export_dir}")
+
+
+class OnnxClassificationPipeline:
+    """
+    onnxruntime-backed model for the serving path
+
+    Exposes what HuggingFaceService needs to serve it like a transformers
+    pipeline through _predict_bucketed: the tokenizer, the label mapping,
+    the activation (sigmoid or softmax) and raw logits for a tokenized batch.
+    """
+
+    def __init__(self, export_dir: str):
+        """
+        Load the exported graph, tokenizer and label mapping
+
+        Args:
+            export_dir: Directory produced by export_to_onnx
+        """
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        config = AutoConfig.from_pretrained(export_dir)
+        self.id2label: Dict[int, str] = {int(k): v for k, v in config.id2label.items()}
+        self.use_sigmoid = (
+            config.num_labels == 1
+            or config.problem_type == "multi_label_classification"
+        )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.ONNX_INTRA_OP_THREADS > 0:
+            options.intra_op_num_threads = settings.ONNX_INTRA_OP_THREADS
+
+        self.session = ort.InferenceSession(
+            os.path.join(export_dir, ONNX_MODEL_FILE),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+        info_path = os.path.join(export_dir, ONNX_EXPORT_INFO_FILE)
+        self.revision = None
+        if os.path.exists(info_path):
+            with open(info_path, encoding="utf-8") as f:
+                self.revision = json.load(f).get("revision")
+
+    def logits(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Run the graph on an already tokenized batch
+
+        Args:
+            encoded: Tokenizer output as int64 NumPy arrays
+
+        Returns:
+            Logits array of shape (batch, num_labels)
+        """
+        feed = {
+            name: np.asarray(encoded[name], dtype=np.int64)
+            for name in self.input_names
+            if name in encoded
+        }
+        return self.session.run(["logits"], feed)[0]
+
+
+def load_onnx_pipeline(
+    model_name: str,
+    revision: Optional[str] = None
+) -> OnnxClassificationPipeline:
+    """
+    Load a model through onnxruntime, exporting it first if not cached
+
+    Args:
+        model_name: Model identifier on HuggingFace Hub (or local path)
+        revision: Hub branch, tag or commit (None = default branch)
+
+    Returns:
+        OnnxClassificationPipeline ready for inference
+
+    Raises:
+        ImportError: If onnxruntime is not installed
+        RuntimeError: If the Hub is unreachable and no cached export was made
+            for the requested revision
+    """
+    import onnxruntime  # noqa: F401 - fail fast before a costly export
+
+    commit = resolve_commit(model_name, revision)
+    if commit is None:
+        # Hub unreachable: reuse a cached export of the same revision rather than failing to start
+        export_dir = _latest_export(model_name, revision)
+        if export_dir is None:
+            raise RuntimeError(
+                f"No ONNX export of '{model_name}' @ {revision or 'default'} and the Hub is unreachable"
+            )
+        logger.warning(f"Using newest cached ONNX export (revision unverified): {export_dir}")
+        return OnnxClassificationPipeline(export_dir)
+
+    export_dir = _export_dir(model_name, commit)
+    if not os.path.exists(os.path.join(export_dir, ONNX_MODEL_FILE)):
+        # Export exactly the resolved commit, not whatever the branch points to by then
+        export_to_onnx(
+            model_name,
+            export_dir,
+            None if os.path.isdir(model_name) else commit,
+            requested_revision=revision
+        )
+    else:
+        logger.info(f"Using cached ONNX export: {export_dir}")
+
+    return OnnxClassificationPipeline(export_dir)
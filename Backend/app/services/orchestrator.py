@@ -11,7 +11,7 @@ from fastapi import UploadFile
 from app.services.processing_service import processing_service
 from app.services.scraper_service import scraper_service
 from app.services.pdf_service import pdf_service
-from app.schemas.models import ProcessingResponse, RequirementResult
+from app.schemas.results import ProcessingReport
 from app.core.logger import get_logger
 from app.core.exceptions import FileProcessingException
 
@@ -30,7 +30,7 @@ class OrchestratorService:
     async def process_single_comment(
         self,
         comment: str
-    ) -> Tuple[ProcessingResponse, BytesIO]:
+    ) -> Tuple[ProcessingReport, BytesIO]:
         """
         Process a single comment and generate both JSON and PDF
 
@@ -38,7 +38,7 @@ class OrchestratorService:
             comment: User comment
 
         Returns:
-            Tuple of (ProcessingResponse, PDF buffer)
+            Tuple of (ProcessingReport, PDF buffer)
         """
         logger.info("Orchestrating single comment processing")
         start_time = time.time()
@@ -49,10 +49,9 @@ class OrchestratorService:
         # Calculate processing time
         processing_time_ms = (time.time() - start_time) * 1000
 
-        # Build response
-        response = ProcessingResponse(
+        # Build report
+        response = ProcessingReport(
             total_comments=1,
-            valid_requirements=sum(1 for r in results if r.is_requirement),
             requirements=results,
             processing_time_ms=processing_time_ms,
             source_type="single"
@@ -68,7 +67,7 @@ class OrchestratorService:
     async def process_csv_file(
         self,
         file: UploadFile
-    ) -> Tuple[ProcessingResponse, BytesIO]:
+    ) -> Tuple[ProcessingReport, BytesIO]:
         """
         Process CSV file with multiple comments
 
@@ -76,7 +75,7 @@ class OrchestratorService:
             file: Uploaded CSV file
 
         Returns:
-            Tuple of (ProcessingResponse, PDF buffer)
+            Tuple of (ProcessingReport, PDF buffer)
 
         Raises:
             FileProcessingException: If CSV processing fails
@@ -111,18 +110,20 @@ class OrchestratorService:
             logger.info(f"Extracted {len(comments)} comments from CSV")
 
             # Process all comments (ASYNC)
-            results = await processing_service.process_batch(comments, generate_descriptions=True)
+            results, dedup_stats = await processing_service.process_batch_with_stats(
+                comments, generate_descriptions=True
+            )
 
             # Calculate processing time
             processing_time_ms = (time.time() - start_time) * 1000
 
-            # Build response
-            response = ProcessingResponse(
+            # Build report
+            response = ProcessingReport(
                 total_comments=len(comments),
-                valid_requirements=sum(1 for r in results if r.is_requirement),
                 requirements=results,
                 processing_time_ms=processing_time_ms,
-                source_type="csv"
+                source_type="csv",
+                dedup_stats=dedup_stats
             )
 
             # Generate PDF
@@ -142,7 +143,7 @@ class OrchestratorService:
         url: str,
         target_requirements: int = 30,
         max_total_reviews: int = 500
-    ) -> Tuple[ProcessingResponse, BytesIO]:
+    ) -> Tuple[ProcessingReport, BytesIO]:
         """
         Smart processing of Google Play Store URL with FULL RESULT CACHING
         """
@@ -159,10 +160,10 @@ class OrchestratorService:
         
         # Try to get complete cached result
         cached_result = await redis_service.get(cache_key_response)
-        if cached_result is not None:
+        if cached_result is not None and 'report' in cached_result:
             logger.info(f"🎯🎯🎯 FULL CACHE HIT for Play Store: {url}")
-            # Reconstruct response from cache
-            response = ProcessingResponse(**cached_result['response'])
+            # Reconstruct report from cache
+            response = ProcessingReport.from_dict(cached_result['report'])
             # Regenerate PDF (PDFs don't cache well)
             pdf_buffer = pdf_service.generate_pdf(response)
             return response, pdf_buffer
@@ -182,30 +183,27 @@ class OrchestratorService:
         logger.info(f"Processing {len(comments)} filtered comments...")
         
         # Process all filtered comments to find requirements (ASYNC)
-        results = await processing_service.process_batch(comments, generate_descriptions=True)
-        
-        # Get valid requirements
-        valid_requirements = [r for r in results if r.is_requirement]
+        results, dedup_stats = await processing_service.process_batch_with_stats(
+            comments, generate_descriptions=True
+        )
         
         # Calculate processing time
         processing_time_ms = (time.time() - start_time) * 1000
         
-        # Build response with enhanced statistics
-        response = ProcessingResponse(
+        # Build report with enhanced statistics
+        response = ProcessingReport(
             total_comments=scraping_stats["total_scraped"],
-            valid_requirements=len(valid_requirements),
             requirements=results,
             processing_time_ms=processing_time_ms,
-            source_type="playstore"
+            source_type="playstore",
+            scraping_stats=scraping_stats,
+            dedup_stats=dedup_stats
         )
         
-        # Add scraping statistics to response
-        response.scraping_stats = scraping_stats
-        
         # Cache the complete result (12 hours TTL)
         try:
             cache_data = {
-                'response': response.model_dump(),
+                'report': response.to_dict(),
                 'url': url
             }
             await redis_service.set(cache_key_response, cache_data, ttl=settings.CACHE_TTL_SCRAPING)
@@ -218,7 +216,7 @@ class OrchestratorService:
         
         logger.info(
             f"✓ Play Store processing completed: "
-            f"{len(valid_requirements)} requirements found from "
+            f"{response.valid_requirements} requirements found from "
             f"{scraping_stats['total_scraped']} reviews in {processing_time_ms:.2f}ms"
         )
         
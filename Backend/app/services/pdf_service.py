@@ -16,7 +16,7 @@ from reportlab.platypus import (
     PageBreak, Image
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from app.schemas.models import RequirementResult, ProcessingResponse
+from app.schemas.results import ProcessingReport
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.core.exceptions import PDFGenerationException
@@ -100,14 +100,14 @@ class PDFService:
 
     def generate_pdf(
         self,
-        response: ProcessingResponse,
+        response: ProcessingReport,
         filename: str = "requisitos_usabilidad_perseus.pdf"
     ) -> BytesIO:
         """
-        Generate a PDF report from processing response
+        Generate a PDF report from a processing report
 
         Args:
-            response: Processing response with requirement results
+            response: Processing report with requirement results
             filename: Output filename
 
         Returns:
@@ -164,7 +164,7 @@ class PDFService:
             logger.error(error_msg)
             raise PDFGenerationException(error_msg, details={"error": str(e)})
 
-    def _build_header(self, response: ProcessingResponse) -> List:
+    def _build_header(self, response: ProcessingReport) -> List:
         """Build PDF header section"""
         story = []
 
@@ -199,7 +199,7 @@ class PDFService:
 
         return story
 
-    def _build_summary(self, response: ProcessingResponse) -> List:
+    def _build_summary(self, response: ProcessingReport) -> List:
         """Build summary statistics section - Minimalista"""
         story = []
 
@@ -250,12 +250,12 @@ class PDFService:
 
         return story
 
-    def _build_requirements_table(self, response: ProcessingResponse) -> List:
+    def _build_requirements_table(self, response: ProcessingReport) -> List:
         """Build requirements summary table - Diseño minimalista con colores pasteles"""
         story = []
 
         # Get only valid requirements
-        valid_reqs = [r for r in response.requirements if r.is_requirement]
+        valid_reqs = response.requirements.requirements()
 
         if not valid_reqs:
             story.append(Paragraph(
@@ -333,11 +333,11 @@ class PDFService:
 
         return story
 
-    def _build_detailed_requirements(self, response: ProcessingResponse) -> List:
+    def _build_detailed_requirements(self, response: ProcessingReport) -> List:
         """Build detailed requirements section - Diseño minimalista"""
         story = []
 
-        valid_reqs = [r for r in response.requirements if r.is_requirement]
+        valid_reqs = response.requirements.requirements()
 
         if not valid_reqs:
             return story
@@ -0,0 +1,153 @@
+"""
+Prediction Cache Service
+Persistent per-comment cache of binary and multiclass classifier outputs
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from app.services.huggingface_service import huggingface_service
+from app.services.redis_service import redis_service
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.text_utils import normalize_whitespace
+
+logger = get_logger(__name__)
+
+
+class PredictionCacheService:
+    """
+    Service caching classifier predictions in Redis
+
+    Keys combine the served model name, its resolved revision, the inference
+    engine and precision and the normalized comment text, so a swapped or
+    retrained model never serves stale predictions.
+    Entries expire after CACHE_TTL_ML.
+    """
+
+    def __init__(self):
+        """Initialize prediction cache service"""
+        logger.info(f"Initializing Prediction Cache Service (enabled={settings.ENABLE_CACHE})")
+
+    @staticmethod
+    def _cache_key(model_type: str, identity: Dict[str, str], text: str) -> str:
+        """Cache key of one text predicted by the model described by identity"""
+        return redis_service._generate_key(
+            "ml_pred",
+            model_type,
+            identity["model_name"],
+            identity["revision"],
+            identity["engine"],
+            identity["precision"],
+            normalize_whitespace(text)
+        )
+
+    def _cache_keys(
+        self,
+        model_type: str,
+        texts: List[str]
+    ) -> Tuple[Optional[Dict[str, str]], Optional[List[str]]]:
+        """
+        Build lookup keys for texts from the model currently served
+
+        Returns:
+            Tuple of (model identity, list of keys), or (None, None) if the model
+            is not loaded yet (its revision is unknown, so nothing can be looked up)
+        """
+        identity = huggingface_service.get_model_identity(model_type)
+        if identity is None:
+            return None, None
+
+        return identity, [self._cache_key(model_type, identity, text) for text in texts]
+
+    async def get_cached(self, model_type: str, texts: List[str]) -> List[Optional[Dict]]:
+        """
+        Look up cached predictions of the model currently served, without inference
+
+        Args:
+            model_type: "binary" or "multiclass"
+            texts: Texts to look up
+
+        Returns:
+            Cached prediction dictionary per text, None for misses (all None
+            while the model is not loaded)
+        """
+        if not texts:
+            return []
+
+        _, keys = await asyncio.get_running_loop().run_in_executor(
+            None, self._cache_keys, model_type, texts
+        )
+        if keys is None:
+            return [None] * len(texts)
+        return await redis_service.get_many(keys)
+
+    async def predict_cached(
+        self,
+        model_type: str,
+        texts: List[str],
+        predict_fn: Callable[[List[str]], Awaitable[List[Tuple[Dict, Optional[Dict[str, str]]]]]]
+    ) -> List[Dict]:
+        """
+        Predict texts, serving cached predictions and inferring only misses
+
+        New predictions are written back under the identity of the model that
+        actually made them, which differs from the lookup identity when a swap
+        lands between the lookup and the forward pass.
+
+        Args:
+            model_type: "binary" or "multiclass"
+            texts: Texts to classify
+            predict_fn: Async batch prediction function used for cache misses,
+                returning (prediction, model identity) pairs
+
+        Returns:
+            List of prediction dictionaries in input order
+        """
+        if not texts:
+            return []
+
+        lookup_identity, keys = None, None
+        if settings.ENABLE_CACHE:
+            # Off the event loop: with the model server the identity lookup is
+            # blocking IPC, and hashing a large batch is not free either
+            lookup_identity, keys = await asyncio.get_running_loop().run_in_executor(
+                None, self._cache_keys, model_type, texts
+            )
+
+        if keys is not None:
+            # Bulk lookup
+            results: List[Optional[Dict]] = await redis_service.get_many(keys)
+            miss_indices = [idx for idx, result in enumerate(results) if result is None]
+
+            logger.info(
+                f"🎯 ML cache ({model_type}): {len(texts) - len(miss_indices)}/{len(texts)} hits"
+            )
+
+            if not miss_indices:
+                return results
+        else:
+            results = [None] * len(texts)
+            miss_indices = list(range(len(texts)))
+
+        # Inference only for misses
+        predicted = await predict_fn([texts[idx] for idx in miss_indices])
+        writes: Dict[str, Dict] = {}
+        for idx, (prediction, identity) in zip(miss_indices, predicted):
+            results[idx] = prediction
+            if not settings.ENABLE_CACHE or identity is None:
+                continue
+            if identity == lookup_identity:
+                writes[keys[idx]] = prediction
+            else:
+                writes[self._cache_key(model_type, identity, texts[idx])] = prediction
+
+        if writes:
+            # Bulk write-back (keys may repeat for duplicate texts); shielded so
+            # predictions already paid for are kept even if the request is cancelled
+            await asyncio.shield(redis_service.set_many(writes, ttl=settings.CACHE_TTL_ML))
+
+        return results
+
+
+# Global service instance
+prediction_cache_service = PredictionCacheService()
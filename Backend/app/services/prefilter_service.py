@@ -0,0 +1,380 @@
+"""
+Pre-filter Service
+Cheap hashed n-gram linear classifier that runs ahead of the BERT binary model
+
+Most reviews are obviously not requirements ("great app", emoji-only text,
+spam). The pre-filter is distilled from BERT's own labels and rejects only
+high-confidence negatives; every uncertain comment still goes to BERT.
+
+Fit offline from cached BERT predictions (from Backend/):
+    python -m app.services.prefilter_service --csv comentarios.csv --output model_cache/prefilter.npz
+"""
+
+import argparse
+import csv
+import os
+import re
+import unicodedata
+import zlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.constants import BINARY_INVALID_LABELS
+from app.core.labels import is_valid_requirement
+
+logger = get_logger(__name__)
+
+# Label attached to comments rejected by the pre-filter
+PREFILTER_REJECT_LABEL = BINARY_INVALID_LABELS[0]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class HashedNgramFeaturizer:
+    """
+    Maps texts to sparse hashed feature indices
+
+    Features are word unigrams/bigrams plus character n-grams (which also
+    capture emoji and punctuation runs), hashed with CRC32 into a fixed
+    number of buckets so no vocabulary has to be stored.
+    """
+
+    def __init__(self, n_features: int = 2 ** 18, char_ngrams: Tuple[int, int] = (2, 4)):
+        """
+        Args:
+            n_features: Number of hash buckets
+            char_ngrams: Inclusive range of character n-gram sizes
+        """
+        self.n_features = n_features
+        self.char_ngrams = char_ngrams
+
+    def _features(self, text: str) -> np.ndarray:
+        """Unique hashed feature indices of one text"""
+        text = unicodedata.normalize("NFC", text.lower())
+        words = _TOKEN_RE.findall(text)
+
+        grams = [f"w:{w}" for w in words]
+        grams += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+        padded = f" {text.strip()} "
+        for n in range(self.char_ngrams[0], self.char_ngrams[1] + 1):
+            grams += [f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1)]
+        grams.append(f"len:{min(len(words), 50) // 5}")
+
+        hashes = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in grams),
+            dtype=np.int64,
+            count=len(grams)
+        )
+        return np.unique(hashes % self.n_features)
+
+    def transform(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Featurize a batch into a flat (CSR-like) representation
+
+        Returns:
+            Tuple of (feature indices, per-feature values, row offsets); values
+            are L2-normalized per text
+        """
+        rows = [self._features(text) for text in texts]
+        lengths = np.array([len(r) for r in rows], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        values = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths)
+        return indices, values, offsets
+
+
+class LinearPrefilter:
+    """
+    Logistic regression over hashed n-grams (probability of being a requirement)
+    """
+
+    def __init__(
+        self,
+        featurizer: HashedNgramFeaturizer,
+        weights: Optional[np.ndarray] = None,
+        bias: float = 0.0,
+        reject_threshold: float = 0.0
+    ):
+        self.featurizer = featurizer
+        self.weights = (
+            weights if weights is not None
+            else np.zeros(featurizer.n_features, dtype=np.float32)
+        )
+        self.bias = bias
+        self.reject_threshold = reject_threshold
+
+    def _scores(self, indices: np.ndarray, values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Vectorized linear scores for a featurized batch"""
+        if len(offsets) == 0:
+            return np.zeros(0)
+        contributions = self.weights[indices] * values
+        # reduceat needs a non-empty segment per row; every text has >= 1 feature
+        return np.add.reduceat(contributions, offsets) + self.bias
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Probability that each text is a requirement"""
+        scores = self._scores(*self.featurizer.transform(texts))
+        return 1.0 / (1.0 + np.exp(-scores))
+
+    def fit(
+        self,
+        texts: List[str],
+        labels: np.ndarray,
+        epochs: int = 8,
+        learning_rate: float = 0.5,
+        l2: float = 1e-6,
+        batch_size: int = 256,
+        seed: int = 0
+    ) -> None:
+        """
+        Fit with mini-batch SGD on log-loss (positives up-weighted to balance classes)
+
+        Args:
+            texts: Training texts
+            labels: 1 for BERT-positive (requirement), 0 otherwise
+        """
+        rng = np.random.default_rng(seed)
+        labels = labels.astype(np.float64)
+        positive_rate = max(labels.mean(), 1e-6)
+        class_weight = np.where(labels == 1, 0.5 / positive_rate, 0.5 / max(1 - positive_rate, 1e-6))
+
+        weights = self.weights.astype(np.float64)
+        for _ in range(epochs):
+            order = rng.permutation(len(texts))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                indices, values, offsets = self.featurizer.transform([texts[i] for i in batch])
+                scores = np.add.reduceat(weights[indices] * values, offsets) + self.bias
+                probs = 1.0 / (1.0 + np.exp(-scores))
+                grad = (probs - labels[batch]) * class_weight[batch] / len(batch)
+
+                lengths = np.diff(np.append(offsets, len(indices)))
+                np.add.at(weights, indices, -learning_rate * np.repeat(grad, lengths) * values)
+                weights *= (1 - learning_rate * l2)
+                self.bias -= learning_rate * grad.sum()
+
+        self.weights = weights.astype(np.float32)
+
+    def save(self, path: str) -> None:
+        """Persist weights, bias, threshold and featurizer settings"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=np.array(self.bias),
+            reject_threshold=np.array(self.reject_threshold),
+            n_features=np.array(self.featurizer.n_features),
+            char_ngrams=np.array(self.featurizer.char_ngrams)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LinearPrefilter":
+        """Load a model saved with save()"""
+        data = np.load(path)
+        featurizer = HashedNgramFeaturizer(
+            n_features=int(data["n_features"]),
+            char_ngrams=tuple(int(n) for n in data["char_ngrams"])
+        )
+        return cls(
+            featurizer,
+            weights=data["weights"],
+            bias=float(data["bias"]),
+            reject_threshold=float(data["reject_threshold"])
+        )
+
+
+class PrefilterService:
+    """
+    Service applying the pre-filter cascade ahead of the BERT binary model
+    """
+
+    def __init__(self):
+        """Initialize pre-filter service (loads the model if enabled)"""
+        self.model: Optional[LinearPrefilter] = None
+        self.rejected = 0
+        self.passed = 0
+
+        if not settings.PREFILTER_ENABLED:
+            return
+
+        if not os.path.exists(settings.PREFILTER_MODEL_PATH):
+            logger.warning(
+                f"Pre-filter enabled but model not found at {settings.PREFILTER_MODEL_PATH} "
+                "- all comments go to BERT"
+            )
+            return
+
+        self.model = LinearPrefilter.load(settings.PREFILTER_MODEL_PATH)
+        if settings.PREFILTER_REJECT_THRESHOLD is not None:
+            self.model.reject_threshold = settings.PREFILTER_REJECT_THRESHOLD
+        logger.info(
+            f"✓ Pre-filter loaded ({settings.PREFILTER_MODEL_PATH}), "
+            f"reject threshold: {self.model.reject_threshold:.4f}"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a pre-filter model is active"""
+        return self.model is not None
+
+    def split(self, texts: List[str]) -> Tuple[Dict[int, Dict], List[int]]:
+        """
+        Reject high-confidence negatives
+
+        Args:
+            texts: Texts headed for the binary model
+
+        Returns:
+            Tuple of ({index: rejection prediction}, indices that still need BERT)
+        """
+        if not self.enabled or not texts:
+            return {}, list(range(len(texts)))
+
+        probs = self.model.predict_proba(texts)
+        reject = probs < self.model.reject_threshold
+
+        rejected = {
+            int(idx): {
+                "label": PREFILTER_REJECT_LABEL,
+                "score": float(1.0 - probs[idx]),
+                "source": "prefilter"
+            }
+            for idx in np.flatnonzero(reject)
+        }
+        remaining = [int(idx) for idx in np.flatnonzero(~reject)]
+
+        self.rejected += len(rejected)
+        self.passed += len(remaining)
+        return rejected, remaining
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get pre-filter statistics"""
+        total = self.rejected + self.passed
+        return {
+            "enabled": self.enabled,
+            "rejected": self.rejected,
+            "passed_to_bert": self.passed,
+            "bert_calls_saved": self.rejected / total if total else 0.0
+        }
+
+
+# Global service instance
+prefilter_service = PrefilterService()
+
+
+# ========== Offline fitting ==========
+
+def threshold_report(
+    probs: np.ndarray,
+    labels: np.ndarray,
+    thresholds: List[float]
+) -> List[Dict[str, float]]:
+    """
+    Recall loss against BERT and share of BERT calls saved per threshold
+
+    Args:
+        probs: Pre-filter probabilities on held-out texts
+        labels: BERT labels (1 = requirement)
+        thresholds: Candidate reject thresholds
+
+    Returns:
+        One row per threshold
+    """
+    positives = max(int(labels.sum()), 1)
+    rows = []
+    for threshold in thresholds:
+        rejected = probs < threshold
+        rows.append({
+            "threshold": threshold,
+            "bert_calls_saved": float(rejected.mean()),
+            "recall_loss": float((rejected & (labels == 1)).sum() / positives)
+        })
+    return rows
+
+
+def _bert_labels(texts: List[str], use_inference: bool) -> Tuple[List[str], np.ndarray]:
+    """
+    BERT binary labels for texts: cached predictions first, inference for misses
+
+    Returns:
+        Tuple of (texts with a label, labels)
+    """
+    import asyncio
+    from app.services.huggingface_service import huggingface_service
+    from app.services.prediction_cache import prediction_cache_service
+
+    # Loading resolves the model revision that cache keys depend on
+    huggingface_service.preload()
+
+    async def missing_fn(batch: List[str]) -> List[Tuple[Dict, Dict[str, str]]]:
+        predictions, identity = huggingface_service.batch_predict_identified("binary", batch)
+        return [(prediction, identity) for prediction in predictions]
+
+    async def collect() -> List[Optional[Dict]]:
+        if use_inference:
+            return await prediction_cache_service.predict_cached("binary", texts, missing_fn)
+        return await prediction_cache_service.get_cached("binary", texts)
+
+    predictions = asyncio.run(collect())
+    kept = [(t, p) for t, p in zip(texts, predictions) if p is not None]
+    logger.info(f"BERT labels available for {len(kept)}/{len(texts)} texts")
+
+    return (
+        [t for t, _ in kept],
+        np.array([is_valid_requirement(p["label"]) for _, p in kept], dtype=np.int64)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Fit the pre-filter from BERT labels and print the recall/throughput report"""
+    parser = argparse.ArgumentParser(description="Fit the BERT pre-filter from cached predictions")
+    parser.add_argument("--csv", required=True, help="CSV with comments (first column)")
+    parser.add_argument("--output", default=settings.PREFILTER_MODEL_PATH)
+    parser.add_argument("--max-recall-loss", type=float, default=0.01)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument(
+        "--cached-only",
+        action="store_true",
+        help="use only cached BERT predictions (no inference for misses)"
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.csv, newline="", encoding="utf-8") as f:
+        texts = [row[0].strip() for row in csv.reader(f) if row and row[0].strip()]
+
+    texts, labels = _bert_labels(texts, use_inference=not args.cached_only)
+    if len(set(labels.tolist())) < 2:
+        raise SystemExit(
+            "Need BERT labels of both classes to fit the pre-filter "
+            f"({len(texts)} labelled texts, {int(labels.sum())} requirements)"
+        )
+
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(texts))
+    split = int(len(order) * (1 - args.holdout))
+    train, test = order[:split], order[split:]
+
+    model = LinearPrefilter(HashedNgramFeaturizer())
+    model.fit([texts[i] for i in train], labels[train])
+
+    probs = model.predict_proba([texts[i] for i in test])
+    rows = threshold_report(probs, labels[test], [0.01, 0.02, 0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5])
+
+    print(f"{'threshold':>10}{'BERT calls saved':>20}{'recall loss':>14}")
+    for row in rows:
+        print(f"{row['threshold']:>10.2f}{row['bert_calls_saved']:>20.2%}{row['recall_loss']:>14.2%}")
+
+    # Highest threshold (most savings) within the recall budget
+    eligible = [row for row in rows if row["recall_loss"] <= args.max_recall_loss]
+    model.reject_threshold = max((row["threshold"] for row in eligible), default=0.0)
+    model.save(args.output)
+
+    print(
+        f"Saved pre-filter to {args.output} with reject threshold "
+        f"{model.reject_threshold:.2f} (max recall loss {args.max_recall_loss:.2%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,20 @@ Handles the core logic of processing comments and extracting requirements
 """
 
 import asyncio
-from typing import List, Dict
+import itertools
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from app.services.huggingface_service import huggingface_service
+from app.services.batching_service import batching_service
+from app.services.inference_executor import inference_executor
+from app.services.prediction_cache import prediction_cache_service
+from app.services.prefilter_service import prefilter_service
+from app.services.near_duplicate_service import NearDuplicateIndex
 from app.schemas.requirements import BinaryPrediction, MulticlassPrediction, CommentAnalysis
-from app.schemas.models import RequirementResult
+from app.schemas.results import ResultSet
+from app.core.config import settings
 from app.core.logger import get_logger
-from app.core.constants import BINARY_VALID_LABELS, BINARY_INVALID_LABELS
+from app.core.text_utils import normalize_for_dedup
+from app.core.labels import is_valid_requirement
 
 logger = get_logger(__name__)
 
@@ -22,26 +30,8 @@ class ProcessingService:
     def __init__(self):
         """Initialize processing service"""
         logger.info("Initializing Processing Service")
-
-    def _is_valid_requirement(self, label: str) -> bool:
-        """
-        Determine if a binary prediction label indicates a valid requirement
-
-        Args:
-            label: Prediction label from binary model
-
-        Returns:
-            True if it's a valid requirement, False otherwise
-        """
-        # Check if label indicates valid requirement
-        if label in BINARY_VALID_LABELS:
-            return True
-        elif label in BINARY_INVALID_LABELS:
-            return False
-        else:
-            # Unknown label - log warning and default to False
-            logger.warning(f"Unknown binary label: {label}. Defaulting to not a requirement.")
-            return False
+        # Each batch is one owner for fair sharing of the LLM dispatchers
+        self._batch_ids = itertools.count(1)
 
     async def process_single_comment(
         self,
@@ -60,14 +50,12 @@ class ProcessingService:
         """
         logger.info(f"Processing comment: {comment[:100]}...")
 
-        # Step 1: Binary classification (run in thread pool as it's CPU-bound)
-        loop = asyncio.get_event_loop()
-        binary_result = await loop.run_in_executor(
-            None,
+        # Step 1: Binary classification (run on inference executor as it's CPU-bound)
+        binary_result = await inference_executor.run(
             huggingface_service.predict_binary,
             comment
         )
-        is_requirement = self._is_valid_requirement(binary_result['label'])
+        is_requirement = is_valid_requirement(binary_result['label'])
 
         binary_prediction = BinaryPrediction(
             label=binary_result['label'],
@@ -82,8 +70,7 @@ class ProcessingService:
         description = None
 
         if is_requirement:
-            multiclass_result = await loop.run_in_executor(
-                None,
+            multiclass_result = await inference_executor.run(
                 huggingface_service.predict_multiclass,
                 comment
             )
@@ -112,109 +99,405 @@ class ProcessingService:
             description=description
         )
 
-    async def process_batch(
-        self,
-        comments: List[str],
-        generate_descriptions: bool = True
-    ) -> List[RequirementResult]:
+    async def _classify_binary(self, comments: List[str]) -> List[Dict]:
         """
-        Process multiple comments efficiently with PARALLEL LLM calls - ASYNC
+        Binary classification of one chunk - ASYNC
 
-        Args:
-            comments: List of comment texts
-            generate_descriptions: Whether to generate descriptions
-
-        Returns:
-            List of RequirementResult objects
+        The pre-filter (if enabled) rejects obvious non-requirements; the rest
+        is cached per comment, and misses are micro-batched on the inference executor
         """
-        logger.info(f"Processing batch of {len(comments)} comments")
+        binary_results: List[Optional[Dict]] = [None] * len(comments)
+        if prefilter_service.enabled:
+            # n-gram featurization of a whole chunk is CPU-bound: keep it off the event loop
+            rejected, remaining = await inference_executor.run(prefilter_service.split, comments)
+        else:
+            rejected, remaining = {}, list(range(len(comments)))
+        for idx, prediction in rejected.items():
+            binary_results[idx] = prediction
+
+        if rejected:
+            logger.info(f"Pre-filter rejected {len(rejected)}/{len(comments)} comments")
+
+        if remaining:
+            bert_results = await prediction_cache_service.predict_cached(
+                "binary",
+                [comments[idx] for idx in remaining],
+                batching_service.predict_binary
+            )
+            for idx, prediction in zip(remaining, bert_results):
+                binary_results[idx] = prediction
 
-        if not comments:
-            return []
+        return binary_results
 
-        # Step 1: Binary classification for all comments (run in thread pool)
-        loop = asyncio.get_event_loop()
-        binary_results = await loop.run_in_executor(
-            None,
-            huggingface_service.batch_predict_binary,
-            comments
-        )
+    def _start_descriptions(
+        self,
+        valid_comments: List[str],
+        multiclass_results: List[Dict],
+        near_duplicates: Optional[NearDuplicateIndex],
+        group_tasks: Dict[int, asyncio.Future],
+        description_stats: Dict[str, int],
+        owner: str
+    ) -> List[asyncio.Future]:
+        """
+        Start the LLM calls of one chunk - PARALLEL EXECUTION ⚡
 
-        # Step 2: Filter valid requirements
-        valid_indices = []
-        valid_comments = []
+        With a near-duplicate index, comments paraphrasing an earlier requirement
+        of the same subcharacteristic (in this or a previous chunk) reuse its
+        description task instead of starting a new LLM call. With LLM_BATCH_SIZE > 1
+        the new requirements of the chunk are described in batched prompts.
 
-        for idx, (comment, binary_result) in enumerate(zip(comments, binary_results)):
-            if self._is_valid_requirement(binary_result['label']):
-                valid_indices.append(idx)
-                valid_comments.append(comment)
+        Args:
+            valid_comments: Comments classified as requirements
+            multiclass_results: Their multiclass predictions
+            near_duplicates: Index shared by the chunks of one batch (None = disabled)
+            group_tasks: Group id → description task, shared like the index
+            description_stats: Counters of requested and started descriptions
+            owner: Batch identity passed to the LLM dispatcher
 
-        logger.info(f"Found {len(valid_comments)} valid requirements out of {len(comments)}")
+        Returns:
+            One description task per valid comment (shared tasks may repeat)
+        """
+        from app.services.description_service import description_service
 
-        # Step 3: Multiclass classification for valid requirements (run in thread pool)
-        multiclass_results = []
-        if valid_comments:
-            multiclass_results = await loop.run_in_executor(
-                None,
-                huggingface_service.batch_predict_multiclass,
-                valid_comments
+        labels = [mc_result['label'] for mc_result in multiclass_results]
+        if near_duplicates is not None:
+            assignments = near_duplicates.assign(valid_comments, labels)
+        else:
+            assignments = [(None, True)] * len(valid_comments)
+
+        batched = settings.LLM_BATCH_SIZE > 1
+        new_items = [
+            (comment, label)
+            for comment, label, (_, is_new) in zip(valid_comments, labels, assignments)
+            if is_new
+        ]
+        if batched and new_items:
+            # One task packs the chunk's new requirements into batched prompts
+            batch_task = asyncio.ensure_future(
+                description_service.generate_descriptions(new_items, owner=owner)
             )
 
-        # Step 4: Generate descriptions if requested - PARALLEL EXECUTION ⚡
-        descriptions = []
-        if generate_descriptions and valid_comments:
-            from app.services.description_service import description_service
-
-            logger.info(f"🚀 Generating {len(valid_comments)} descriptions in PARALLEL...")
+        tasks = []
+        started = 0
+        for comment, label, (group, is_new) in zip(valid_comments, labels, assignments):
+            if is_new:
+                if batched:
+                    task = asyncio.ensure_future(self._batch_item(batch_task, started))
+                else:
+                    task = asyncio.ensure_future(description_service.generate_description(
+                        comment=comment,
+                        subcharacteristic=label,
+                        owner=owner
+                    ))
+                started += 1
+                if group is not None:
+                    group_tasks[group] = task
+            else:
+                task = group_tasks[group]
+            tasks.append(task)
+
+        description_stats["description_items"] += len(tasks)
+        description_stats["description_calls"] += started
+        logger.info(
+            f"🚀 Generating {started} descriptions in PARALLEL "
+            f"({len(tasks) - started} shared with near-duplicates"
+            f"{f', {settings.LLM_BATCH_SIZE} per prompt' if batched else ''})..."
+        )
+        return tasks
 
-            # Create tasks for parallel execution
-            description_tasks = [
-                description_service.generate_description(
-                    comment=comment,
-                    subcharacteristic=mc_result['label']
-                )
-                for comment, mc_result in zip(valid_comments, multiclass_results)
-            ]
+    @staticmethod
+    async def _batch_item(batch_task: asyncio.Future, index: int) -> str:
+        """Description of one item of a batched generation task (cancelling it cancels the batch)"""
+        return (await batch_task)[index]
 
-            # Execute all LLM calls in parallel
-            descriptions = await asyncio.gather(*description_tasks)
+    def _build_results(
+        self,
+        comments: List[str],
+        binary_results: List[Dict],
+        multiclass_results: List[Dict],
+        descriptions: List[str]
+    ) -> ResultSet:
+        """
+        Assemble the results of one chunk
 
-            logger.info(f"✓ Generated {len(descriptions)} descriptions in parallel")
+        Args:
+            comments: Chunk of comment texts
+            binary_results: Binary prediction per comment
+            multiclass_results: Multiclass prediction per valid comment
+            descriptions: Description per valid comment (empty if not generated)
 
-        # Step 5: Build final results
-        results = []
+        Returns:
+            ResultSet in input order
+        """
+        results = ResultSet()
         multiclass_idx = 0
 
-        for idx, (comment, binary_result) in enumerate(zip(comments, binary_results)):
-            is_requirement = self._is_valid_requirement(binary_result['label'])
+        for comment, binary_result in zip(comments, binary_results):
+            is_requirement = is_valid_requirement(binary_result['label'])
 
             if is_requirement and multiclass_idx < len(multiclass_results):
                 # Valid requirement with multiclass classification
                 mc_result = multiclass_results[multiclass_idx]
                 desc = descriptions[multiclass_idx] if descriptions else None
 
-                results.append(RequirementResult(
-                    comment=comment,
-                    is_requirement=True,
-                    subcharacteristic=mc_result['label'],
-                    description=desc,
-                    binary_score=binary_result['score'],
-                    multiclass_score=mc_result['score']
-                ))
+                results.append(
+                    comment, True, mc_result['label'], desc,
+                    binary_result['score'], mc_result['score']
+                )
                 multiclass_idx += 1
             else:
                 # Not a requirement
-                results.append(RequirementResult(
-                    comment=comment,
-                    is_requirement=False,
-                    subcharacteristic=None,
-                    description=None,
-                    binary_score=binary_result['score'],
-                    multiclass_score=None
-                ))
+                results.append(comment, False, None, None, binary_result['score'], None)
 
         return results
 
+    # ========== Stage pipeline ==========
+    # Chunks flow binary → multiclass → description through bounded queues,
+    # so BERT works on chunk N+1 while the LLM calls of chunk N are in flight.
+    # Each queue item is a dict describing one chunk; None marks the end.
+
+    async def _binary_stage(self, chunks: List[List[str]], out_queue: asyncio.Queue):
+        """Stage 1: binary classification and filtering of each chunk"""
+        for number, comments in enumerate(chunks, start=1):
+            logger.info(f"Binary stage: chunk {number}/{len(chunks)} ({len(comments)} comments)")
+            binary_results = await self._classify_binary(comments)
+
+            valid_comments = [
+                comment for comment, binary_result in zip(comments, binary_results)
+                if is_valid_requirement(binary_result['label'])
+            ]
+            logger.info(f"Found {len(valid_comments)} valid requirements out of {len(comments)}")
+
+            await out_queue.put({
+                "comments": comments,
+                "binary_results": binary_results,
+                "valid_comments": valid_comments
+            })
+        await out_queue.put(None)
+
+    async def _multiclass_stage(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        """Stage 2: multiclass classification of the valid requirements of each chunk"""
+        while (chunk := await in_queue.get()) is not None:
+            chunk["multiclass_results"] = []
+            if chunk["valid_comments"]:
+                chunk["multiclass_results"] = await prediction_cache_service.predict_cached(
+                    "multiclass",
+                    chunk["valid_comments"],
+                    batching_service.predict_multiclass
+                )
+            await out_queue.put(chunk)
+        await out_queue.put(None)
+
+    async def _description_stage(
+        self,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue,
+        generate_descriptions: bool,
+        description_tasks: List[asyncio.Future],
+        description_stats: Dict[str, int]
+    ):
+        """
+        Stage 3: start the LLM calls of each chunk without waiting for them
+
+        The description tasks are handed downstream, so several chunks can have
+        LLM calls in flight; the bounded output queue caps how many.
+        """
+        near_duplicates = NearDuplicateIndex() if settings.NEAR_DUPLICATE_ENABLED else None
+        group_tasks: Dict[int, asyncio.Future] = {}
+        owner = f"batch-{next(self._batch_ids)}"
+
+        while (chunk := await in_queue.get()) is not None:
+            chunk["descriptions"] = None
+            if generate_descriptions and chunk["valid_comments"]:
+                tasks = self._start_descriptions(
+                    chunk["valid_comments"],
+                    chunk["multiclass_results"],
+                    near_duplicates,
+                    group_tasks,
+                    description_stats,
+                    owner
+                )
+                description_tasks.extend(tasks)
+                chunk["descriptions"] = tasks
+            await out_queue.put(chunk)
+        await out_queue.put(None)
+
+    async def process_batch_stream(
+        self,
+        comments: List[str],
+        generate_descriptions: bool = True,
+        chunk_size: Optional[int] = None,
+        stats: Optional[Dict] = None
+    ) -> AsyncIterator[ResultSet]:
+        """
+        Process comments chunk by chunk, yielding results as each chunk completes - ASYNC
+
+        The binary, multiclass and description stages run concurrently on
+        different chunks, connected by bounded queues, so wall-clock time
+        tends towards the slowest stage instead of the sum of all stages.
+
+        Args:
+            comments: List of comment texts
+            generate_descriptions: Whether to generate descriptions
+            chunk_size: Comments per chunk (defaults to settings.STREAM_CHUNK_SIZE)
+            stats: Optional dictionary updated with description call counts
+
+        Yields:
+            ResultSet of each chunk, in input order
+        """
+        chunk_size = max(1, chunk_size or settings.STREAM_CHUNK_SIZE)
+        chunks = [comments[i:i + chunk_size] for i in range(0, len(comments), chunk_size)]
+        if not chunks:
+            return
+
+        binary_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+        multiclass_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+        output_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+
+        description_tasks: List[asyncio.Future] = []
+        description_stats = {"description_items": 0, "description_calls": 0}
+        stages = [
+            asyncio.create_task(self._binary_stage(chunks, binary_queue)),
+            asyncio.create_task(self._multiclass_stage(binary_queue, multiclass_queue)),
+            asyncio.create_task(self._description_stage(
+                multiclass_queue,
+                output_queue,
+                generate_descriptions,
+                description_tasks,
+                description_stats
+            )),
+        ]
+
+        try:
+            while True:
+                # Wait for the next chunk, but surface a failed stage instead of hanging
+                getter = asyncio.ensure_future(output_queue.get())
+                await asyncio.wait([getter, *stages], return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    for stage in stages:
+                        if stage.done() and stage.exception() is not None:
+                            raise stage.exception()
+                    continue
+
+                chunk = getter.result()
+                if chunk is None:
+                    break
+
+                descriptions = []
+                if chunk["descriptions"] is not None:
+                    descriptions = await asyncio.gather(*chunk["descriptions"])
+
+                yield self._build_results(
+                    chunk["comments"],
+                    chunk["binary_results"],
+                    chunk["multiclass_results"],
+                    descriptions
+                )
+
+            if stats is not None:
+                stats.update(description_stats)
+                stats["description_calls_saved"] = (
+                    description_stats["description_items"] - description_stats["description_calls"]
+                )
+        finally:
+            # Consumer stopped early or a stage failed: stop the remaining work
+            for task in stages + description_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+
+    def _deduplicate(self, comments: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Group comments that only differ in casing, whitespace or trailing punctuation
+
+        Args:
+            comments: List of comment texts
+
+        Returns:
+            Tuple of (unique comments, index into them for every original comment);
+            each unique comment is the first original occurrence of its key
+        """
+        unique_comments: List[str] = []
+        positions: Dict[str, int] = {}
+        mapping: List[int] = []
+
+        for comment in comments:
+            key = normalize_for_dedup(comment)
+            if key not in positions:
+                positions[key] = len(unique_comments)
+                unique_comments.append(comment)
+            mapping.append(positions[key])
+
+        return unique_comments, mapping
+
+    async def process_batch_with_stats(
+        self,
+        comments: List[str],
+        generate_descriptions: bool = True
+    ) -> Tuple[ResultSet, Dict]:
+        """
+        Process a batch, running inference and descriptions once per unique comment - ASYNC
+
+        Duplicates are fanned back out in the original order, each result
+        keeping its own original comment text.
+
+        Args:
+            comments: List of comment texts
+            generate_descriptions: Whether to generate descriptions
+
+        Returns:
+            Tuple of (ResultSet, deduplication statistics
+            including the LLM description calls saved by near-duplicate grouping)
+        """
+        logger.info(f"Processing batch of {len(comments)} comments")
+
+        if settings.ENABLE_DEDUPLICATION:
+            unique_comments, mapping = self._deduplicate(comments)
+        else:
+            unique_comments, mapping = comments, list(range(len(comments)))
+
+        duplicates = len(comments) - len(unique_comments)
+        if duplicates:
+            logger.info(f"Deduplicated {duplicates} repeated comments ({len(unique_comments)} unique)")
+
+        stats: Dict = {}
+        unique_results = ResultSet()
+        async for chunk_results in self.process_batch_stream(
+            unique_comments, generate_descriptions, stats=stats
+        ):
+            unique_results.extend(chunk_results)
+
+        results = unique_results.take(mapping, comments) if duplicates else unique_results
+
+        stats.update({
+            "total_comments": len(comments),
+            "unique_comments": len(unique_comments),
+            "duplicates": duplicates,
+            "duplicate_ratio": round(duplicates / len(comments), 4) if comments else 0.0
+        })
+        return results, stats
+
+    async def process_batch(
+        self,
+        comments: List[str],
+        generate_descriptions: bool = True
+    ) -> ResultSet:
+        """
+        Process multiple comments efficiently with PARALLEL LLM calls - ASYNC
+
+        Built on top of process_batch_stream, with duplicate comments processed once.
+
+        Args:
+            comments: List of comment texts
+            generate_descriptions: Whether to generate descriptions
+
+        Returns:
+            ResultSet with one row per comment
+        """
+        results, _ = await self.process_batch_with_stats(comments, generate_descriptions)
+        return results
+
 
 # Global service instance
 processing_service = ProcessingService()
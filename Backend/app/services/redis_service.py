@@ -5,7 +5,8 @@ Handles caching operations with Redis for improved performance
 
 import json
 import hashlib
-from typing import Optional, Any, Callable
+import uuid
+from typing import Optional, Any, Callable, Dict, List
 from functools import wraps
 import asyncio
 from app.core.logger import get_logger
@@ -21,6 +22,15 @@ class RedisService:
     and fallback to no-cache if Redis is unavailable.
     """
 
+    # Delete the lock only if it still holds our token (it may have expired
+    # and been taken by another worker meanwhile)
+    _RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
     def __init__(self):
         """Initialize Redis service with lazy connection"""
         self.redis_client = None
@@ -128,6 +138,116 @@ class RedisService:
         except Exception as e:
             logger.warning(f"Cache set error for {key}: {e}")
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in one round trip
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values (None for misses/errors), in key order
+        """
+        if not keys:
+            return []
+
+        if not self.enabled:
+            await self._ensure_connected()
+
+        if not self.enabled:
+            return [None] * len(keys)
+
+        try:
+            values = await self.redis_client.mget(keys)
+            hits = sum(1 for v in values if v)
+            logger.debug(f"Cache MGET: {hits}/{len(keys)} hits")
+            return [json.loads(v) if v else None for v in values]
+        except Exception as e:
+            logger.warning(f"Cache mget error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = 3600):
+        """
+        Set several values in cache in one round trip
+
+        Args:
+            items: Mapping of cache key to value (must be JSON serializable)
+            ttl: Time to live in seconds (default: 1 hour)
+        """
+        if not items:
+            return
+
+        if not self.enabled:
+            await self._ensure_connected()
+
+        if not self.enabled:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, json.dumps(value, ensure_ascii=False))
+            await pipe.execute()
+            logger.debug(f"Cache MSET: {len(items)} keys (TTL: {ttl}s)")
+        except Exception as e:
+            logger.warning(f"Cache set_many error for {len(items)} keys: {e}")
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """
+        Take a short-lived lock shared by every worker (SET NX PX)
+
+        Args:
+            key: Lock key
+            ttl_ms: Lock expiry, so a crashed holder cannot block others forever
+
+        Returns:
+            Token for release_lock, "" if Redis is unavailable (nothing to
+            coordinate with), or None if another worker holds the lock
+        """
+        if not self.enabled:
+            await self._ensure_connected()
+
+        if not self.enabled:
+            return ""
+
+        token = uuid.uuid4().hex
+        try:
+            if await self.redis_client.set(key, token, nx=True, px=ttl_ms):
+                logger.debug(f"Lock ACQUIRED: {key[:50]}...")
+                return token
+            return None
+        except Exception as e:
+            logger.warning(f"Lock acquire error for {key}: {e}")
+            return ""
+
+    async def release_lock(self, key: str, token: str):
+        """
+        Release a lock taken with acquire_lock (only if still held by this token)
+
+        Args:
+            key: Lock key
+            token: Token returned by acquire_lock
+        """
+        if not token or not self.enabled:
+            return
+
+        try:
+            await self.redis_client.eval(self._RELEASE_LOCK_SCRIPT, 1, key, token)
+            logger.debug(f"Lock RELEASED: {key[:50]}...")
+        except Exception as e:
+            logger.warning(f"Lock release error for {key}: {e}")
+
+    async def lock_exists(self, key: str) -> bool:
+        """Check whether a lock is currently held (False if Redis is unavailable)"""
+        if not self.enabled:
+            return False
+
+        try:
+            return bool(await self.redis_client.exists(key))
+        except Exception as e:
+            logger.warning(f"Lock check error for {key}: {e}")
+            return False
+
     async def delete(self, key: str):
         """Delete key from cache"""
         if not self.enabled:
@@ -0,0 +1,179 @@
+"""
+Tokenization Service
+Shared, cached tokenization layer for the binary and multiclass classifiers
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+import numpy as np
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.constants import MAX_SEQUENCE_LENGTH
+
+logger = get_logger(__name__)
+
+
+class TokenizationService:
+    """
+    Batch-tokenizes texts once and keeps the encodings in an LRU cache
+
+    Entries are keyed by (tokenizer fingerprint, text hash). Both classifiers
+    are fine-tuned from the same base model, so when their tokenizers match
+    the multiclass stage reuses the encodings produced for the binary stage;
+    when they don't, the fingerprints differ and each model gets its own
+    encodings automatically.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize tokenization service
+
+        Args:
+            max_entries: Maximum number of cached encodings (0 disables caching)
+        """
+        logger.info(f"Initializing Tokenization Service (cache size: {max_entries})")
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+        # Weak keys: a tokenizer swapped out with its model must not be kept alive
+        self._fingerprints: "weakref.WeakKeyDictionary[object, str]" = weakref.WeakKeyDictionary()
+        self._fingerprint_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, tokenizer) -> str:
+        """
+        Stable identifier of a tokenizer's behaviour
+
+        Two tokenizers with the same class, vocabulary, casing and special
+        tokens produce identical input_ids, so they share a fingerprint.
+
+        Args:
+            tokenizer: HuggingFace tokenizer
+
+        Returns:
+            Hex digest identifying the tokenizer
+        """
+        fingerprint = self._fingerprints.get(tokenizer)
+        if fingerprint is not None:
+            return fingerprint
+
+        # Hashing the vocabulary is slow: compute it once per tokenizer
+        with self._fingerprint_lock:
+            fingerprint = self._fingerprints.get(tokenizer)
+            if fingerprint is None:
+                digest = hashlib.sha1()
+                digest.update(type(tokenizer).__name__.encode())
+                digest.update(repr(sorted(tokenizer.get_vocab().items())).encode())
+                digest.update(repr(sorted(tokenizer.special_tokens_map.items())).encode())
+                digest.update(repr(getattr(tokenizer, "do_lower_case", None)).encode())
+                fingerprint = digest.hexdigest()
+                self._fingerprints[tokenizer] = fingerprint
+            return fingerprint
+
+    def tokenizers_match(self, first, second) -> bool:
+        """Check whether two tokenizers produce identical encodings"""
+        return self.fingerprint(first) == self.fingerprint(second)
+
+    def encode(self, tokenizer, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode texts (truncated, unpadded), reusing cached encodings
+
+        Args:
+            tokenizer: HuggingFace tokenizer
+            texts: Texts to encode
+
+        Returns:
+            One int32 input_ids array per text, in input order
+        """
+        fingerprint = self.fingerprint(tokenizer)
+        keys = [
+            (fingerprint, hashlib.sha1(text.encode("utf-8")).digest())
+            for text in texts
+        ]
+
+        encodings: List[np.ndarray] = [None] * len(texts)
+        missing: Dict[Tuple[str, bytes], List[int]] = {}
+
+        with self._lock:
+            for idx, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    encodings[idx] = cached
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(idx)
+                    self.misses += 1
+
+        if missing:
+            # Tokenize each distinct missing text once, in a single batch call
+            first_indices = [indices[0] for indices in missing.values()]
+            input_ids = tokenizer(
+                [texts[idx] for idx in first_indices],
+                truncation=True,
+                max_length=MAX_SEQUENCE_LENGTH,
+                return_attention_mask=False,
+                return_token_type_ids=False
+            )["input_ids"]
+
+            with self._lock:
+                for (key, indices), ids in zip(missing.items(), input_ids):
+                    encoded = np.asarray(ids, dtype=np.int32)
+                    for idx in indices:
+                        encodings[idx] = encoded
+                    if self.max_entries > 0:
+                        self._cache[key] = encoded
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+
+        return encodings
+
+    @staticmethod
+    def collate(tokenizer, encodings: List[np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Pad a list of encodings into model-ready int64 arrays
+
+        Args:
+            tokenizer: Tokenizer that produced the encodings
+            encodings: input_ids arrays
+
+        Returns:
+            Dictionary with input_ids, attention_mask (and token_type_ids
+            when the model expects them)
+        """
+        max_len = max(len(ids) for ids in encodings)
+        pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+        left = getattr(tokenizer, "padding_side", "right") == "left"
+
+        input_ids = np.full((len(encodings), max_len), pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(encodings), max_len), dtype=np.int64)
+
+        for row, ids in enumerate(encodings):
+            span = slice(max_len - len(ids), max_len) if left else slice(0, len(ids))
+            input_ids[row, span] = ids
+            attention_mask[row, span] = 1
+
+        batch = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in tokenizer.model_input_names:
+            batch["token_type_ids"] = np.zeros_like(input_ids)
+        return batch
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+# Global service instance
+tokenization_service = TokenizationService(settings.TOKENIZATION_CACHE_SIZE)
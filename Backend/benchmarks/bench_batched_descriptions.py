@@ -0,0 +1,82 @@
+"""
+Batched description prompts benchmark
+Describes the same requirements through DescriptionService.generate_descriptions
+against the local fake provider, once per LLM_BATCH_SIZE, and reports LLM
+requests, prompt tokens, template fallbacks and wall time
+
+--malformed-rate makes the fake provider drop that fraction of the items from
+each batched reply, so the per-item retries show up in the request count.
+
+Usage (from Backend/):
+    python -m benchmarks.bench_batched_descriptions
+    python -m benchmarks.bench_batched_descriptions --items 120 --batch-sizes 1 4 8 16 --malformed-rate 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.bench_llm_dispatcher import configure_backend, start_fake_server
+
+PORT = 8091
+SUBCHARACTERISTICS = ("Confidencialidad", "Integridad", "Autenticidad", "Resistencia")
+
+
+async def describe_all(batch_size: int, items: int) -> tuple:
+    """(seconds, template fallbacks) of describing items requirements"""
+    from app.core.config import settings
+    from app.services.description_service import description_service
+
+    settings.LLM_BATCH_SIZE = batch_size
+    requirements = [
+        (f"la app muestra mis datos de pago sin pedir contraseña ({batch_size}-{i})", SUBCHARACTERISTICS[i % 4])
+        for i in range(items)
+    ]
+    templates = {description_service._generate_with_template(c, s) for c, s in requirements}
+
+    start = time.perf_counter()
+    descriptions = await description_service.generate_descriptions(requirements, owner=f"bench-{batch_size}")
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(1 for d in descriptions if d in templates)
+
+
+def main(args: argparse.Namespace) -> None:
+    import httpx
+
+    configure_backend(args, args.port)
+    start_fake_server(args, args.port, args.malformed_rate)
+
+    def fetch_stats():
+        return httpx.get(f"http://127.0.0.1:{args.port}/stats").json()
+
+    print(
+        f"Fake provider: {args.rpm} req/min, {args.latency_ms}ms latency, "
+        f"{args.malformed_rate:.0%} items dropped per batched reply; {args.items} requirements"
+    )
+    print(f"{'batch':>6}{'requests':>10}{'prompt tok':>12}{'429s':>6}{'fallbacks':>11}{'seconds':>9}")
+
+    async def run_all() -> None:
+        # One event loop for every run: the service's client is bound to it
+        for batch_size in args.batch_sizes:
+            before = await asyncio.to_thread(fetch_stats)
+            elapsed, fallbacks = await describe_all(batch_size, args.items)
+            after = await asyncio.to_thread(fetch_stats)
+            print(
+                f"{batch_size:>6}{after['completions'] - before['completions']:>10}"
+                f"{after['prompt_tokens'] - before['prompt_tokens']:>12}"
+                f"{after['rate_limited'] - before['rate_limited']:>6}{fallbacks:>11}{elapsed:>9.2f}"
+            )
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--rpm", type=int, default=3000)
+    parser.add_argument("--tpm", type=int, default=2000000)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8])
+    main(parser.parse_args())
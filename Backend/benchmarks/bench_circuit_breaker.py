@@ -0,0 +1,133 @@
+"""
+LLM circuit breaker benchmark
+Sends several requirement-description requests through DescriptionService
+while the preferred provider (Groq, a local fake) is degraded, then heals it:
+
+- no breaker, no alternate: every call waits for the client timeout, then
+                            falls back to the template (previous behaviour),
+- breaker, no alternate:    once the breaker opens, calls go straight to the template,
+- breaker + alternate:      once the breaker opens, calls go to the alternate
+                            provider (OpenAI, a second healthy fake).
+
+Reported per request: wall time, calls received by each fake provider and
+template descriptions (the rest came from an LLM). After
+healing the provider it waits LLM_BREAKER_OPEN_S and shows the half-open
+probes closing the breaker again.
+
+Usage (from Backend/):
+    python -m benchmarks.bench_circuit_breaker
+    python -m benchmarks.bench_circuit_breaker --primary-error-rate 1 --primary-latency-ms 100
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.bench_llm_dispatcher import start_fake_server
+
+PORT = 8093
+
+
+def configure_backend(args: argparse.Namespace) -> None:
+    """Point both providers at the fake servers (before app modules are imported)"""
+    os.environ.update({
+        "PROVIDER": "groq",
+        "GROQ_API_KEY": "fake",
+        "GROQ_BASE_URL": f"http://127.0.0.1:{args.port}/v1",
+        "GROQ_REQUESTS_PER_MINUTE": "0",
+        "GROQ_TOKENS_PER_MINUTE": "0",
+        "OPENAI_API_KEY": "fake",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{args.port + 1}/v1",
+        "OPENAI_REQUESTS_PER_MINUTE": "0",
+        "OPENAI_TOKENS_PER_MINUTE": "0",
+        "LLM_REQUEST_TIMEOUT_S": str(args.timeout_s),
+        "LLM_BREAKER_OPEN_S": str(args.open_s),
+        "LLM_BATCH_SIZE": "1",
+        "ENABLE_CACHE": "false"
+    })
+
+
+async def run(args: argparse.Namespace) -> None:
+    import httpx
+    from app.core.config import settings
+    from app.services import llm_dispatcher
+    from app.services.description_service import description_service
+
+    primary = f"http://127.0.0.1:{args.port}"
+    alternate = f"http://127.0.0.1:{args.port + 1}"
+    http = httpx.AsyncClient()
+    request_ids = iter(range(1_000_000))
+
+    async def received(base_url: str) -> int:
+        return (await http.get(f"{base_url}/stats")).json()["requests"]
+
+    async def describe_request(label: str) -> None:
+        """One request of --items requirements; prints time and description sources"""
+        request_id = next(request_ids)
+        items = [
+            (f"la app no cifra mis mensajes ({request_id}-{i})", "Confidencialidad")
+            for i in range(args.items)
+        ]
+        template = description_service._generate_with_template("", "Confidencialidad")
+        primary_before, alternate_before = await received(primary), await received(alternate)
+
+        start = time.perf_counter()
+        descriptions = await description_service.generate_descriptions(items, owner=f"request-{request_id}")
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"  {label:<28}{elapsed:>7.2f}s  groq calls={await received(primary) - primary_before:<3} "
+            f"openai calls={await received(alternate) - alternate_before:<3} "
+            f"template={sum(1 for d in descriptions if d == template)}"
+        )
+
+    degraded = {"latency_ms": args.primary_latency_ms, "error_rate": args.primary_error_rate}
+    healthy = {"latency_ms": args.latency_ms, "error_rate": 0.0}
+    await http.post(f"{primary}/config", json=degraded)
+
+    for breaker, use_alternate in ((False, False), (True, False), (True, True)):
+        mode = ("breaker" if breaker else "no breaker") + (" + alternate" if use_alternate else ", no alternate")
+        print(mode)
+        # Fresh dispatchers (and breakers) per mode
+        settings.LLM_BREAKER_ENABLED = breaker
+        llm_dispatcher._dispatchers.clear()
+        description_service.alternate_provider = "openai" if use_alternate else None
+        for r in range(args.requests):
+            await describe_request(f"request {r + 1}")
+
+    print(f"groq healed, waiting {args.open_s:.0f}s for half-open probing")
+    await http.post(f"{primary}/config", json=healthy)
+    await asyncio.sleep(args.open_s)
+    await describe_request("request after healing")
+
+    transitions = llm_dispatcher.get_dispatcher("groq").get_stats()["circuit_breaker"]["transitions"]
+    for t in transitions:
+        print(f"  breaker: {t['from']} → {t['to']} ({t['reason']})")
+    await http.aclose()
+
+
+def main(args: argparse.Namespace) -> None:
+    configure_backend(args)
+    start_fake_server(args, args.port)
+    start_fake_server(args, args.port + 1)
+    print(
+        f"groq degraded: {args.primary_latency_ms:.0f}ms latency, {args.primary_error_rate:.0%} errors "
+        f"(client timeout {args.timeout_s}s); {args.requests} requests of {args.items} requirements per mode"
+    )
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=PORT, help="fake providers use this port and the next")
+    parser.add_argument("--rpm", type=int, default=100000, help="fake provider quotas")
+    parser.add_argument("--tpm", type=int, default=100000000)
+    parser.add_argument("--latency-ms", type=float, default=100, help="latency of a healthy provider")
+    parser.add_argument("--primary-latency-ms", type=float, default=3000)
+    parser.add_argument("--primary-error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-s", type=float, default=1.0)
+    parser.add_argument("--open-s", type=float, default=3.0)
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--requests", type=int, default=3)
+    main(parser.parse_args())
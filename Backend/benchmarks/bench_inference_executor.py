@@ -0,0 +1,73 @@
+"""
+Inference executor benchmark
+Aggregate throughput under 1, 4 and 16 concurrent requests, comparing
+asyncio's default thread pool with the dedicated inference executor
+
+Usage (from Backend/):
+    python -m benchmarks.bench_inference_executor
+    INFERENCE_LANES=2 python -m benchmarks.bench_inference_executor --batch 32
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from app.services.huggingface_service import huggingface_service
+from app.services.inference_executor import inference_executor
+from benchmarks.samples import sample_texts
+
+
+async def measure(
+    run: Callable[[List[str]], Awaitable],
+    concurrency: int,
+    requests_per_client: int,
+    batch: int
+) -> float:
+    """Texts per second with `concurrency` clients sending batches back-to-back"""
+    texts = sample_texts(batch)
+
+    async def client():
+        for _ in range(requests_per_client):
+            await run(texts)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return concurrency * requests_per_client * batch / (time.perf_counter() - start)
+
+
+async def main(args: argparse.Namespace):
+    huggingface_service.preload()
+    loop = asyncio.get_running_loop()
+
+    async def default_pool(texts: List[str]):
+        return await loop.run_in_executor(None, huggingface_service.batch_predict_binary, texts)
+
+    async def dedicated(texts: List[str]):
+        return await inference_executor.run(huggingface_service.batch_predict_binary, texts)
+
+    # Warm up both paths
+    await default_pool(sample_texts(8))
+    await dedicated(sample_texts(8))
+
+    stats = inference_executor.get_stats()
+    print(
+        f"batch={args.batch} requests/client={args.requests} "
+        f"lanes={stats['lanes']} threads/lane={stats['threads_per_lane']}"
+    )
+    print(f"{'concurrency':<14}{'default pool':>16}{'dedicated':>16}   (texts/s)")
+
+    for concurrency in (1, 4, 16):
+        default_tps = await measure(default_pool, concurrency, args.requests, args.batch)
+        dedicated_tps = await measure(dedicated, concurrency, args.requests, args.batch)
+        print(f"{concurrency:<14}{default_tps:>16.1f}{dedicated_tps:>16.1f}")
+
+    stats = inference_executor.get_stats()
+    print(f"dedicated executor wait: avg={stats['avg_wait_ms']:.1f}ms max={stats['max_wait_ms']:.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=16, help="texts per request")
+    parser.add_argument("--requests", type=int, default=8, help="requests per client")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,159 @@
+"""
+LLM dispatcher load test against the fake provider
+Fires one large batch and, shortly after, several small ones at a local
+rate-limited fake server, comparing:
+- direct:     every call at once through a plain client (previous behaviour:
+              client-side retries, then template fallback),
+- dispatcher: the same calls through DescriptionService and the shared
+              LLM dispatcher (quotas, concurrency cap, Retry-After, fair sharing)
+
+Reported per mode: 429s served, template fallbacks and, per batch, the time
+until its last description arrived.
+
+Usage (from Backend/):
+    python -m benchmarks.bench_llm_dispatcher
+    python -m benchmarks.bench_llm_dispatcher --rpm 120 --large 200 --small 10 --small-batches 3
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, List
+
+PORT = 8089
+
+
+def start_fake_server(args: argparse.Namespace, port: int, malformed_rate: float = 0.0):
+    """Run a fake provider (fresh quotas) in a background thread and wait until it serves"""
+    import uvicorn
+    from benchmarks.fake_llm_server import create_app
+
+    config = uvicorn.Config(
+        create_app(args.rpm, args.tpm, args.latency_ms, malformed_rate),
+        host="127.0.0.1",
+        port=port,
+        log_level="error"
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def configure_backend(args: argparse.Namespace, port: int) -> None:
+    """Point the backend at a fake provider (before app modules are imported)"""
+    os.environ.update({
+        "PROVIDER": "openai",
+        "OPENAI_API_KEY": "fake",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{port}/v1",
+        "OPENAI_REQUESTS_PER_MINUTE": str(args.rpm),
+        "OPENAI_TOKENS_PER_MINUTE": str(args.tpm),
+        "ENABLE_CACHE": "false"
+    })
+
+
+def batch_comments(args: argparse.Namespace) -> Dict[str, List[str]]:
+    batches = {"large": [f"la app se cierra al abrir la pantalla {i}" for i in range(args.large)]}
+    for b in range(args.small_batches):
+        batches[f"small-{b + 1}"] = [f"no encuentro la opción {b}-{i}" for i in range(args.small)]
+    return batches
+
+
+async def run_direct(args: argparse.Namespace, fetch_stats) -> None:
+    """Previous behaviour: one gather per batch straight at the provider"""
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI(api_key="fake", base_url=f"http://127.0.0.1:{args.port}/v1")
+    fallbacks = 0
+
+    async def describe(comment: str) -> None:
+        nonlocal fallbacks
+        try:
+            await client.chat.completions.create(
+                model="fake",
+                messages=[{"role": "user", "content": f"Comentario: {comment}"}],
+                max_tokens=200
+            )
+        except Exception:
+            fallbacks += 1
+
+    await run_batches(args, describe)
+    await client.close()
+    print(f"  direct:     429s={fetch_stats()['rate_limited']:<5} template fallbacks={fallbacks}")
+
+
+async def run_dispatcher(args: argparse.Namespace, fetch_stats) -> None:
+    """Same load through DescriptionService and the shared dispatcher"""
+    from app.services.description_service import description_service
+    from app.services.llm_dispatcher import get_dispatcher
+
+    template = description_service._generate_with_template("", "Operabilidad")
+    fallbacks = 0
+
+    async def describe(comment: str, owner: str) -> None:
+        nonlocal fallbacks
+        if await description_service.generate_description(comment, "Operabilidad", owner) == template:
+            fallbacks += 1
+
+    await run_batches(args, describe, with_owner=True)
+    stats = get_dispatcher("openai").get_stats()
+    print(
+        f"  dispatcher: 429s={fetch_stats()['rate_limited']:<5} template fallbacks={fallbacks} "
+        f"(rate-limit waits summed over calls: {stats['total_rate_wait_s']}s)"
+    )
+
+
+async def run_batches(args: argparse.Namespace, describe, with_owner: bool = False) -> None:
+    """Start the large batch, then the small ones after --small-delay seconds"""
+    start = time.perf_counter()
+    finished: Dict[str, float] = {}
+
+    async def run_batch(name: str, comments: List[str], delay: float) -> None:
+        await asyncio.sleep(delay)
+        started = time.perf_counter()
+        calls = [describe(c, name) if with_owner else describe(c) for c in comments]
+        await asyncio.gather(*calls)
+        finished[name] = (time.perf_counter() - started, time.perf_counter() - start)
+
+    await asyncio.gather(*[
+        run_batch(name, comments, 0.0 if name == "large" else args.small_delay)
+        for name, comments in batch_comments(args).items()
+    ])
+    for name, (took, at) in finished.items():
+        print(f"    {name:<9} {took:>6.1f}s (done at {at:.1f}s)")
+
+
+def main(args: argparse.Namespace) -> None:
+    import httpx
+
+    # One fake provider per mode, so both start with a full quota
+    direct_port, dispatcher_port = args.port, args.port + 1
+    configure_backend(args, dispatcher_port)
+    start_fake_server(args, direct_port)
+    start_fake_server(args, dispatcher_port)
+
+    def stats_of(port: int):
+        return lambda: httpx.get(f"http://127.0.0.1:{port}/stats").json()
+
+    print(
+        f"Fake provider: {args.rpm} req/min, {args.tpm} tokens/min, {args.latency_ms}ms latency; "
+        f"1 batch of {args.large} + {args.small_batches} of {args.small} calls"
+    )
+    asyncio.run(run_direct(args, stats_of(direct_port)))
+    asyncio.run(run_dispatcher(args, stats_of(dispatcher_port)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=PORT, help="fake providers use this port and the next")
+    parser.add_argument("--rpm", type=int, default=300)
+    parser.add_argument("--tpm", type=int, default=200000)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--large", type=int, default=400)
+    parser.add_argument("--small", type=int, default=10)
+    parser.add_argument("--small-batches", type=int, default=2)
+    parser.add_argument("--small-delay", type=float, default=1.0)
+    main(parser.parse_args())
@@ -0,0 +1,117 @@
+"""
+Micro-batching benchmark
+Compares p50/p99 latency and requests/sec with micro-batching on and off
+
+Usage (from Backend/):
+    python -m benchmarks.bench_micro_batching
+    python -m benchmarks.bench_micro_batching --concurrency 64 --requests 2000
+    python -m benchmarks.bench_micro_batching --real   # uses the real BERT models
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import Callable, Dict, List
+
+from app.services.batching_service import MicroBatcher
+
+SAMPLE_COMMENT = (
+    "La aplicación se cierra cada vez que intento abrir el chat y no entiendo "
+    "qué significan los íconos del menú principal"
+)
+
+
+class SyntheticModel:
+    """
+    CPU-bound model stand-in: a fixed per-call overhead plus a per-item cost
+
+    A lock serializes forward passes, like a single saturated CPU would.
+    """
+
+    def __init__(self, call_overhead_ms: float, per_item_ms: float):
+        self.call_overhead = call_overhead_ms / 1000.0
+        self.per_item = per_item_ms / 1000.0
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> List[Dict]:
+        with self._lock:
+            time.sleep(self.call_overhead + self.per_item * len(texts))
+        return [{"label": "LABEL_1", "score": 0.99} for _ in texts]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(
+    predict: Callable[[List[str]], "asyncio.Future"],
+    concurrency: int,
+    total_requests: int
+) -> Dict[str, float]:
+    """Fire total_requests single-comment requests from `concurrency` clients"""
+    latencies: List[float] = []
+    remaining = total_requests
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await predict([SAMPLE_COMMENT])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": percentile(latencies, 99),
+        "rps": len(latencies) / elapsed
+    }
+
+
+async def main(args: argparse.Namespace):
+    if args.real:
+        from app.services.huggingface_service import huggingface_service
+        batch_fn = huggingface_service.batch_predict_binary
+        batch_fn([SAMPLE_COMMENT])  # load + warm up
+    else:
+        batch_fn = SyntheticModel(args.call_overhead_ms, args.per_item_ms)
+
+    loop = asyncio.get_running_loop()
+
+    async def unbatched(texts: List[str]):
+        return await loop.run_in_executor(None, batch_fn, texts)
+
+    batcher = MicroBatcher("bench", batch_fn, args.max_batch_size, args.wait_ms)
+
+    print(
+        f"concurrency={args.concurrency} requests={args.requests} "
+        f"max_batch_size={args.max_batch_size} wait_ms={args.wait_ms} "
+        f"model={'real' if args.real else 'synthetic'}"
+    )
+    print(f"{'mode':<12}{'p50 (ms)':>12}{'p99 (ms)':>12}{'req/s':>12}")
+
+    for mode, predict in (("batching off", unbatched), ("batching on", batcher.submit)):
+        stats = await run_load(predict, args.concurrency, args.requests)
+        print(f"{mode:<12}{stats['p50_ms']:>12.1f}{stats['p99_ms']:>12.1f}{stats['rps']:>12.1f}")
+
+    print(f"batcher stats: {batcher.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--wait-ms", type=float, default=10)
+    parser.add_argument("--call-overhead-ms", type=float, default=20, help="synthetic model only")
+    parser.add_argument("--per-item-ms", type=float, default=2, help="synthetic model only")
+    parser.add_argument("--real", action="store_true", help="benchmark the real binary model")
+    asyncio.run(main(parser.parse_args()))
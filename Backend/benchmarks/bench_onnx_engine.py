@@ -0,0 +1,88 @@
+"""
+ONNX Runtime engine benchmark
+Checks label/score parity against the PyTorch pipeline and compares throughput,
+both through the serving path (HuggingFaceService._predict_bucketed)
+
+Exits with status 1 if any label differs or a score delta exceeds --tolerance.
+
+Usage (from Backend/):
+    python -m benchmarks.bench_onnx_engine
+    python -m benchmarks.bench_onnx_engine --texts 512 --tolerance 1e-3
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List
+
+from app.core.config import settings
+from app.services.huggingface_service import HuggingFaceService
+from app.services.onnx_engine import load_onnx_pipeline
+from benchmarks.samples import SAMPLE_REVIEWS, sample_texts
+
+
+def check_parity(
+    name: str,
+    service: HuggingFaceService,
+    torch_pipe,
+    onnx_pipe,
+    tolerance: float
+) -> bool:
+    """Compare labels and scores of both engines on the sample reviews"""
+    torch_results = service._predict_bucketed(torch_pipe, SAMPLE_REVIEWS).to_dicts()
+    onnx_results = service._predict_bucketed(onnx_pipe, SAMPLE_REVIEWS).to_dicts()
+
+    label_mismatches = sum(
+        1 for t, o in zip(torch_results, onnx_results) if t["label"] != o["label"]
+    )
+    max_delta = max(
+        abs(t["score"] - o["score"]) for t, o in zip(torch_results, onnx_results)
+    )
+    ok = label_mismatches == 0 and max_delta <= tolerance
+
+    print(
+        f"[{name}] parity: label mismatches={label_mismatches}/{len(SAMPLE_REVIEWS)} "
+        f"max score delta={max_delta:.2e} -> {'OK' if ok else 'FAIL'}"
+    )
+    return ok
+
+
+def throughput(predict: Callable[[List[str]], List[Dict]], texts: List[str], repeats: int) -> float:
+    """Texts per second over `repeats` runs (after one warm-up run)"""
+    predict(texts[:8])
+    start = time.perf_counter()
+    for _ in range(repeats):
+        predict(texts)
+    return len(texts) * repeats / (time.perf_counter() - start)
+
+
+def main(args: argparse.Namespace) -> int:
+    service = HuggingFaceService()
+    texts = sample_texts(args.texts)
+    all_ok = True
+
+    for name, model_name in (
+        ("binary", settings.BINARY_MODEL_NAME),
+        ("multiclass", settings.MULTICLASS_MODEL_NAME),
+    ):
+        torch_pipe, _ = service._load_torch_pipeline(model_name, name, precision="fp32")
+        onnx_pipe = load_onnx_pipeline(model_name)
+
+        all_ok &= check_parity(name, service, torch_pipe, onnx_pipe, args.tolerance)
+
+        torch_tps = throughput(lambda t: service._predict_bucketed(torch_pipe, t), texts, args.repeats)
+        onnx_tps = throughput(lambda t: service._predict_bucketed(onnx_pipe, t), texts, args.repeats)
+        print(
+            f"[{name}] throughput: torch={torch_tps:.1f} texts/s  "
+            f"onnx={onnx_tps:.1f} texts/s  speedup={onnx_tps / torch_tps:.2f}x"
+        )
+
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=1e-4)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""
+Raw-logits inference benchmark
+Compares the transformers text-classification pipeline with the direct
+logits path (batch_predict_arrays) at batch sizes 1, 32 and 256
+
+Usage (from Backend/):
+    python -m benchmarks.bench_raw_logits
+    python -m benchmarks.bench_raw_logits --model multiclass --repeats 10
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from app.core.constants import MAX_SEQUENCE_LENGTH
+from app.services.huggingface_service import HuggingFaceService
+from app.services.tokenization_service import tokenization_service
+from benchmarks.samples import sample_texts
+
+BATCH_SIZES = (1, 32, 256)
+
+
+def latency_ms(predict: Callable[[List[str]], object], texts: List[str], repeats: int) -> float:
+    """Average ms per call over `repeats` runs (after one warm-up call)"""
+    predict(texts)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        predict(texts)
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main(args: argparse.Namespace) -> None:
+    service = HuggingFaceService()
+    pipe = service.registry.get(args.model)
+
+    def pipeline_path(texts: List[str]):
+        return pipe(texts, batch_size=len(texts), truncation=True, max_length=MAX_SEQUENCE_LENGTH)
+
+    def direct_path(texts: List[str]):
+        return service.batch_predict_arrays(args.model, texts)
+
+    # Sanity check: both paths must agree on the labels
+    check = sample_texts(64, seed=1)
+    pipeline_labels = [r["label"] for r in pipeline_path(check)]
+    direct = direct_path(check)
+    mismatches = sum(
+        1 for label, label_id in zip(pipeline_labels, direct.label_ids)
+        if label != direct.labels[label_id]
+    )
+    print(f"[{args.model}] label mismatches pipeline vs direct: {mismatches}/{len(check)}")
+
+    # Repeated texts would hit the tokenization cache; disable it so both
+    # paths pay for tokenization on every call
+    tokenization_service.max_entries = 0
+    tokenization_service._cache.clear()
+
+    print(f"{'batch':>6}{'pipeline ms':>14}{'direct ms':>12}{'speedup':>10}")
+    for batch_size in BATCH_SIZES:
+        texts = sample_texts(batch_size)
+        repeats = args.repeats if batch_size > 1 else args.repeats * 10
+
+        pipeline_ms = latency_ms(pipeline_path, texts, repeats)
+        direct_ms = latency_ms(direct_path, texts, repeats)
+
+        print(
+            f"{batch_size:>6}{pipeline_ms:>14.2f}{direct_ms:>12.2f}"
+            f"{pipeline_ms / direct_ms:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", choices=["binary", "multiclass"], default="binary")
+    parser.add_argument("--repeats", type=int, default=5)
+    main(parser.parse_args())
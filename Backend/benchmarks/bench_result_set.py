@@ -0,0 +1,111 @@
+"""
+Result container benchmark
+Build + serialize time and peak memory of per-row Pydantic results vs the
+columnar ResultSet, at 1k, 10k and 100k rows
+
+Per-row path:  RequirementResult per row → ProcessingResponse → model_dump → JSON
+Columnar path: ResultSet rows → ProcessingReport → to_dict → JSON
+The boundary column adds ProcessingReport.to_response() (what the JSON
+endpoints pay once per request).
+
+Usage (from Backend/):
+    python -m benchmarks.bench_result_set
+    python -m benchmarks.bench_result_set --rows 1000 50000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from app.schemas.models import ProcessingResponse, RequirementResult
+from app.schemas.results import ProcessingReport, ResultSet
+from benchmarks.samples import sample_texts
+
+SUBCHARACTERISTICS = ("Operabilidad", "Aprendizabilidad", "Inclusividad", "Asistencia al usuario")
+
+
+def synthetic_rows(count: int) -> List[tuple]:
+    """Rows shaped like processing output (about a third are requirements)"""
+    texts = sample_texts(min(count, 512))
+    rows = []
+    for idx in range(count):
+        comment = texts[idx % len(texts)]
+        if idx % 3 == 0:
+            rows.append((
+                comment, True, SUBCHARACTERISTICS[idx % 4],
+                f"El sistema debe permitir {comment[:60]}", 0.91, 0.77
+            ))
+        else:
+            rows.append((comment, False, None, None, 0.12, None))
+    return rows
+
+
+def per_row_path(rows: List[tuple]) -> str:
+    results = [
+        RequirementResult(
+            comment=comment, is_requirement=is_req, subcharacteristic=subchar,
+            description=desc, binary_score=binary_score, multiclass_score=mc_score
+        )
+        for comment, is_req, subchar, desc, binary_score, mc_score in rows
+    ]
+    response = ProcessingResponse(
+        total_comments=len(rows),
+        valid_requirements=sum(1 for r in results if r.is_requirement),
+        requirements=results,
+        processing_time_ms=0.0,
+        source_type="csv"
+    )
+    return json.dumps(response.model_dump(), ensure_ascii=False)
+
+
+def columnar_path(rows: List[tuple]) -> str:
+    results = ResultSet()
+    for row in rows:
+        results.append(*row)
+    report = ProcessingReport(len(rows), results, 0.0, "csv")
+    return json.dumps(report.to_dict(), ensure_ascii=False)
+
+
+def columnar_with_boundary(rows: List[tuple]) -> str:
+    results = ResultSet()
+    for row in rows:
+        results.append(*row)
+    report = ProcessingReport(len(rows), results, 0.0, "csv")
+    report.to_response()
+    return json.dumps(report.to_dict(), ensure_ascii=False)
+
+
+def measure(path: Callable[[List[tuple]], str], rows: List[tuple]) -> Tuple[float, float, int]:
+    """(seconds, peak MiB, serialized bytes) of one run"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    payload = path(rows)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20, len(payload.encode("utf-8"))
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f"{'rows':>8}{'per-row s':>11}{'MiB':>8}{'KiB':>9}"
+        f"{'columnar s':>12}{'MiB':>8}{'KiB':>9}{'+boundary s':>13}{'speedup':>9}"
+    )
+    for count in args.rows:
+        rows = synthetic_rows(count)
+        per_row_s, per_row_mib, per_row_size = measure(per_row_path, rows)
+        columnar_s, columnar_mib, columnar_size = measure(columnar_path, rows)
+        boundary_s, _, _ = measure(columnar_with_boundary, rows)
+        print(
+            f"{count:>8}{per_row_s:>11.3f}{per_row_mib:>8.1f}{per_row_size / 1024:>9.0f}"
+            f"{columnar_s:>12.3f}{columnar_mib:>8.1f}{columnar_size / 1024:>9.0f}"
+            f"{boundary_s:>13.3f}{per_row_s / columnar_s:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    main(parser.parse_args())
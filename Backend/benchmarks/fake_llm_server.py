@@ -0,0 +1,170 @@
+"""
+Fake OpenAI-compatible chat completions server
+Enforces requests/min and tokens/min quotas like a real provider, answering
+429 with Retry-After when they are exceeded, so the LLM dispatcher can be
+load-tested offline
+
+Batched description prompts (numbered "N. Comentario:" lines) get a JSON
+array with one description per item; --malformed-rate drops that fraction
+of the items from the reply to exercise the per-item retries.
+
+--error-rate answers that fraction of the calls with a 500, and POST /config
+({"latency_ms": ..., "error_rate": ...}) degrades or heals the provider at
+runtime, to exercise the circuit breaker.
+
+Quotas are token buckets refilled continuously (a full minute's budget can
+be used as a burst). Point the backend at it with:
+    PROVIDER=openai OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+
+Usage (from Backend/):
+    python -m benchmarks.fake_llm_server --port 8089 --rpm 300 --tpm 200000 --latency-ms 100
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from typing import Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class Quota:
+    """Continuously refilled per-minute budget"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def try_take(self, amount: float) -> float:
+        """Take amount if available; otherwise return seconds until it is"""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.level >= amount:
+            self.level -= amount
+            return 0.0
+        return (amount - self.level) / self.rate
+
+
+DESCRIPTION = "El sistema debe permitir al usuario completar la acción descrita sin errores."
+BATCH_ITEM = re.compile(r"^(\d+)\. Comentario:", re.MULTILINE)
+
+
+def create_app(
+    rpm: float,
+    tpm: float,
+    latency_ms: float,
+    malformed_rate: float = 0.0,
+    error_rate: float = 0.0
+) -> FastAPI:
+    """Build the fake provider app"""
+    app = FastAPI(title="Fake LLM provider")
+    requests_quota = Quota(rpm)
+    tokens_quota = Quota(tpm)
+    config = {"latency_ms": latency_ms, "error_rate": error_rate}
+    stats: Dict[str, int] = {
+        "requests": 0, "completions": 0, "rate_limited": 0, "errors": 0, "tokens": 0, "prompt_tokens": 0
+    }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        stats["requests"] += 1
+        body = await request.json()
+        prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+        prompt_tokens = len(prompt) // 4
+        items = [int(n) for n in BATCH_ITEM.findall(prompt)]
+        if items:
+            content = json.dumps([
+                {"id": n, "descripcion": DESCRIPTION}
+                for n in items if random.random() >= malformed_rate
+            ], ensure_ascii=False)
+        else:
+            content = DESCRIPTION
+        completion_tokens = min(body.get("max_tokens") or 200, 60 * max(1, len(items)))
+        total_tokens = prompt_tokens + completion_tokens
+
+        wait = requests_quota.try_take(1)
+        if wait == 0.0:
+            wait = tokens_quota.try_take(total_tokens)
+            if wait > 0.0:
+                # Give the request slot back: only the token quota was exceeded
+                requests_quota.level += 1
+        if wait > 0.0:
+            stats["rate_limited"] += 1
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": str(math.ceil(wait))},
+                content={"error": {
+                    "message": "Rate limit reached, please retry later",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded"
+                }}
+            )
+
+        await asyncio.sleep(config["latency_ms"] / 1000)
+        if random.random() < config["error_rate"]:
+            stats["errors"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Internal server error", "type": "server_error"}}
+            )
+        stats["completions"] += 1
+        stats["tokens"] += total_tokens
+        stats["prompt_tokens"] += prompt_tokens
+        return {
+            "id": f"chatcmpl-fake-{stats['completions']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": content
+                },
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": total_tokens
+            }
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    @app.post("/config")
+    async def set_config(request: Request):
+        config.update(await request.json())
+        return config
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--rpm", type=float, default=300)
+    parser.add_argument("--tpm", type=float, default=200000)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    uvicorn.run(
+        create_app(args.rpm, args.tpm, args.latency_ms, args.malformed_rate, args.error_rate),
+        host=args.host,
+        port=args.port,
+        log_level="warning"
+    )
@@ -0,0 +1,83 @@
+"""
+bf16 / SDPA fast-path report
+Compares each precision/attention mode against fp32 eager on a sample set:
+label agreement, score deltas and throughput
+
+Run it once per node type to decide MODEL_PRECISION and ATTENTION_IMPL.
+Modes the node cannot run fall back to fp32/eager and are reported as such.
+
+Usage (from Backend/):
+    python -m benchmarks.precision_report
+    python -m benchmarks.precision_report --csv muestra.csv --text-column comentario --texts 512
+"""
+
+import argparse
+import time
+from typing import List
+
+from app.core.config import settings
+from app.core.cpu_features import detect_cpu_features
+from app.services.huggingface_service import HuggingFaceService
+from benchmarks.quantization_drift import drift_report
+from benchmarks.samples import sample_texts
+
+MODES = (
+    ("fp32", "sdpa"),
+    ("bf16", "eager"),
+    ("bf16", "sdpa"),
+)
+
+
+def throughput(service: HuggingFaceService, pipe, texts: List[str], repeats: int) -> float:
+    """Texts per second through the serving path (after one warm-up run)"""
+    service._predict_bucketed(pipe, texts[:8])
+    start = time.perf_counter()
+    for _ in range(repeats):
+        service._predict_bucketed(pipe, texts)
+    return len(texts) * repeats / (time.perf_counter() - start)
+
+
+def main(args: argparse.Namespace):
+    features = detect_cpu_features()
+    print("CPU features: " + ", ".join(f"{k}={'yes' if v else 'no'}" for k, v in features.items()))
+
+    service = HuggingFaceService()
+    texts = sample_texts(args.texts)
+    if args.csv:
+        from benchmarks.quantization_drift import load_sample
+        texts, _ = load_sample(args)
+
+    for name, model_name in (
+        ("binary", settings.BINARY_MODEL_NAME),
+        ("multiclass", settings.MULTICLASS_MODEL_NAME),
+    ):
+        print(f"[{name}] {model_name}")
+        base_pipe, _ = service._load_torch_pipeline(model_name, name, precision="fp32", attention="eager")
+        base = service._predict_bucketed(base_pipe, texts).to_dicts()
+        base_tps = throughput(service, base_pipe, texts, args.repeats)
+        print(f"  {'fp32/eager':<12} baseline                               {base_tps:>8.1f} texts/s")
+
+        for precision, attention in MODES:
+            pipe, effective = service._load_torch_pipeline(
+                model_name, name, precision=precision, attention=attention
+            )
+            mode = f"{effective['precision']}/{effective['attention']}"
+
+            report = drift_report(base, service._predict_bucketed(pipe, texts).to_dicts(), None)
+            tps = throughput(service, pipe, texts, args.repeats)
+            print(
+                f"  {precision + '/' + attention:<12} (ran as {mode:<10}) "
+                f"agreement={report['label_agreement']:.2%} "
+                f"max delta={report['score_delta_max']:.4f} "
+                f"{tps:>8.1f} texts/s ({tps / base_tps:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", help="sample CSV (with header); defaults to synthetic reviews")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default=None)
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,103 @@
+"""
+Int8 quantization accuracy-drift report
+Compares dynamic int8 predictions against fp32 on a labeled sample
+
+The sample is a CSV with a text column and, optionally, a gold label column.
+Without --csv the built-in sample reviews are used (fp32 agreement only).
+
+Usage (from Backend/):
+    python -m benchmarks.quantization_drift
+    python -m benchmarks.quantization_drift --csv muestra.csv --text-column comentario --label-column etiqueta
+"""
+
+import argparse
+import csv
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.huggingface_service import HuggingFaceService
+from benchmarks.samples import SAMPLE_REVIEWS
+
+
+def load_sample(args: argparse.Namespace) -> Tuple[List[str], Optional[List[str]]]:
+    """Read texts (and gold labels, if present) from the CSV"""
+    if not args.csv:
+        return list(SAMPLE_REVIEWS), None
+
+    texts, labels = [], []
+    with open(args.csv, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            texts.append(row[args.text_column])
+            if args.label_column and row.get(args.label_column):
+                labels.append(row[args.label_column])
+
+    return texts, (labels if len(labels) == len(texts) else None)
+
+
+def drift_report(fp32: List[Dict], int8: List[Dict], gold: Optional[List[str]]) -> Dict:
+    """Label agreement, score deltas and (optionally) accuracy of both precisions"""
+    deltas = sorted(abs(a["score"] - b["score"]) for a, b in zip(fp32, int8))
+    report = {
+        "samples": len(fp32),
+        "label_agreement": sum(a["label"] == b["label"] for a, b in zip(fp32, int8)) / len(fp32),
+        "score_delta_mean": statistics.mean(deltas),
+        "score_delta_p95": deltas[min(len(deltas) - 1, int(0.95 * len(deltas)))],
+        "score_delta_max": deltas[-1],
+    }
+    if gold:
+        report["accuracy_fp32"] = sum(p["label"] == g for p, g in zip(fp32, gold)) / len(gold)
+        report["accuracy_int8"] = sum(p["label"] == g for p, g in zip(int8, gold)) / len(gold)
+    return report
+
+
+def main(args: argparse.Namespace):
+    service = HuggingFaceService()
+    texts, gold = load_sample(args)
+
+    for name, model_name in (
+        ("binary", settings.BINARY_MODEL_NAME),
+        ("multiclass", settings.MULTICLASS_MODEL_NAME),
+    ):
+        fp32_pipe, _ = service._load_torch_pipeline(model_name, name, precision="fp32")
+        int8_pipe, load = service._load_torch_pipeline(model_name, name, precision="int8")
+
+        fp32 = service._predict_bucketed(fp32_pipe, texts).to_dicts()
+        int8 = service._predict_bucketed(int8_pipe, texts).to_dicts()
+
+        # Gold labels only make sense for the model they were annotated for
+        model_gold = gold if args.label_model == name else None
+        report = drift_report(fp32, int8, model_gold)
+
+        print(f"[{name}] {model_name}")
+        print(
+            f"  size: {load.get('size_fp32_mb')}MB → {load.get('size_int8_mb')}MB, "
+            f"speedup on load: {load.get('speedup')}x"
+        )
+        print(
+            f"  label agreement vs fp32: {report['label_agreement']:.2%} "
+            f"over {report['samples']} samples"
+        )
+        print(
+            f"  score delta: mean={report['score_delta_mean']:.4f} "
+            f"p95={report['score_delta_p95']:.4f} max={report['score_delta_max']:.4f}"
+        )
+        if "accuracy_fp32" in report:
+            print(
+                f"  accuracy: fp32={report['accuracy_fp32']:.2%} "
+                f"int8={report['accuracy_int8']:.2%}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", help="labeled sample CSV (with header)")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default=None, help="gold label column (optional)")
+    parser.add_argument(
+        "--label-model",
+        choices=["binary", "multiclass"],
+        default="binary",
+        help="model the gold labels belong to"
+    )
+    main(parser.parse_args())
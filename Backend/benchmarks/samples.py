@@ -0,0 +1,37 @@
+"""
+Sample review texts shared by the benchmarks
+"""
+
+import random
+from typing import List
+
+SAMPLE_REVIEWS = [
+    "La aplicación se cierra cada vez que intento abrir el chat",
+    "Muy buena app",
+    "No entiendo qué significan los íconos del menú principal, deberían tener una etiqueta",
+    "Excelente!!! 👍👍",
+    "El botón de enviar es demasiado pequeño y cuesta presionarlo con una sola mano",
+    "Me gustaría que hubiera un tutorial al inicio para aprender a usar las funciones avanzadas",
+    "Cuando me equivoco al escribir la dirección no hay forma de deshacer el pedido",
+    "El texto es muy pequeño y no se puede aumentar, para personas mayores es imposible de leer",
+    "Pésima",
+    "No sé si la app sirve para lo que necesito, la descripción no explica nada",
+    "Cada actualización cambia el menú de lugar y tengo que volver a aprender dónde está todo. "
+    "Antes era fácil encontrar el historial y ahora está escondido en tres submenús distintos, "
+    "además la ayuda en línea no explica los cambios ni ofrece una guía para usuarios antiguos.",
+]
+
+
+def sample_texts(count: int, seed: int = 0) -> List[str]:
+    """
+    Build a reproducible list of review texts
+
+    Args:
+        count: Number of texts
+        seed: Random seed
+
+    Returns:
+        List of texts sampled from SAMPLE_REVIEWS
+    """
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_REVIEWS) for _ in range(count)]
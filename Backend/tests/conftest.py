@@ -0,0 +1,95 @@
+"""
+Shared test configuration
+Settings are read from the environment at import time, so defaults that keep
+the tests offline (no Redis, no LLM provider) are set before app modules load.
+Tests that need real classifiers use tiny random checkpoints written to tmp.
+"""
+
+import os
+import string
+
+import pytest
+
+os.environ.setdefault("ENABLE_CACHE", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("GROQ_API_KEY", "")
+os.environ.setdefault("OPENAI_API_KEY", "")
+
+TINY_MODEL_LABELS = {
+    "binary": ["LABEL_0", "LABEL_1"],
+    "multiclass": ["Confidencialidad", "Integridad", "Autenticidad", "Resistencia"],
+}
+
+
+def _save_tiny_model(path: str, model_type: str, seed: int) -> None:
+    """Save a small random BERT classifier with its own tokenizer"""
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    labels = TINY_MODEL_LABELS[model_type]
+    os.makedirs(path, exist_ok=True)
+    vocab = (
+        ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+        + list(string.ascii_lowercase)
+        + ["##" + c for c in string.ascii_lowercase]
+    )
+    vocab_file = os.path.join(path, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab))
+
+    torch.manual_seed(seed)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        num_labels=len(labels),
+        id2label=dict(enumerate(labels)),
+        label2id={label: i for i, label in enumerate(labels)}
+    )
+    BertForSequenceClassification(config).save_pretrained(path)
+    BertTokenizerFast(vocab_file, do_lower_case=True).save_pretrained(path)
+
+
+@pytest.fixture(scope="session")
+def save_tiny_model():
+    """(path, model_type, seed) -> writes a tiny local checkpoint"""
+    return _save_tiny_model
+
+
+@pytest.fixture(scope="session")
+def tiny_models(tmp_path_factory):
+    """Paths of a tiny binary and a tiny multiclass checkpoint"""
+    root = tmp_path_factory.mktemp("models")
+    binary, multiclass = str(root / "binary"), str(root / "multiclass")
+    _save_tiny_model(binary, "binary", seed=0)
+    _save_tiny_model(multiclass, "multiclass", seed=1)
+    return binary, multiclass
+
+
+@pytest.fixture
+def make_service(tiny_models, tmp_path, monkeypatch):
+    """Build a fresh HuggingFaceService serving the tiny models"""
+    from app.core.config import settings
+    from app.services.huggingface_service import HuggingFaceService
+
+    binary, multiclass = tiny_models
+    monkeypatch.setattr(settings, "BINARY_MODEL_NAME", binary)
+    monkeypatch.setattr(settings, "MULTICLASS_MODEL_NAME", multiclass)
+    monkeypatch.setattr(settings, "BINARY_MODEL_REVISION", None)
+    monkeypatch.setattr(settings, "MULTICLASS_MODEL_REVISION", None)
+    monkeypatch.setattr(settings, "MODEL_SNAPSHOT_ENABLED", False)
+    monkeypatch.setattr(settings, "ONNX_CACHE_DIR", str(tmp_path / "onnx"))
+    # The service is a singleton; each call gets its own instance
+    monkeypatch.setattr(HuggingFaceService, "_instance", None)
+
+    def make(engine: str = "torch", precision: str = "fp32") -> HuggingFaceService:
+        monkeypatch.setattr(settings, "INFERENCE_ENGINE", engine)
+        monkeypatch.setattr(settings, "MODEL_PRECISION", precision)
+        HuggingFaceService._instance = None
+        service = HuggingFaceService()
+        service.preload()
+        return service
+
+    return make
@@ -0,0 +1,96 @@
+"""
+Admin router tests: bearer-token protection and swap request validation
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from huggingface_hub.utils import RevisionNotFoundError
+
+from app.core.config import settings
+from app.routers import admin
+
+TOKEN = "test-admin-token"
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+class FakeModelService:
+    """Records swaps instead of loading models"""
+
+    def __init__(self):
+        self.swaps = []
+
+    def get_registry_status(self):
+        return {"binary": {"model_name": settings.BINARY_MODEL_NAME}}
+
+    def swap_model(self, model_type, model_name, revision):
+        self.swaps.append((model_type, model_name, revision))
+        return {"state": "loading", "model_name": model_name, "revision": revision}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    fake = FakeModelService()
+    monkeypatch.setattr(admin, "huggingface_service", fake)
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", TOKEN)
+    monkeypatch.setattr(settings, "MODEL_SWAP_ALLOWED_MODELS", "org/allowed, org/other")
+    return fake
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/api/admin")
+    return TestClient(app)
+
+
+def swap(client, body, token=TOKEN):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    return client.post("/api/admin/models/binary/swap", json=body, headers=headers)
+
+
+@pytest.mark.parametrize("path", ["/api/admin/metrics", "/api/admin/diagnostics", "/api/admin/models"])
+def test_every_endpoint_requires_token(client, service, path):
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_admin_api_disabled_without_configured_token(client, service, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "")
+    assert swap(client, {}, token="").status_code == 403
+    assert service.swaps == []
+
+
+def test_swap_pins_revision_to_hub_commit(client, service, monkeypatch):
+    monkeypatch.setattr(admin, "hub_commit", lambda name, revision: COMMIT)
+    response = swap(client, {"model_name": "org/allowed", "revision": "main"})
+    assert response.status_code == 202
+    assert service.swaps == [("binary", "org/allowed", COMMIT)]
+
+
+def test_swap_rejects_model_not_in_allowlist(client, service, monkeypatch):
+    monkeypatch.setattr(admin, "hub_commit", lambda name, revision: COMMIT)
+    response = swap(client, {"model_name": "attacker/model"})
+    assert response.status_code == 400
+    assert service.swaps == []
+
+
+def test_swap_rejects_unknown_revision(client, service, monkeypatch):
+    def missing(name, revision):
+        raise RevisionNotFoundError("not found")
+
+    monkeypatch.setattr(admin, "hub_commit", missing)
+    response = swap(client, {"revision": "does-not-exist"})
+    assert response.status_code == 400
+    assert service.swaps == []
+
+
+def test_swap_unverifiable_revision_is_503(client, service, monkeypatch):
+    def offline(name, revision):
+        raise OSError("Hub unreachable")
+
+    monkeypatch.setattr(admin, "hub_commit", offline)
+    response = swap(client, {"revision": "main"})
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert service.swaps == []
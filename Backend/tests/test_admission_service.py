@@ -0,0 +1,95 @@
+"""
+AdmissionController tests: bounded queue, shedding and the 503 + Retry-After response
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.exceptions import OverloadedException
+from app.services.admission_service import AdmissionController, admission_service
+
+
+async def hold(release: asyncio.Event, result: str = "done") -> str:
+    await release.wait()
+    return result
+
+
+async def test_queue_full_is_rejected_with_retry_after():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=1, queue_timeout_ms=10_000)
+    release = asyncio.Event()
+
+    running = asyncio.create_task(controller.run(hold, release, "first"))
+    queued = asyncio.create_task(controller.run(hold, release, "second"))
+    await asyncio.sleep(0)
+    assert controller.get_stats()["active"] == 1
+    assert controller.get_stats()["queue_depth"] == 1
+
+    with pytest.raises(OverloadedException) as exc_info:
+        await controller.run(hold, release)
+    assert exc_info.value.details["reason"] == "queue full"
+    assert exc_info.value.retry_after >= 1
+    assert controller.rejected_queue_full == 1
+
+    # The queued request gets the slot once the running one finishes
+    release.set()
+    assert await asyncio.gather(running, queued) == ["first", "second"]
+    assert controller.get_stats()["active"] == 0
+
+
+async def test_queue_wait_timeout_is_rejected():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=4, queue_timeout_ms=50)
+    release = asyncio.Event()
+    running = asyncio.create_task(controller.run(hold, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OverloadedException) as exc_info:
+        await controller.run(hold, release)
+    assert exc_info.value.details["reason"] == "queue wait timeout"
+    assert controller.rejected_timeout == 1
+    assert controller.get_stats()["queue_depth"] == 0
+
+    release.set()
+    await running
+    assert controller.get_stats()["active"] == 0
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=1, queue_timeout_ms=10_000)
+    release = asyncio.Event()
+    running = asyncio.create_task(controller.run(hold, release))
+    queued = asyncio.create_task(controller.run(hold, release))
+    await asyncio.sleep(0)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert controller.get_stats()["queue_depth"] == 0
+
+    release.set()
+    await running
+    assert controller.get_stats()["active"] == 0
+
+
+def test_shed_request_gets_503_with_retry_after(monkeypatch):
+    from app.routers import requirements
+
+    # A saturated controller with no queue: the next request is shed right away
+    saturated = AdmissionController("single", max_concurrency=1, max_queue=0, queue_timeout_ms=1000)
+    saturated._active = 1
+    monkeypatch.setattr(settings, "ADMISSION_CONTROL_ENABLED", True)
+    monkeypatch.setitem(admission_service.controllers, "single", saturated)
+
+    app = FastAPI()
+    app.include_router(requirements.router, prefix="/api/requirements")
+    response = TestClient(app).post(
+        "/api/requirements/process/single",
+        json={"comment": "La aplicación se cierra al abrir el menú"}
+    )
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert saturated.rejected_queue_full == 1
@@ -0,0 +1,84 @@
+"""
+Autotune tests on tiny local checkpoints
+"""
+
+import threading
+import time
+
+from app.core.config import settings
+from app.services import autotune_service as autotune_module
+from app.services.autotune_service import AutotuneService, _synthetic_texts
+
+
+def test_measure_passes_limits_without_touching_settings(make_service, monkeypatch):
+    service = make_service()
+    limits = autotune_module.inference_executor.batch_limits
+
+    calls = []
+    original = service.batch_predict_arrays
+
+    def recording(model_type, texts, max_batch_size=None, token_budget=None):
+        calls.append((max_batch_size, token_budget))
+        return original(model_type, texts, max_batch_size, token_budget)
+
+    monkeypatch.setattr(service, "batch_predict_arrays", recording)
+    result = AutotuneService()._measure(service, _synthetic_texts(16), 4, 256, threads=1)
+
+    assert result["max_batch_size"] == 4 and result["token_budget"] == 256
+    assert set(calls) == {(4, 256)}
+    assert autotune_module.inference_executor.batch_limits == limits
+
+
+def test_startup_autotune_runs_once_across_workers(make_service, tmp_path, monkeypatch):
+    make_service()
+    monkeypatch.setattr(settings, "AUTOTUNE_ON_STARTUP", True)
+    monkeypatch.setattr(settings, "AUTOTUNE_PROFILE_PATH", str(tmp_path / "profile.json"))
+    executor = autotune_module.inference_executor
+    monkeypatch.setattr(executor, "batch_limits", executor.batch_limits)
+    monkeypatch.setattr(executor, "set_threads_per_lane", lambda threads: None)
+    configured = (settings.INFERENCE_MAX_BATCH_SIZE, settings.INFERENCE_TOKEN_BUDGET)
+
+    tuned = []
+
+    def fake_tune(self):
+        tuned.append(self)
+        time.sleep(0.2)  # the other worker reaches the lock meanwhile
+        return {
+            "max_batch_size": 16,
+            "token_budget": 2048,
+            "threads_per_lane": 1,
+            "throughput": 1.0,
+            "p95_latency_ms": 1.0,
+            "fingerprint": self._fingerprint(autotune_module.HuggingFaceService())
+        }
+
+    monkeypatch.setattr(AutotuneService, "tune", fake_tune)
+
+    # One AutotuneService per simulated worker process
+    workers = [AutotuneService() for _ in range(3)]
+    threads = [threading.Thread(target=worker.apply_startup_profile) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(tuned) == 1
+    assert all(worker.profile["token_budget"] == 2048 for worker in workers)
+    # The profile lives on the executor; settings stay as configured
+    assert executor.batch_limits == (16, 2048)
+    assert workers[0].get_status()["token_budget"] == 2048
+    assert (settings.INFERENCE_MAX_BATCH_SIZE, settings.INFERENCE_TOKEN_BUDGET) == configured
+
+
+def test_applied_profile_drives_bucketing(monkeypatch):
+    executor = autotune_module.inference_executor
+    monkeypatch.setattr(executor, "batch_limits", executor.batch_limits)
+    monkeypatch.setattr(executor, "set_threads_per_lane", lambda threads: None)
+
+    AutotuneService().apply(
+        {"max_batch_size": 2, "token_budget": 1000, "threads_per_lane": 1, "throughput": 1.0, "p95_latency_ms": 1.0},
+        source="test"
+    )
+
+    buckets = autotune_module.HuggingFaceService._build_buckets(list(range(5)), [10] * 5)
+    assert buckets == [[0, 1], [2, 3], [4]]
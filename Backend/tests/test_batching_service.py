@@ -0,0 +1,101 @@
+"""
+Tests for the micro-batching scheduler
+"""
+
+import asyncio
+import threading
+
+from app.services.batching_service import MicroBatcher
+
+
+def make_batcher(batch_fn, max_batch_size=8, max_wait_ms=20):
+    return MicroBatcher("test", batch_fn, max_batch_size, max_wait_ms)
+
+
+async def test_concurrent_callers_share_one_batch_and_get_their_own_results():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return [item * 10 for item in items]
+
+    batcher = make_batcher(batch_fn)
+    first, second = await asyncio.gather(batcher.submit([1, 2]), batcher.submit([3]))
+
+    assert first == [10, 20]
+    assert second == [30]
+    assert calls == [[1, 2, 3]]
+    assert batcher.get_stats()["batches_run"] == 1
+
+
+async def test_full_batch_is_flushed_without_waiting():
+    batcher = make_batcher(lambda items: items, max_batch_size=2, max_wait_ms=10_000)
+
+    result = await asyncio.wait_for(batcher.submit(["a", "b"]), timeout=2)
+
+    assert result == ["a", "b"]
+
+
+async def test_large_submission_is_split_into_max_size_batches():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(len(items))
+        return items
+
+    batcher = make_batcher(batch_fn, max_batch_size=4)
+    result = await batcher.submit(list(range(10)))
+
+    assert result == list(range(10))
+    assert sorted(calls) == [2, 4, 4]
+
+
+async def test_batch_error_is_raised_to_every_caller():
+    def batch_fn(items):
+        raise ValueError("model failed")
+
+    batcher = make_batcher(batch_fn)
+    results = await asyncio.gather(batcher.submit([1]), batcher.submit([2]), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+async def test_cancelled_caller_items_are_removed_before_the_batch_runs():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return items
+
+    batcher = make_batcher(batch_fn, max_wait_ms=50)
+    cancelled = asyncio.ensure_future(batcher.submit(["gone-1", "gone-2"]))
+    kept = asyncio.ensure_future(batcher.submit(["kept"]))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    assert await kept == ["kept"]
+    assert cancelled.cancelled()
+    assert calls == [["kept"]]
+    assert batcher.get_stats()["items_cancelled"] == 2
+    assert batcher.get_stats()["pending"] == 0
+
+
+async def test_caller_cancelled_after_dispatch_does_not_affect_the_others():
+    started = threading.Event()
+    release = threading.Event()
+
+    def batch_fn(items):
+        started.set()
+        release.wait(timeout=5)
+        return items
+
+    batcher = make_batcher(batch_fn, max_wait_ms=0)
+    cancelled = asyncio.ensure_future(batcher.submit(["gone"]))
+    kept = asyncio.ensure_future(batcher.submit(["kept"]))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+    cancelled.cancel()
+    release.set()
+
+    assert await kept == ["kept"]
+    assert cancelled.cancelled()
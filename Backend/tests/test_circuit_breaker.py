@@ -0,0 +1,141 @@
+"""
+CircuitBreaker tests: closed → open → half-open → closed, and reopening on a failed probe
+"""
+
+import types
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", types.SimpleNamespace(monotonic=fake.monotonic, time=fake.time))
+    return fake
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    options = dict(
+        name="test",
+        window=10,
+        min_calls=4,
+        failure_rate=0.5,
+        slow_call_ms=1000,
+        open_seconds=30,
+        probes=2
+    )
+    options.update(overrides)
+    return CircuitBreaker(**options)
+
+
+def call(breaker: CircuitBreaker, success: bool, latency: float = 0.01) -> bool:
+    """Make one call through the breaker; False if it was rejected"""
+    admitted = breaker.acquire()
+    if admitted is None:
+        return False
+    breaker.record(admitted, success, latency)
+    return True
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for success in (True, True, False, False):
+        call(breaker, success)
+    assert breaker.state == OPEN
+
+
+def test_opens_on_failure_rate_after_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        call(breaker, False)
+    # Below min_calls nothing opens, however bad the calls are
+    assert breaker.state == CLOSED
+
+    call(breaker, True)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 1
+
+
+def test_opens_on_slow_p95(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        call(breaker, True, latency=2.0)
+    assert breaker.state == OPEN
+
+
+def test_full_cycle_closed_open_half_open_closed(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    # Open: calls are rejected without reaching the provider
+    assert call(breaker, True) is False
+    assert breaker.reject_if_open() is True
+    assert breaker.rejected == 2
+
+    # After open_seconds the next call is a probe
+    clock.now += 30
+    first = breaker.acquire()
+    assert first == HALF_OPEN and breaker.state == HALF_OPEN
+    second = breaker.acquire()
+    assert second == HALF_OPEN
+    # Only `probes` calls may be in flight while half-open
+    assert breaker.acquire() is None
+
+    breaker.record(first, True, 0.01)
+    assert breaker.state == HALF_OPEN
+    breaker.record(second, True, 0.01)
+    assert breaker.state == CLOSED
+    assert [(t["from"], t["to"]) for t in breaker.transitions] == [
+        (CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)
+    ]
+    # The window restarts clean after closing
+    assert breaker.get_stats()["window_calls"] == 0
+
+
+@pytest.mark.parametrize("success, latency", [(False, 0.01), (True, 5.0)])
+def test_failed_or_slow_probe_reopens(clock, success, latency):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    clock.now += 30
+    probe = breaker.acquire()
+    breaker.record(probe, success, latency)
+
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+    # A fresh open period starts from the failed probe
+    assert breaker.acquire() is None
+    clock.now += 30
+    assert breaker.acquire() == HALF_OPEN
+
+
+def test_neutral_outcomes_do_not_count(clock):
+    breaker = make_breaker()
+    for _ in range(10):
+        admitted = breaker.acquire()
+        breaker.record(admitted, None, 0.01)
+    assert breaker.state == CLOSED
+    assert breaker.get_stats()["window_calls"] == 0
+
+
+def test_stale_outcomes_after_opening_are_ignored(clock):
+    breaker = make_breaker()
+    in_flight = breaker.acquire()
+    open_breaker(breaker)
+
+    # A call admitted while closed finishes after the breaker opened
+    breaker.record(in_flight, True, 0.01)
+    assert breaker.state == OPEN
@@ -0,0 +1,206 @@
+"""
+DescriptionService tests: single-flight sharing of in-flight generations,
+batched reply parsing and caching of failover descriptions
+"""
+
+import asyncio
+import json
+import types
+
+import pytest
+
+from app.services.description_service import DescriptionService
+
+
+ITEM = ("la app no cifra mis datos", "Confidencialidad")
+
+
+@pytest.fixture
+def service():
+    # Conftest leaves no API keys: template descriptions, no LLM client
+    return DescriptionService()
+
+
+async def test_join_flight_survives_one_caller_cancelled(service):
+    abandoned = []
+    future = asyncio.get_running_loop().create_future()
+    flight = service._start_flight("key", ITEM, None, future, lambda: abandoned.append(True))
+
+    first = asyncio.create_task(service._join_flight(flight))
+    second = asyncio.create_task(service._join_flight(flight))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # The shared generation goes on for the remaining caller
+    assert not future.cancelled()
+    assert abandoned == []
+    assert service._inflight["key"] is flight
+
+    future.set_result("descripción")
+    assert await second == "descripción"
+    assert "key" not in service._inflight
+
+
+async def test_flight_abandoned_when_every_caller_cancelled(service):
+    abandoned = []
+    future = asyncio.get_running_loop().create_future()
+    flight = service._start_flight("key", ITEM, None, future, lambda: abandoned.append(True))
+
+    callers = [asyncio.create_task(service._join_flight(flight)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    assert abandoned == [True]
+    # New callers start a fresh generation instead of joining the abandoned one
+    assert "key" not in service._inflight
+
+
+async def test_late_joiner_of_abandoned_flight_starts_over(service, monkeypatch):
+    generations = []
+    release = asyncio.Event()
+
+    async def fake_generate(items, keys, owner):
+        generations.append(keys)
+        await release.wait()
+        return [f"descripción {key}" for key in keys]
+
+    monkeypatch.setattr(service, "_generate_uncached", fake_generate)
+    # One shared generation task for two keys
+    first, second = service._start_batch_flights([ITEM, ITEM], ["a", "b"], None)
+    gone = asyncio.create_task(service._join_flight(first))
+    kept = asyncio.create_task(service._join_flight(second))
+    await asyncio.sleep(0)
+
+    gone.cancel()
+    await asyncio.gather(gone, return_exceptions=True)
+    assert first.abandoned
+
+    # A caller still holding the abandoned flight joins a fresh generation,
+    # and its cancellation must not count as a second abandon of "a"
+    late = asyncio.create_task(service._join_flight(first))
+    await asyncio.sleep(0)
+    assert service._inflight["a"] is not first
+    late.cancel()
+    await asyncio.gather(late, return_exceptions=True)
+
+    release.set()
+    assert await kept == "descripción b"
+    assert generations == [["a", "b"], ["a"]]
+
+
+async def test_concurrent_requests_share_one_generation(service, monkeypatch):
+    generations = []
+    release = asyncio.Event()
+
+    async def fake_generate(items, keys, owner):
+        generations.append(items)
+        await release.wait()
+        return [f"descripción de {comment}" for comment, _ in items]
+
+    monkeypatch.setattr(service, "_generate_uncached", fake_generate)
+    items = [("la app no cifra mis datos", "Confidencialidad")]
+
+    first = asyncio.create_task(service.generate_descriptions(items, owner="a"))
+    second = asyncio.create_task(service.generate_descriptions(items, owner="b"))
+
+    async def second_joined():
+        while not service.coalesced:
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(second_joined(), timeout=5)
+
+    # The request that started the generation goes away; the other still gets it
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == ["descripción de la app no cifra mis datos"]
+    assert len(generations) == 1
+    assert service.coalesced == 1
+
+
+def completion(content: str):
+    """Minimal chat completion response"""
+    message = types.SimpleNamespace(content=content)
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+@pytest.mark.parametrize("answered_by, cached", [("groq", True), ("openai", False)])
+async def test_failover_descriptions_are_not_cached_under_preferred_model(
+    service, monkeypatch, answered_by, cached
+):
+    from app.services.redis_service import redis_service
+
+    service.use_ai = True
+    service.provider, service.model, service.alternate_provider = "groq", "llama-3.1-8b-instant", "openai"
+
+    async def fake_call_llm(messages, max_tokens, owner=None):
+        return completion("El sistema debe cifrar los mensajes."), answered_by
+
+    writes = {}
+
+    async def fake_set_many(mapping, ttl=None):
+        writes.update(mapping)
+
+    monkeypatch.setattr(service, "_call_llm", fake_call_llm)
+    monkeypatch.setattr(redis_service, "set_many", fake_set_many)
+
+    description = await service.generate_description("la app no cifra mis mensajes", "Confidencialidad")
+
+    assert description == "El sistema debe cifrar los mensajes."
+    key = redis_service._generate_key("llm_desc", "la app no cifra mis mensajes", "Confidencialidad", service.model)
+    assert (key in writes) is cached
+
+
+def test_truncated_batch_reply_is_salvaged_item_by_item(service):
+    content = (
+        'Aquí tienes: [{"id": 1, "descripcion": "El sistema debe cifrar."}, '
+        '{"id": 2, "descripcion": "El sistema debe autenticar."}, {"id": 3, "descrip'
+    )
+
+    assert service._parse_batch_response(content, 3) == [
+        "El sistema debe cifrar.",
+        "El sistema debe autenticar.",
+        None,
+    ]
+
+
+def test_batch_reply_entries_are_matched_by_id(service):
+    content = json.dumps([
+        {"id": "2", "descripcion": " Segunda. "},
+        {"id": 1, "descripcion": "Primera."},
+        {"id": 1, "descripcion": "Duplicada."},
+        {"id": 9, "descripcion": "Fuera de rango."},
+        {"id": 3, "descripcion": ""},
+    ])
+
+    assert service._parse_batch_response(content, 3) == ["Primera.", "Segunda.", None]
+
+
+async def test_only_unparsed_items_are_asked_again(service, monkeypatch):
+    prompts = []
+    replies = [
+        # First prompt: items 2 and 4 missing from the (truncated) reply
+        '[{"id": 1, "descripcion": "D-a"}, {"id": 3, "descripcion": "D-c"}, {"id": 4, "descr',
+        # Retry prompt only contains the two missing items, numbered 1 and 2
+        '[{"id": 1, "descripcion": "D-b"}, {"id": 2, "descripcion": "D-d"}]',
+    ]
+
+    async def fake_call_llm(messages, max_tokens, owner=None):
+        prompts.append(messages[-1]["content"])
+        return completion(replies[len(prompts) - 1]), "groq"
+
+    monkeypatch.setattr(service, "_call_llm", fake_call_llm)
+    items = [(f"comentario {c}", "Integridad") for c in "abcd"]
+
+    descriptions = await service._generate_batch(items)
+
+    assert descriptions == [("D-a", "groq"), ("D-b", "groq"), ("D-c", "groq"), ("D-d", "groq")]
+    assert len(prompts) == 2
+    assert "comentario b" in prompts[1] and "comentario d" in prompts[1]
+    assert "comentario a" not in prompts[1] and "comentario c" not in prompts[1]
@@ -0,0 +1,29 @@
+"""
+HuggingFaceService tests on tiny local checkpoints
+"""
+
+from app.services import huggingface_service as hf_module
+
+
+def test_model_info_reports_effective_precision(make_service, monkeypatch):
+    # bf16 requested on a CPU without native bf16: the models run in fp32
+    monkeypatch.setattr(hf_module, "detect_cpu_features", lambda: {"bf16": False})
+    info = make_service(precision="bf16").get_model_info()
+
+    assert info["configured"]["precision"] == "bf16"
+    for model_type in ("binary", "multiclass"):
+        assert info["effective"][model_type]["engine"] == "torch"
+        assert info["effective"][model_type]["precision"] == "fp32"
+        assert info["effective"][model_type]["attention"] is not None
+
+
+def test_model_info_before_loading(tiny_models, monkeypatch):
+    from app.core.config import settings
+    from app.services.huggingface_service import HuggingFaceService
+
+    monkeypatch.setattr(settings, "BINARY_MODEL_NAME", tiny_models[0])
+    monkeypatch.setattr(HuggingFaceService, "_instance", None)
+    info = HuggingFaceService().get_model_info()
+
+    assert info["binary_model"] == tiny_models[0]
+    assert info["effective"]["binary"] == {"engine": None, "precision": None, "attention": None}
@@ -0,0 +1,111 @@
+"""
+TokenBucket tests (requests/min and tokens/min quotas of the LLM dispatcher)
+and 429 retries of the dispatcher
+"""
+
+import types
+
+import httpx
+import openai
+import pytest
+
+from app.services import llm_dispatcher
+from app.services.llm_dispatcher import LLMDispatcher, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(llm_dispatcher, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def test_reserve_within_budget_needs_no_wait(clock):
+    bucket = TokenBucket(per_minute=60)
+    assert bucket.reserve(30) == 0.0
+    assert bucket.reserve(30) == 0.0
+    assert bucket.level == 0.0
+
+
+def test_refill_is_continuous_and_capped(clock):
+    bucket = TokenBucket(per_minute=60)  # 1 unit per second
+    bucket.reserve(60)
+
+    clock.now += 15
+    assert bucket.reserve(15) == 0.0
+    assert bucket.level == pytest.approx(0.0)
+
+    # Never refills past the capacity
+    clock.now += 3600
+    bucket.reserve(0)
+    assert bucket.level == pytest.approx(60.0)
+
+
+def test_overdraft_waits_until_debt_is_repaid(clock):
+    bucket = TokenBucket(per_minute=60)
+    bucket.reserve(60)
+
+    # Overdrawn by 10 units at 1 unit/s: wait 10s; the next reservation queues behind it
+    assert bucket.reserve(10) == pytest.approx(10.0)
+    assert bucket.reserve(5) == pytest.approx(15.0)
+
+    clock.now += 15
+    assert bucket.reserve(0) == pytest.approx(0.0)
+
+
+def test_reservation_is_capped_at_capacity(clock):
+    bucket = TokenBucket(per_minute=60)
+    # A call larger than the whole quota takes the full bucket instead of an unpayable debt
+    assert bucket.reserve(600) == pytest.approx(0.0)
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+
+def test_adjust_charges_and_refunds(clock):
+    bucket = TokenBucket(per_minute=60)
+    bucket.reserve(40)
+    bucket.adjust(-30)  # used fewer tokens than estimated
+    assert bucket.level == pytest.approx(50.0)
+    bucket.adjust(70)   # used more
+    assert bucket.reserve(0) == pytest.approx(20.0)
+    bucket.adjust(-1000)
+    assert bucket.level == pytest.approx(60.0)
+
+
+def test_unlimited_bucket(clock):
+    bucket = TokenBucket(per_minute=0)
+    assert bucket.unlimited
+    assert bucket.reserve(10 ** 9) == 0.0
+    bucket.adjust(10 ** 9)
+    assert bucket.reserve(1) == 0.0
+
+
+def rate_limit_error():
+    request = httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": "0"}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+async def test_retries_after_429_reuse_the_reservation(clock):
+    dispatcher = LLMDispatcher("groq", 60, 1000, max_concurrency=1, max_retries=3)
+    attempts = []
+
+    async def flaky_call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise rate_limit_error()
+        return "ok"
+
+    assert await dispatcher.call(flaky_call, estimated_tokens=100) == "ok"
+
+    # Three attempts, but only one request and one token estimate taken from the quotas
+    assert len(attempts) == 3 and dispatcher.rate_limited == 2
+    assert dispatcher.requests.level == pytest.approx(59.0)
+    assert dispatcher.tokens.level == pytest.approx(900.0)
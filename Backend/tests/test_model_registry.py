@@ -0,0 +1,80 @@
+"""
+Model registry tests: one record per loaded model, swapped as a whole
+"""
+
+import threading
+import time
+
+from app.services.model_registry import SWAP_COMPLETED, SWAP_FAILED, ModelRegistry
+
+
+class FakeLoader:
+    """Loads "pipelines" that are just names; a model named "broken" fails"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+
+    def load(self, model_name, model_type, revision, use_snapshot):
+        self.release.wait(timeout=5)
+        if model_name == "broken":
+            raise RuntimeError("download failed")
+        return f"{model_name}@{revision}", {"engine": "torch", "precision": model_name}
+
+
+def make_registry(loader):
+    registry = ModelRegistry(
+        load_fn=loader.load,
+        warmup_fn=lambda pipe: None,
+        revision_fn=lambda pipe, model_name: pipe.split("@")[1]
+    )
+    registry.register("binary", "org/a", "v1")
+    return registry
+
+
+def wait_for_swap(registry):
+    deadline = time.monotonic() + 5
+    while registry.get_status()["binary"]["swap"]["state"] not in (SWAP_COMPLETED, SWAP_FAILED):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    return registry.get_status()["binary"]["swap"]
+
+
+def test_swap_replaces_pipeline_revision_and_report_together():
+    registry = make_registry(FakeLoader())
+    before = registry.get_loaded("binary")
+
+    registry.swap("binary", "org/b", "v2")
+    assert wait_for_swap(registry)["state"] == SWAP_COMPLETED
+
+    after = registry.current("binary")
+    assert (after.pipeline, after.resolved_revision) == ("org/b@v2", "v2")
+    assert after.identity == {"model_name": "org/b", "revision": "v2", "engine": "torch", "precision": "org/b"}
+    # Readers holding the old record still see a consistent old model
+    assert (before.pipeline, before.resolved_revision, before.load_report["precision"]) == ("org/a@v1", "v1", "org/a")
+
+
+def test_model_keeps_serving_while_a_swap_loads():
+    loader = FakeLoader()
+    registry = make_registry(loader)
+    registry.get("binary")
+
+    loader.release.clear()
+    registry.swap("binary", "org/b", "v2")
+    assert registry.get_loaded("binary").identity["model_name"] == "org/a"
+
+    loader.release.set()
+    wait_for_swap(registry)
+    assert registry.get_loaded("binary").identity["model_name"] == "org/b"
+
+
+def test_failed_swap_keeps_the_current_record():
+    registry = make_registry(FakeLoader())
+    before = registry.get_loaded("binary")
+
+    registry.swap("binary", "broken", "v2")
+    swap = wait_for_swap(registry)
+
+    assert swap["state"] == SWAP_FAILED
+    assert registry.current("binary") is before
+    assert registry.get_status()["binary"]["resolved_revision"] == "v1"
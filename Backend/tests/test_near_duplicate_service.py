@@ -0,0 +1,54 @@
+"""
+Near-duplicate grouping tests (MinHash/LSH)
+"""
+
+import numpy as np
+import pytest
+
+from app.services.near_duplicate_service import MinHasher, NearDuplicateIndex
+
+CRASH = "la aplicación se cierra cuando abro el chat de soporte"
+CRASH_TYPO = "la aplicacion se cierra cuando abro el chat de soporte"
+LANGUAGE = "no puedo cambiar el idioma de la interfaz"
+
+
+def make_index(threshold=0.85):
+    return NearDuplicateIndex(threshold=threshold, num_perm=96, bands=32)
+
+
+def test_signatures_ignore_case_spacing_and_trailing_punctuation():
+    signatures = MinHasher(96).signatures([CRASH, "  La aplicación se   cierra cuando abro el chat de soporte!!"])
+
+    assert signatures.shape == (2, 96)
+    assert np.array_equal(signatures[0], signatures[1])
+
+
+def test_near_identical_variant_joins_the_group():
+    assignments = make_index().assign([CRASH, LANGUAGE, CRASH_TYPO], ["Integridad"] * 3)
+
+    assert assignments == [(0, True), (1, True), (0, False)]
+
+
+def test_groups_are_split_by_subcharacteristic():
+    assignments = make_index().assign([CRASH, CRASH], ["Integridad", "Confidencialidad"])
+
+    assert assignments == [(0, True), (1, True)]
+
+
+def test_groups_persist_across_chunks():
+    index = make_index()
+    index.assign([CRASH], ["Integridad"])
+
+    assert index.assign([CRASH_TYPO, LANGUAGE], ["Integridad"] * 2) == [(0, False), (1, True)]
+
+
+def test_loose_paraphrases_need_a_lower_threshold():
+    texts = ["la app se cierra al abrir el chat", "se cierra cuando abro el chat"]
+
+    assert make_index().assign(texts, ["Integridad"] * 2)[1] == (1, True)
+    assert make_index(threshold=0.4).assign(texts, ["Integridad"] * 2)[1] == (0, False)
+
+
+def test_bands_must_divide_signature_length():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(threshold=0.85, num_perm=96, bands=7)
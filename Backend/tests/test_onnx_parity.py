@@ -0,0 +1,85 @@
+"""
+ONNX engine parity tests
+Serve the same tiny checkpoints through INFERENCE_ENGINE=torch and =onnx and
+compare the batch_predict_* outputs (the _predict_bucketed → _logits path)
+"""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("onnxruntime")
+
+from transformers import Pipeline
+from app.core.config import settings
+from app.services import onnx_engine
+from app.services.onnx_engine import ONNX_MODEL_FILE, _latest_export, load_onnx_pipeline
+
+TEXTS = [
+    "la app se cierra",
+    "no me gusta",
+    "el chat muestra mis datos sin cifrar y cualquiera puede leer los mensajes de la app",
+    "muy buena",
+    "error",
+    "la app se cierra al abrir el menu " * 8,
+]
+
+
+@pytest.mark.parametrize("model_type", ["binary", "multiclass"])
+def test_onnx_matches_torch(make_service, model_type):
+    torch_results = getattr(make_service("torch"), f"batch_predict_{model_type}")(TEXTS)
+    onnx_service = make_service("onnx")
+    onnx_results = getattr(onnx_service, f"batch_predict_{model_type}")(TEXTS)
+
+    assert not isinstance(onnx_service.registry.get(model_type), Pipeline)
+    assert [r["label"] for r in onnx_results] == [r["label"] for r in torch_results]
+    for t, o in zip(torch_results, onnx_results):
+        assert o["score"] == pytest.approx(t["score"], abs=1e-4)
+
+
+def test_export_is_keyed_by_commit(save_tiny_model, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ONNX_CACHE_DIR", str(tmp_path / "onnx"))
+    model_dir = str(tmp_path / "model")
+    save_tiny_model(model_dir, "binary", seed=0)
+
+    load_onnx_pipeline(model_dir)
+    load_onnx_pipeline(model_dir)
+    assert len(os.listdir(tmp_path / "onnx")) == 1
+
+    # A new checkpoint at the same path must not reuse the old export
+    save_tiny_model(model_dir, "binary", seed=2)
+    os.utime(os.path.join(model_dir, "model.safetensors"), ns=(0, 0))
+    load_onnx_pipeline(model_dir)
+
+    exports = os.listdir(tmp_path / "onnx")
+    assert len(exports) == 2
+    assert all(os.path.exists(tmp_path / "onnx" / name / ONNX_MODEL_FILE) for name in exports)
+
+
+def _fake_export(cache_dir, commit, requested_revision, mtime):
+    export_dir = cache_dir / f"org__model@{commit}"
+    export_dir.mkdir(parents=True)
+    (export_dir / ONNX_MODEL_FILE).write_bytes(b"")
+    (export_dir / "export_info.json").write_text(json.dumps(
+        {"revision": commit, "requested_revision": requested_revision}
+    ))
+    os.utime(export_dir / ONNX_MODEL_FILE, (mtime, mtime))
+    return str(export_dir)
+
+
+def test_offline_fallback_respects_the_pinned_revision(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ONNX_CACHE_DIR", str(tmp_path))
+    stable = _fake_export(tmp_path, "a" * 40, "v1.0", mtime=1_000)
+    newest = _fake_export(tmp_path, "b" * 40, None, mtime=2_000)
+
+    assert _latest_export("org/model", "v1.0") == stable
+    assert _latest_export("org/model", "a" * 40) == stable
+    assert _latest_export("org/model") == newest
+    assert _latest_export("org/model", "v2.0") is None
+
+    # Hub unreachable and nothing cached for the pin: refuse to serve another revision
+    monkeypatch.setattr(onnx_engine, "hub_commit", Mock(side_effect=OSError("offline")))
+    with pytest.raises(RuntimeError, match="v2.0"):
+        load_onnx_pipeline("org/model", "v2.0")
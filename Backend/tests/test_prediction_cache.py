@@ -0,0 +1,106 @@
+"""
+Prediction cache key tests
+"""
+
+import pytest
+
+from app.core.config import settings
+from app.services import prediction_cache
+from app.services.prediction_cache import prediction_cache_service
+
+
+class FakeService:
+    """Stands in for huggingface_service: only reports the served model identity"""
+
+    def __init__(self, identity):
+        self.identity = identity
+
+    def get_model_identity(self, model_type):
+        return self.identity
+
+
+class FakeRedis:
+    """In-memory get_many/set_many of redis_service"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get_many(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set_many(self, mapping, ttl=None):
+        self.store.update(mapping)
+
+
+IDENTITY = {"model_name": "org/binary", "revision": "abc123", "engine": "torch", "precision": "fp32"}
+SWAPPED = {**IDENTITY, "revision": "def456"}
+
+
+def keys_for(monkeypatch, **changes):
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService({**IDENTITY, **changes}))
+    return prediction_cache_service._cache_keys("binary", ["la app  se cierra"])[1]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(prediction_cache.redis_service, "get_many", fake.get_many)
+    monkeypatch.setattr(prediction_cache.redis_service, "set_many", fake.set_many)
+    monkeypatch.setattr(settings, "ENABLE_CACHE", True)
+    return fake
+
+
+def test_no_keys_until_model_loaded(monkeypatch):
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService(None))
+    assert prediction_cache_service._cache_keys("binary", ["texto"]) == (None, None)
+
+
+def test_whitespace_is_normalized(monkeypatch):
+    key = keys_for(monkeypatch)[0]
+    assert key == prediction_cache_service._cache_keys("binary", ["la app se cierra "])[1][0]
+
+
+def test_key_follows_served_model(monkeypatch):
+    base = keys_for(monkeypatch)
+    # Swapped model, new revision, other engine or precision: never share entries
+    assert keys_for(monkeypatch, model_name="org/other") != base
+    assert keys_for(monkeypatch, revision="def456") != base
+    assert keys_for(monkeypatch, engine="onnx") != base
+    assert keys_for(monkeypatch, precision="int8") != base
+
+
+async def test_write_back_uses_the_identity_that_predicted(monkeypatch, redis):
+    # Lookup sees the old revision, then a swap lands before the forward pass
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService(IDENTITY))
+
+    async def predict_fn(texts):
+        return [({"label": "new-model", "score": 1.0}, SWAPPED) for _ in texts]
+
+    await prediction_cache_service.predict_cached("binary", ["texto"], predict_fn)
+
+    assert list(redis.store) == [prediction_cache_service._cache_key("binary", SWAPPED, "texto")]
+
+
+async def test_cached_predictions_are_served_without_inference(monkeypatch, redis):
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService(IDENTITY))
+    calls = []
+
+    async def predict_fn(texts):
+        calls.append(list(texts))
+        return [({"label": text, "score": 1.0}, IDENTITY) for text in texts]
+
+    await prediction_cache_service.predict_cached("binary", ["a", "b"], predict_fn)
+    results = await prediction_cache_service.predict_cached("binary", ["b", "c"], predict_fn)
+
+    assert [r["label"] for r in results] == ["b", "c"]
+    assert calls == [["a", "b"], ["c"]]
+
+
+async def test_get_cached_looks_up_without_inference(monkeypatch, redis):
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService(IDENTITY))
+    redis.store[prediction_cache_service._cache_key("binary", IDENTITY, "a")] = {"label": "a"}
+
+    assert await prediction_cache_service.get_cached("binary", ["a", "b"]) == [{"label": "a"}, None]
+
+    monkeypatch.setattr(prediction_cache, "huggingface_service", FakeService(None))
+    assert await prediction_cache_service.get_cached("binary", ["a"]) == [None]
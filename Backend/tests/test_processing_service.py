@@ -0,0 +1,189 @@
+"""
+Processing service tests: batch deduplication, the stage pipeline and
+cancellation on client disconnect
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from app.core.cancellation import run_until_disconnected
+from app.core.config import settings
+from app.core.exceptions import ClientDisconnectedException
+from app.schemas.results import ResultSet
+from app.services import description_service as description_module
+from app.services import processing_service as processing_module
+from app.services.processing_service import ProcessingService
+
+COMMENTS = [
+    "La app se cierra!!",
+    "no me gusta",
+    "la app  se cierra",
+    "No me gusta.",
+    "LA APP SE CIERRA",
+]
+
+
+def test_deduplicate_keeps_first_occurrence_and_maps_every_comment():
+    unique, mapping = ProcessingService()._deduplicate(COMMENTS)
+
+    assert unique == ["La app se cierra!!", "no me gusta"]
+    assert mapping == [0, 1, 0, 1, 0]
+
+
+async def test_duplicates_fan_out_in_input_order_with_their_own_text(monkeypatch):
+    monkeypatch.setattr(settings, "ENABLE_DEDUPLICATION", True)
+    service = ProcessingService()
+    seen = []
+
+    async def fake_stream(comments, generate_descriptions=True, chunk_size=None, stats=None):
+        seen.append(list(comments))
+        results = ResultSet()
+        for idx, comment in enumerate(comments):
+            results.append(comment, idx == 0, "Integridad" if idx == 0 else None, f"desc-{idx}", 0.9, None)
+        yield results
+
+    monkeypatch.setattr(service, "process_batch_stream", fake_stream)
+    results, stats = await service.process_batch_with_stats(COMMENTS)
+
+    # Inference ran once per unique comment
+    assert seen == [["La app se cierra!!", "no me gusta"]]
+    # One row per original comment, in input order, keeping its own text
+    assert results.comment == COMMENTS
+    assert results.description == ["desc-0", "desc-1", "desc-0", "desc-1", "desc-0"]
+    assert results.is_requirement == [True, False, True, False, True]
+    assert (stats["unique_comments"], stats["duplicates"]) == (2, 3)
+
+
+class StubbedPipeline:
+    """Binary/multiclass/description stubs; descriptions hang until released"""
+
+    def __init__(self, monkeypatch, fail_on_chunk=None):
+        self.release = asyncio.Event()
+        self.description_tasks = []
+        self.binary_chunks = 0
+        self.fail_on_chunk = fail_on_chunk
+
+        async def classify_binary(comments):
+            self.binary_chunks += 1
+            if self.binary_chunks == self.fail_on_chunk:
+                raise RuntimeError("binary stage failed")
+            return [{"label": "LABEL_1", "score": 0.9} for _ in comments]
+
+        async def predict_cached(model_type, texts, predict_fn):
+            return [{"label": "Integridad", "score": 0.8} for _ in texts]
+
+        async def generate_description(comment, subcharacteristic, owner=None):
+            self.description_tasks.append(asyncio.current_task())
+            await self.release.wait()
+            return f"desc {comment}"
+
+        self.service = ProcessingService()
+        monkeypatch.setattr(self.service, "_classify_binary", classify_binary)
+        monkeypatch.setattr(processing_module.prediction_cache_service, "predict_cached", predict_cached)
+        monkeypatch.setattr(description_module.description_service, "generate_description", generate_description)
+        monkeypatch.setattr(settings, "LLM_BATCH_SIZE", 1)
+        monkeypatch.setattr(settings, "NEAR_DUPLICATE_ENABLED", False)
+
+
+def pending_tasks():
+    return [t for t in asyncio.all_tasks() if t is not asyncio.current_task() and not t.done()]
+
+
+async def test_cancelled_stream_leaves_no_stage_or_description_task(monkeypatch):
+    pipeline = StubbedPipeline(monkeypatch)
+    stream = pipeline.service.process_batch_stream([f"c{i}" for i in range(6)], chunk_size=2)
+
+    consumer = asyncio.create_task(stream.__anext__())
+    while len(pipeline.description_tasks) < 2:
+        await asyncio.sleep(0.001)
+
+    consumer.cancel()
+    await asyncio.gather(consumer, return_exceptions=True)
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert pipeline.description_tasks and all(t.cancelled() for t in pipeline.description_tasks)
+    assert pending_tasks() == []
+
+
+async def test_consumer_stopping_early_cancels_the_rest(monkeypatch):
+    pipeline = StubbedPipeline(monkeypatch)
+    pipeline.release.set()
+    stream = pipeline.service.process_batch_stream([f"c{i}" for i in range(8)], chunk_size=2)
+
+    first = await stream.__anext__()
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert first.description == ["desc c0", "desc c1"]
+    assert pending_tasks() == []
+
+
+async def test_stage_failure_reaches_the_consumer(monkeypatch):
+    pipeline = StubbedPipeline(monkeypatch, fail_on_chunk=2)
+    pipeline.release.set()
+    chunks = []
+
+    with pytest.raises(RuntimeError, match="binary stage failed"):
+        async for chunk in pipeline.service.process_batch_stream([f"c{i}" for i in range(6)], chunk_size=2):
+            chunks.append(chunk)
+
+    assert len(chunks) <= 1
+    assert pending_tasks() == []
+
+
+class DisconnectingRequest:
+    """Stands in for a starlette Request whose client leaves after a few polls"""
+
+    def __init__(self, connected_polls=1):
+        self.url = types.SimpleNamespace(path="/api/requirements/analyze/csv")
+        self.polls = 0
+        self.connected_polls = connected_polls
+
+    async def is_disconnected(self):
+        self.polls += 1
+        return self.polls > self.connected_polls
+
+
+async def test_disconnect_cancels_the_whole_pipeline(monkeypatch):
+    monkeypatch.setattr(settings, "DISCONNECT_POLL_INTERVAL_MS", 5)
+    monkeypatch.setattr(settings, "ENABLE_DEDUPLICATION", True)
+    pipeline = StubbedPipeline(monkeypatch)
+
+    with pytest.raises(ClientDisconnectedException):
+        await run_until_disconnected(
+            DisconnectingRequest(connected_polls=3),
+            pipeline.service.process_batch([f"c{i}" for i in range(6)])
+        )
+    await asyncio.sleep(0)
+
+    assert pipeline.description_tasks and all(t.cancelled() for t in pipeline.description_tasks)
+    assert pending_tasks() == []
+
+
+async def test_disconnected_request_gets_499(monkeypatch):
+    from app.routers import requirements
+    from app.schemas.models import SingleCommentRequest
+
+    monkeypatch.setattr(settings, "DISCONNECT_POLL_INTERVAL_MS", 5)
+    monkeypatch.setattr(settings, "ADMISSION_CONTROL_ENABLED", False)
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def hanging_work(comment):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    monkeypatch.setattr(requirements.orchestrator_service, "process_single_comment", hanging_work)
+
+    response = await requirements.analyze_single_comment(
+        SingleCommentRequest(comment="La aplicación se cierra al abrir el menú"),
+        DisconnectingRequest()
+    )
+
+    assert response.status_code == requirements.CLIENT_CLOSED_REQUEST == 499
+    assert started.is_set() and cancelled.is_set()
@@ -0,0 +1,57 @@
+"""
+Tokenization service tests
+"""
+
+import gc
+import threading
+
+from transformers import AutoTokenizer
+
+from app.services.tokenization_service import TokenizationService
+
+
+def test_matching_tokenizers_share_encodings(tiny_models):
+    service = TokenizationService(max_entries=16)
+    binary, multiclass = (AutoTokenizer.from_pretrained(path) for path in tiny_models)
+
+    assert service.tokenizers_match(binary, multiclass)
+    service.encode(binary, ["la app se cierra"])
+    service.encode(multiclass, ["la app se cierra"])
+    assert (service.hits, service.misses) == (1, 1)
+
+
+def test_swapped_out_tokenizer_is_not_kept_alive(tiny_models):
+    service = TokenizationService(max_entries=16)
+    tokenizer = AutoTokenizer.from_pretrained(tiny_models[0])
+    service.encode(tokenizer, ["texto"])
+    assert len(service._fingerprints) == 1
+
+    del tokenizer
+    gc.collect()
+    assert len(service._fingerprints) == 0
+
+
+def test_fingerprint_is_computed_once_under_concurrency(tiny_models):
+    service = TokenizationService(max_entries=16)
+    tokenizer = AutoTokenizer.from_pretrained(tiny_models[0])
+    vocab_reads = []
+    get_vocab = tokenizer.get_vocab
+
+    def counting_get_vocab():
+        vocab_reads.append(1)
+        return get_vocab()
+
+    tokenizer.get_vocab = counting_get_vocab
+    start = threading.Barrier(8)
+
+    def fingerprint():
+        start.wait()
+        return service.fingerprint(tokenizer)
+
+    threads = [threading.Thread(target=fingerprint) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(vocab_reads) == 1